@@ -0,0 +1,251 @@
+# Implementation of a Union-Find ADT with per-component aggregates
+import heapq
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from c04_UF.UnionFind import UnionFind
+
+# An aggregate is an associative combine function plus one initial value
+# per element, e.g. (operator.add, amounts) for a per-component sum
+Aggregate = Tuple[Callable[[Any, Any], Any], Sequence[Any]]
+
+class AggregateUnionFind(UnionFind):
+    """
+    AggregateUnionFind is a weighted quick-union (union by size with path
+    halving) that also maintains, on every root, the size, the minimum and
+    maximum member and any number of user-defined associative aggregates.
+    A union combines the two roots' values once, so aggregates cost O(1)
+    per union and are read in O(find) time.
+
+    Roots of merged components are also pushed into a lazily cleaned
+    max-heap by size, and the elements still on their own are kept in a
+    linked list, so `largest_components(k)` does not scan all elements.
+    """
+
+    def __init__(self, n: int,
+                 aggregates: Optional[Dict[str, Aggregate]] = None):
+        """
+        Initializes the AggregateUnionFind data structure with n elements.
+        Each element is initially in its own component.
+
+        Args:
+            n (int): The number of elements.
+            aggregates (Dict[str, Aggregate], optional): Named aggregates,
+                each an associative function combine(a, b) and a sequence
+                with the initial value of every element.
+
+        Raises:
+            ValueError: if an aggregate does not have n initial values.
+        """
+        super().__init__()
+        self._parent = list(range(n))  # Stores the parent of each element
+        self._size = [1] * n  # Stores the size of the component for each root
+        self._min = list(range(n))  # Smallest member, for each root
+        self._max = list(range(n))  # Largest member, for each root
+        self._count = n  # Number of components
+        self._aggregates: Dict[str, Tuple[Callable[[Any, Any], Any],
+                                          List[Any]]] = {}
+        for name, (combine, values) in (aggregates or {}).items():
+            if len(values) != n:
+                raise ValueError(
+                    f"Aggregate {name!r} has {len(values)} values, "
+                    f"expected {n}.")
+            self._aggregates[name] = (combine, list(values))
+        # Lazy max-heap of (-size, root); entries go stale after a merge
+        self._heap: List[Tuple[int, int]] = []
+        # Doubly linked list of the singletons in increasing order, with n
+        # as sentinel, so that a union unlinks one in O(1)
+        self._next_single = list(range(1, n + 1)) + [0]
+        self._prev_single = [n] + list(range(n))
+        self._singletons = n  # Number of singletons
+
+    def find(self, p: int) -> int:
+        """
+        Finds the root of the component containing element p, halving the
+        path on the way.
+
+        Args:
+            p (int): The element to find.
+
+        Returns:
+            int: The root of the component containing element p.
+
+        Raises:
+            ValueError: if p is out of bounds.
+        """
+        parent = self._parent
+        if not (0 <= p < len(parent)):
+            raise ValueError(f"Element {p} is out of bounds.")
+        while p != parent[p]:
+            parent[p] = parent[parent[p]]
+            p = parent[p]
+        return p
+
+    def union(self, p: int, q: int):
+        """
+        Connects elements p and q by merging their components, linking the
+        smaller tree under the larger and combining the aggregates of both
+        roots into the new root.
+
+        Args:
+            p (int): The first element.
+            q (int): The second element.
+
+        Raises:
+            ValueError: if p or q are out of bounds.
+        """
+        if not (0 <= p < len(self._parent) and 0 <= q < len(self._parent)):
+            raise ValueError(f"Elements {p} or {q} are out of bounds.")
+
+        rootP = self.find(p)
+        rootQ = self.find(q)
+
+        if rootP == rootQ:
+            return  # p and q are already in the same component
+
+        size = self._size
+        if size[rootP] > size[rootQ]:
+            rootP, rootQ = rootQ, rootP
+        if size[rootP] == 1:
+            self._unlink_singleton(rootP)
+        if size[rootQ] == 1:
+            self._unlink_singleton(rootQ)
+        # rootP is now the smaller tree and is linked under rootQ
+        self._parent[rootP] = rootQ
+        size[rootQ] += size[rootP]
+        self._min[rootQ] = min(self._min[rootQ], self._min[rootP])
+        self._max[rootQ] = max(self._max[rootQ], self._max[rootP])
+        for combine, values in self._aggregates.values():
+            values[rootQ] = combine(values[rootQ], values[rootP])
+        heapq.heappush(self._heap, (-size[rootQ], rootQ))
+
+        self._count -= 1  # Decrement the number of components
+
+    def _unlink_singleton(self, p: int):
+        """Remove p from the list of singletons, as it is being merged."""
+        next_single = self._next_single
+        prev_single = self._prev_single
+        next_single[prev_single[p]] = next_single[p]
+        prev_single[next_single[p]] = prev_single[p]
+        self._singletons -= 1
+
+    def components(self) -> int:
+        """
+        Returns the number of disjoint sets (components).
+
+        Returns:
+            int: The number of components.
+        """
+        return self._count
+
+    def max_depth(self) -> int:
+        """
+        Returns the height of the tallest tree of the forest.
+
+        Returns:
+            int: The largest number of links from an element to its root.
+        """
+        return self._forest_height(self._parent)
+
+    def members_count(self) -> int:
+        """
+        Returns the number of elements that belong to a component of two
+        or more elements, i.e. that have been connected to another one.
+
+        Returns:
+            int: The number of elements outside singleton components.
+        """
+        return len(self._parent) - self._singletons
+
+    def size(self, p: int) -> int:
+        """
+        Returns the number of elements in the component of p.
+
+        Args:
+            p (int): The element.
+
+        Returns:
+            int: The size of p's component.
+
+        Raises:
+            ValueError: if p is out of bounds.
+        """
+        return self._size[self.find(p)]
+
+    def min_member(self, p: int) -> int:
+        """
+        Returns the smallest element in the component of p.
+
+        Raises:
+            ValueError: if p is out of bounds.
+        """
+        return self._min[self.find(p)]
+
+    def max_member(self, p: int) -> int:
+        """
+        Returns the largest element in the component of p.
+
+        Raises:
+            ValueError: if p is out of bounds.
+        """
+        return self._max[self.find(p)]
+
+    def aggregate(self, name: str, p: int) -> Any:
+        """
+        Returns the value of a named aggregate for the component of p.
+
+        Args:
+            name (str): The aggregate name given at construction.
+            p (int): The element.
+
+        Returns:
+            Any: The combined value over all members of p's component.
+
+        Raises:
+            KeyError: if there is no aggregate called name.
+            ValueError: if p is out of bounds.
+        """
+        return self._aggregates[name][1][self.find(p)]
+
+    def largest_components(self, k: int) -> List[Tuple[int, int]]:
+        """
+        Returns up to k components with the most elements.
+
+        Stale heap entries are discarded as they surface, so the amortized
+        cost is O((k + unions) log unions) over any sequence of queries.
+        When fewer than k components have more than one element, the
+        smallest singletons are taken from their linked list in O(k).
+
+        Args:
+            k (int): The number of components to return.
+
+        Returns:
+            List[Tuple[int, int]]: (root, size) pairs by decreasing size.
+        """
+        heap = self._heap
+        parent = self._parent
+        size = self._size
+        result: List[Tuple[int, int]] = []
+        while heap and len(result) < k:
+            neg_size, root = heapq.heappop(heap)
+            if parent[root] == root and size[root] == -neg_size:
+                result.append((root, -neg_size))
+        for root, root_size in result:
+            heapq.heappush(heap, (-root_size, root))
+        sentinel = len(parent)
+        p = self._next_single[sentinel]
+        while len(result) < k and p != sentinel:
+            result.append((p, 1))
+            p = self._next_single[p]
+        return result
+
+
+if __name__=="__main__":
+    amounts = [10, 20, 30, 40, 50]
+    auf = AggregateUnionFind(5, {"total": (lambda a, b: a + b, amounts)})
+    auf.union(1,2)
+    auf.union(0,4)
+    auf.union(4,2)
+    print(auf.components())
+    print(auf.size(1), auf.min_member(1), auf.max_member(1))
+    print(auf.aggregate("total", 0))
+    print(auf.largest_components(2))
@@ -0,0 +1,302 @@
+# Implementation of a compact, array-backed Union-Find ADT
+# python3 -m c04_UF.ArrayUnionFind
+
+import random
+import time
+import tracemalloc
+from array import array
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from c04_UF.QuickUnion import QuickUnion
+from c04_UF.UnionFind import Batch, UnionFind
+from c04_UF.WeightedQuickUnion import WeightedQuickUnion
+
+# Largest element count representable by each supported parent typecode
+_MAX_ELEMENTS = {"i": 2 ** 31 - 1, "q": 2 ** 63 - 1}
+
+
+class ArrayUnionFind(UnionFind):
+    """
+    ArrayUnionFind is a memory-compact implementation of the Union-Find
+    data structure. Parents are stored in a typed `array` ('i' for 32-bit
+    or 'q' for 64-bit slots) and ranks in a byte array, so each element
+    costs 5 or 9 bytes instead of a list slot plus a boxed int.
+
+    It uses union by rank and path halving, which together give an
+    amortized O(α(n)) cost per operation with a single pass over the path.
+    """
+
+    def __init__(self, n: int, typecode: str = "i"):
+        """
+        Initializes the ArrayUnionFind data structure with n elements.
+        Each element is initially in its own component with rank 0.
+
+        Args:
+            n (int): The number of elements.
+            typecode (str): 'i' for 32-bit parent slots or 'q' for 64-bit
+                slots (needed above 2**31 - 1 elements).
+
+        Raises:
+            ValueError: if the typecode is not supported or too narrow
+                for n.
+        """
+        super().__init__()
+        if typecode not in _MAX_ELEMENTS:
+            raise ValueError(f"Unsupported typecode {typecode!r}.")
+        if n > _MAX_ELEMENTS[typecode]:
+            raise ValueError(
+                f"{n} elements do not fit in typecode {typecode!r}.")
+        self._parent = array(typecode, range(n))  # Parent of each element
+        # Rank is bounded by log2(n) < 64, so a byte per element suffices
+        self._rank = array("B", bytes(n))
+        self._count = n  # Number of components
+
+    def find(self, p: int) -> int:
+        """
+        Finds the root of the component containing element p.
+        Path halving makes every other node on the path point to its
+        grandparent while walking up to the root.
+
+        Args:
+            p (int): The element to find.
+
+        Returns:
+            int: The root of the component containing element p.
+
+        Raises:
+            ValueError: if p is out of bounds.
+        """
+        parent = self._parent
+        if not (0 <= p < len(parent)):
+            raise ValueError(f"Element {p} is out of bounds.")
+        while p != parent[p]:
+            parent[p] = parent[parent[p]]
+            p = parent[p]
+        return p
+
+    def union(self, p: int, q: int):
+        """
+        Connects elements p and q by merging their components.
+        The root with the smaller rank is linked under the root with the
+        larger rank; on ties the rank of the new root grows by one.
+
+        Args:
+            p (int): The first element.
+            q (int): The second element.
+
+        Raises:
+            ValueError: if p or q are out of bounds.
+        """
+        n = len(self._parent)
+        if not (0 <= p < n and 0 <= q < n):
+            raise ValueError(f"Elements {p} or {q} are out of bounds.")
+
+        rootP = self.find(p)
+        rootQ = self.find(q)
+
+        if rootP == rootQ:
+            return  # p and q are already in the same component
+
+        rank = self._rank
+        if rank[rootP] < rank[rootQ]:
+            self._parent[rootP] = rootQ
+        elif rank[rootP] > rank[rootQ]:
+            self._parent[rootQ] = rootP
+        else:
+            self._parent[rootQ] = rootP
+            rank[rootP] += 1
+        self._count -= 1  # Decrement the number of components
+
+    def components(self) -> int:
+        """
+        Returns the number of disjoint sets (components).
+
+        Returns:
+            int: The number of components.
+        """
+        return self._count
+
+    def max_depth(self) -> int:
+        """
+        Returns the height of the tallest tree of the forest.
+
+        Returns:
+            int: The largest number of links from an element to its root.
+        """
+        return self._forest_height(self._parent)
+
+    def is_connected(self, p: int, q: int) -> bool:
+        """
+        Checks if elements p and q are in the same component.
+
+        Args:
+            p (int): The first element.
+            q (int): The second element.
+
+        Returns:
+            bool: True if p and q are in the same component, False otherwise.
+
+        Raises:
+            ValueError: if p or q are out of bounds.
+        """
+        n = len(self._parent)
+        if not (0 <= p < n and 0 <= q < n):
+            raise ValueError(f"Elements {p} or {q} are out of bounds.")
+        return self.find(p) == self.find(q)
+
+    def labels(self) -> array:
+        """
+        Returns the root of every element, compressing all paths fully.
+
+        Returns:
+            array: A new array whose i-th entry is the root of element i.
+        """
+        parent = self._parent
+        for i in range(len(parent)):
+            root = i
+            while root != parent[root]:
+                root = parent[root]
+            while parent[i] != root:
+                parent[i], i = root, parent[i]
+        return array(parent.typecode, parent)
+
+    def links(self) -> Tuple[array, array]:
+        """
+        Returns the links of the forest: every element that is not a root,
+        paired with the root of its component. Replaying them as unions
+        on another union-find reproduces the connectivity of this one,
+        with at most n - components() unions instead of one per edge.
+
+        Returns:
+            Tuple[array, array]: The non-root elements and their roots.
+        """
+        roots = self.labels()
+        typecode = roots.typecode
+        children = array(typecode,
+                         (i for i, r in enumerate(roots) if i != r))
+        return children, array(typecode, (roots[i] for i in children))
+
+    def nbytes(self) -> int:
+        """
+        Returns the number of bytes held by the parent and rank buffers.
+
+        Returns:
+            int: Size of the underlying arrays in bytes.
+        """
+        return (self._parent.itemsize * len(self._parent)
+                + self._rank.itemsize * len(self._rank))
+
+    def union_many(self, ps: Batch, qs: Optional[Sequence[int]] = None):
+        """
+        Joins the components of every pair in a batch. Bounds are checked
+        once for the whole batch instead of once per pair.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+
+        Raises:
+            ValueError: if any element of the batch is out of bounds.
+        """
+        parent = self._parent
+        rank = self._rank
+        ps, qs = self._batch(ps, qs, len(parent))
+        count = self._count
+        for p, q in zip(ps, qs):
+            while p != parent[p]:
+                parent[p] = parent[parent[p]]
+                p = parent[p]
+            while q != parent[q]:
+                parent[q] = parent[parent[q]]
+                q = parent[q]
+            if p == q:
+                continue
+            if rank[p] < rank[q]:
+                parent[p] = q
+            elif rank[p] > rank[q]:
+                parent[q] = p
+            else:
+                parent[q] = p
+                rank[p] += 1
+            count -= 1
+        self._count = count
+
+    def connected_many(self, ps: Batch,
+                       qs: Optional[Sequence[int]] = None) -> List[bool]:
+        """
+        Checks connectivity for every pair in a batch.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+
+        Returns:
+            List[bool]: One answer per pair, in batch order.
+
+        Raises:
+            ValueError: if any element of the batch is out of bounds.
+        """
+        parent = self._parent
+        ps, qs = self._batch(ps, qs, len(parent))
+        result = []
+        for p, q in zip(ps, qs):
+            while p != parent[p]:
+                parent[p] = parent[parent[p]]
+                p = parent[p]
+            while q != parent[q]:
+                parent[q] = parent[parent[q]]
+                q = parent[q]
+            result.append(p == q)
+        return result
+
+
+def _bytes_per_element(factory: Callable[[int], UnionFind], n: int) -> float:
+    """Measure the traced allocation of building factory(n), per element."""
+    tracemalloc.start()
+    uf = factory(n)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del uf
+    return size / n
+
+
+def _throughput(factory: Callable[[int], UnionFind],
+                pairs: List[Tuple[int, int]]) -> float:
+    """Return union plus is_connected operations per second over pairs."""
+    uf = factory(len(pairs))
+    start = time.perf_counter()
+    for p, q in pairs:
+        uf.union(p, q)
+    for p, q in pairs:
+        uf.is_connected(p, q)
+    elapsed = time.perf_counter() - start
+    return 2 * len(pairs) / elapsed
+
+
+def benchmark(n: int = 20000, seed: int = 42):
+    """Print memory per element and throughput of the quick-union family."""
+    rng = random.Random(seed)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(n)]
+    factories = [
+        ("ArrayUnionFind[i]", lambda m: ArrayUnionFind(m, "i")),
+        ("ArrayUnionFind[q]", lambda m: ArrayUnionFind(m, "q")),
+        ("WeightedQuickUnion", WeightedQuickUnion),
+        ("QuickUnion", QuickUnion),
+    ]
+    print(f"n = {n}, {n} random unions followed by {n} queries")
+    for name, factory in factories:
+        bpe = _bytes_per_element(factory, n)
+        ops = _throughput(factory, pairs)
+        print(f"{name:20s}: {bpe:6.1f} bytes/element, {ops:12,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    auf = ArrayUnionFind(5)
+    auf.union(1, 2)
+    auf.union(0, 4)
+    print(auf.components())
+    print(auf.is_connected(1, 4))
+    print(auf.is_connected(2, 1))
+    benchmark()
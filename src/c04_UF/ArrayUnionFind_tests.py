@@ -0,0 +1,65 @@
+# To run:
+# PYTHONPATH=src python3 -m c04_UF.ArrayUnionFind_tests
+
+import random
+import unittest
+from c04_UF.ArrayUnionFind import ArrayUnionFind
+from c04_UF.WeightedQuickUnion import WeightedQuickUnion
+
+
+class TestArrayUnionFind(unittest.TestCase):
+    def setUp(self):
+        self.uf = ArrayUnionFind(10)
+
+    def test_initial_state(self):
+        self.assertEqual(self.uf.components(), 10)
+        for p in range(10):
+            self.assertEqual(self.uf.find(p), p)
+
+    def test_union_and_connected(self):
+        self.uf.union(0, 1)
+        self.uf.union(1, 2)
+        self.uf.union(3, 4)
+        self.assertEqual(self.uf.components(), 7)
+        self.assertTrue(self.uf.is_connected(0, 2))
+        self.assertFalse(self.uf.is_connected(0, 3))
+        self.uf.union(2, 4)
+        self.assertTrue(self.uf.is_connected(0, 3))
+        self.assertEqual(self.uf.components(), 6)
+
+    def test_redundant_union(self):
+        self.uf.union(5, 6)
+        self.uf.union(6, 5)
+        self.assertEqual(self.uf.components(), 9)
+
+    def test_out_of_bounds(self):
+        with self.assertRaises(ValueError):
+            self.uf.find(10)
+        with self.assertRaises(ValueError):
+            self.uf.union(-1, 3)
+        with self.assertRaises(ValueError):
+            self.uf.is_connected(0, 11)
+
+    def test_typecodes(self):
+        self.assertEqual(ArrayUnionFind(4, "q").nbytes(), 4 * 8 + 4)
+        self.assertEqual(ArrayUnionFind(4, "i").nbytes(), 4 * 4 + 4)
+        with self.assertRaises(ValueError):
+            ArrayUnionFind(4, "d")
+
+    def test_matches_weighted_quick_union(self):
+        rng = random.Random(7)
+        n = 200
+        auf = ArrayUnionFind(n)
+        wqu = WeightedQuickUnion(n)
+        for _ in range(150):
+            p, q = rng.randrange(n), rng.randrange(n)
+            auf.union(p, q)
+            wqu.union(p, q)
+            self.assertEqual(auf.components(), wqu.components())
+        for _ in range(500):
+            p, q = rng.randrange(n), rng.randrange(n)
+            self.assertEqual(auf.is_connected(p, q), wqu.is_connected(p, q))
+
+
+if __name__ == "__main__":
+    unittest.main()
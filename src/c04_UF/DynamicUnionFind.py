@@ -0,0 +1,256 @@
+# Implementation of a growable Union-Find ADT keyed by hashable ids
+# python3 -m c04_UF.DynamicUnionFind
+
+import random
+import time
+import tracemalloc
+import uuid
+from array import array
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+from c04_UF.UnionFind import UnionFind
+from c04_UF.WeightedQuickUnion import WeightedQuickUnion
+
+
+class DynamicUnionFind(UnionFind):
+    """
+    DynamicUnionFind is a Union-Find data structure over arbitrary hashable
+    keys (strings, UUIDs, tuples, ...). It does not need the number of
+    elements up front: each new key is assigned the next dense internal
+    slot, and the parent and rank arrays grow by amortized O(1) appends.
+
+    Internally it uses union by rank and path halving on `array` buffers,
+    so `find` and `union` run in amortized O(α(n)) time.
+    """
+
+    def __init__(self, keys: Optional[Iterable[Hashable]] = None):
+        """
+        Initializes an empty DynamicUnionFind, optionally adding some keys,
+        each in its own component.
+
+        Args:
+            keys (Iterable[Hashable], optional): Initial keys to add.
+        """
+        super().__init__()
+        self._slot: Dict[Hashable, int] = {}  # Internal slot of each key
+        self._keys: List[Hashable] = []  # Key stored at each slot
+        self._parent = array("q")  # Parent slot of each slot
+        self._rank = array("B")  # Rank of each root slot
+        self._count = 0  # Number of components
+        if keys is not None:
+            for key in keys:
+                self.add(key)
+
+    def add(self, key: Hashable) -> bool:
+        """
+        Adds key as a new singleton component if it is not present yet.
+
+        Args:
+            key (Hashable): The key to add.
+
+        Returns:
+            bool: True if the key was added, False if it already existed.
+        """
+        if key in self._slot:
+            return False
+        self._new_slot(key)
+        return True
+
+    def find(self, p: Hashable) -> Hashable:
+        """
+        Finds the representative key of the component containing p.
+
+        Args:
+            p (Hashable): The key to find.
+
+        Returns:
+            Hashable: The key at the root of p's component.
+
+        Raises:
+            KeyError: if p has not been added.
+        """
+        return self._keys[self._root(self._slot[p])]
+
+    def union(self, p: Hashable, q: Hashable):
+        """
+        Connects keys p and q by merging their components. Keys seen for
+        the first time are added before being merged.
+
+        Args:
+            p (Hashable): The first key.
+            q (Hashable): The second key.
+        """
+        slot = self._slot
+        i = slot.get(p)
+        if i is None:
+            i = self._new_slot(p)
+        j = slot.get(q)
+        if j is None:
+            j = self._new_slot(q)
+        self._link(self._root(i), self._root(j))
+
+    def union_many(self, ps: Iterable[Tuple[Hashable, Hashable]],
+                   qs: Optional[Iterable[Hashable]] = None):
+        """
+        Joins the components of every pair of keys in a batch, adding the
+        keys seen for the first time.
+
+        Args:
+            ps: An iterable of (p, q) key pairs, or the first keys of each
+                pair when qs is given.
+            qs: Optional iterable with the second keys of each pair.
+        """
+        pairs = ps if qs is None else zip(ps, qs)
+        slot = self._slot
+        parent = self._parent
+        link = self._link
+        for p, q in pairs:
+            i = slot.get(p)
+            if i is None:
+                i = self._new_slot(p)
+            j = slot.get(q)
+            if j is None:
+                j = self._new_slot(q)
+            while i != parent[i]:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            while j != parent[j]:
+                parent[j] = parent[parent[j]]
+                j = parent[j]
+            link(i, j)
+
+    def components(self) -> int:
+        """
+        Returns the number of disjoint sets (components).
+
+        Returns:
+            int: The number of components.
+        """
+        return self._count
+
+    def max_depth(self) -> int:
+        """
+        Returns the height of the tallest tree of the forest.
+
+        Returns:
+            int: The largest number of links from an element to its root.
+        """
+        return self._forest_height(self._parent)
+
+    def is_connected(self, p: Hashable, q: Hashable) -> bool:
+        """
+        Checks if keys p and q are in the same component.
+
+        Args:
+            p (Hashable): The first key.
+            q (Hashable): The second key.
+
+        Returns:
+            bool: True if p and q are in the same component, False otherwise.
+
+        Raises:
+            KeyError: if p or q have not been added.
+        """
+        return self._root(self._slot[p]) == self._root(self._slot[q])
+
+    def __len__(self) -> int:
+        """Return the number of keys in the data structure."""
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a key has been added."""
+        return key in self._slot
+
+    def nbytes(self) -> int:
+        """
+        Returns the number of bytes held by the parent and rank buffers
+        (excluding the key index).
+
+        Returns:
+            int: Size of the underlying arrays in bytes.
+        """
+        return (self._parent.itemsize * len(self._parent)
+                + self._rank.itemsize * len(self._rank))
+
+    def _new_slot(self, key: Hashable) -> int:
+        """Assign the next free slot to key as a singleton component."""
+        i = len(self._keys)
+        self._slot[key] = i
+        self._keys.append(key)
+        self._parent.append(i)
+        self._rank.append(0)
+        self._count += 1
+        return i
+
+    def _root(self, i: int) -> int:
+        """Return the root slot of slot i, halving the path on the way."""
+        parent = self._parent
+        while i != parent[i]:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _link(self, i: int, j: int):
+        """Link root slots i and j by rank, unless they are the same."""
+        if i == j:
+            return
+        rank = self._rank
+        if rank[i] < rank[j]:
+            self._parent[i] = j
+        elif rank[i] > rank[j]:
+            self._parent[j] = i
+        else:
+            self._parent[j] = i
+            rank[i] += 1
+        self._count -= 1
+
+
+def benchmark(n: int = 100000, seed: int = 42):
+    """
+    Compare DynamicUnionFind over UUID strings against the current
+    pipeline: a separate dict mapping ids to 0..n-1 plus a fixed-size
+    WeightedQuickUnion. Prints traced peak memory and elapsed time.
+    """
+    rng = random.Random(seed)
+    ids = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(n)]
+    pairs = [(rng.choice(ids), rng.choice(ids)) for _ in range(n)]
+
+    def dynamic():
+        uf = DynamicUnionFind()
+        uf.union_many(pairs)
+        return uf
+
+    def premapped():
+        index = {}
+        for p, q in pairs:
+            index.setdefault(p, len(index))
+            index.setdefault(q, len(index))
+        uf = WeightedQuickUnion(len(index))
+        for p, q in pairs:
+            uf.union(index[p], index[q])
+        return index, uf
+
+    print(f"{n} unions over {n} UUID strings")
+    for name, build in [("DynamicUnionFind", dynamic),
+                        ("dict + WeightedQuickUnion", premapped)]:
+        start = time.perf_counter()
+        build()
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        result = build()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+        print(f"{name:26s}: {elapsed:.3f} s, peak {peak / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    duf = DynamicUnionFind()
+    duf.union("alice", "bob")
+    duf.union("david", "eve")
+    duf.add("frank")
+    print(duf.components())
+    print(duf.is_connected("alice", "eve"))
+    duf.union("bob", "david")
+    print(duf.is_connected("alice", "eve"))
+    benchmark()
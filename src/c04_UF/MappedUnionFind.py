@@ -0,0 +1,210 @@
+# Implementation of a Union-Find ADT stored in a memory-mapped file
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+
+from c04_UF.UnionFind import UnionFind
+
+# File layout, in native byte order: header, then n int64 parents, then
+# n uint8 ranks
+_MAGIC = b"UFMM"
+_VERSION = 1
+_HEADER = struct.Struct("=4sIqq")  # magic, version, n, count
+_COUNT_OFFSET = 16  # Byte offset of the count field in the header
+_CHUNK = 1 << 16  # Elements written per chunk when creating a file
+
+
+class MappedUnionFind(UnionFind):
+    """
+    MappedUnionFind is a Union-Find data structure (union by rank with path
+    halving) whose parent and rank arrays live in a memory-mapped file.
+
+    Opening a prebuilt file is O(1): nothing is read until `find` touches
+    it, and pages are then served from the operating system's page cache.
+    Unions, path halving and the component count are written straight
+    into the mapping; `flush()` makes them durable on disk.
+
+    The file starts with a fixed header (magic, format version, n, count)
+    followed by n int64 parents and n byte-sized ranks, all in the native
+    byte order of the machine that created it.
+    """
+
+    def __init__(self, path: str):
+        """
+        Opens an existing union-find file created with `create`.
+
+        Args:
+            path (str): Path of the file.
+
+        Raises:
+            ValueError: if the file is not a union-find file of a supported
+                version, or its size does not match its header.
+        """
+        super().__init__()
+        with open(path, "r+b") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0)
+        try:
+            magic, version, n, _ = _HEADER.unpack_from(self._mmap, 0)
+        except struct.error as e:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a union-find file.") from e
+        if magic != _MAGIC or version != _VERSION \
+                or len(self._mmap) != _HEADER.size + 9 * n:
+            self._mmap.close()
+            raise ValueError(
+                f"{path} is not a version {_VERSION} union-find file.")
+        view = memoryview(self._mmap)
+        self._header = view[_COUNT_OFFSET:_HEADER.size].cast("q")
+        self._parent = view[_HEADER.size:_HEADER.size + 8 * n].cast("q")
+        self._rank = view[_HEADER.size + 8 * n:]
+        view.release()
+
+    @classmethod
+    def create(cls, path: str, n: int) -> "MappedUnionFind":
+        """
+        Creates (or overwrites) a union-find file with n elements, each in
+        its own component, and opens it.
+
+        Args:
+            path (str): Path of the file.
+            n (int): The number of elements.
+
+        Returns:
+            MappedUnionFind: The opened data structure.
+        """
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, n, n))
+            for lo in range(0, n, _CHUNK):
+                array("q", range(lo, min(lo + _CHUNK, n))).tofile(f)
+            f.truncate(_HEADER.size + 9 * n)  # Zero ranks
+        return cls(path)
+
+    def find(self, p: int) -> int:
+        """
+        Finds the root of the component containing element p, halving the
+        path on the way.
+
+        Args:
+            p (int): The element to find.
+
+        Returns:
+            int: The root of the component containing element p.
+
+        Raises:
+            ValueError: if p is out of bounds.
+        """
+        parent = self._parent
+        if not (0 <= p < len(parent)):
+            raise ValueError(f"Element {p} is out of bounds.")
+        while p != parent[p]:
+            parent[p] = parent[parent[p]]
+            p = parent[p]
+        return p
+
+    def union(self, p: int, q: int):
+        """
+        Connects elements p and q by merging their components, linking the
+        root with the smaller rank under the root with the larger rank.
+
+        Args:
+            p (int): The first element.
+            q (int): The second element.
+
+        Raises:
+            ValueError: if p or q are out of bounds.
+        """
+        n = len(self._parent)
+        if not (0 <= p < n and 0 <= q < n):
+            raise ValueError(f"Elements {p} or {q} are out of bounds.")
+
+        rootP = self.find(p)
+        rootQ = self.find(q)
+
+        if rootP == rootQ:
+            return  # p and q are already in the same component
+
+        rank = self._rank
+        if rank[rootP] < rank[rootQ]:
+            self._parent[rootP] = rootQ
+        elif rank[rootP] > rank[rootQ]:
+            self._parent[rootQ] = rootP
+        else:
+            self._parent[rootQ] = rootP
+            rank[rootP] += 1
+        self._header[0] -= 1  # Decrement the number of components
+
+    def components(self) -> int:
+        """
+        Returns the number of disjoint sets (components).
+
+        Returns:
+            int: The number of components.
+        """
+        return self._header[0]
+
+    def max_depth(self) -> int:
+        """
+        Returns the height of the tallest tree of the forest.
+
+        Returns:
+            int: The largest number of links from an element to its root.
+        """
+        return self._forest_height(self._parent)
+
+    def is_connected(self, p: int, q: int) -> bool:
+        """
+        Checks if elements p and q are in the same component.
+
+        Args:
+            p (int): The first element.
+            q (int): The second element.
+
+        Returns:
+            bool: True if p and q are in the same component, False otherwise.
+
+        Raises:
+            ValueError: if p or q are out of bounds.
+        """
+        n = len(self._parent)
+        if not (0 <= p < n and 0 <= q < n):
+            raise ValueError(f"Elements {p} or {q} are out of bounds.")
+        return self.find(p) == self.find(q)
+
+    def flush(self):
+        """Write every change made so far durably to the file."""
+        self._mmap.flush()
+
+    def close(self):
+        """Flush pending changes and unmap the file."""
+        if self._mmap.closed:
+            return
+        self.flush()
+        # Views must be released before the mapping can be closed
+        self._header.release()
+        self._parent.release()
+        self._rank.release()
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedUnionFind":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of elements."""
+        return len(self._parent)
+
+
+if __name__ == "__main__":
+    path = os.path.join(tempfile.mkdtemp(), "uf.bin")
+    with MappedUnionFind.create(path, 5) as muf:
+        muf.union(1, 2)
+        muf.union(0, 4)
+    with MappedUnionFind(path) as muf:
+        print(muf.components())
+        print(muf.is_connected(1, 4))
+        print(muf.is_connected(2, 1))
+    os.remove(path)
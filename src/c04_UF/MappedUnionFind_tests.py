@@ -0,0 +1,81 @@
+# To run:
+# PYTHONPATH=src python3 -m c04_UF.MappedUnionFind_tests
+
+import os
+import random
+import tempfile
+import unittest
+from c04_UF.MappedUnionFind import MappedUnionFind
+from c04_UF.WeightedQuickUnion import WeightedQuickUnion
+
+
+class TestMappedUnionFind(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "uf.bin")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_create(self):
+        with MappedUnionFind.create(self.path, 10) as uf:
+            self.assertEqual(len(uf), 10)
+            self.assertEqual(uf.components(), 10)
+            self.assertEqual(uf.find(7), 7)
+
+    def test_changes_persist_after_reopen(self):
+        with MappedUnionFind.create(self.path, 10) as uf:
+            uf.union(0, 1)
+            uf.union(1, 2)
+            uf.union(5, 6)
+        with MappedUnionFind(self.path) as uf:
+            self.assertEqual(uf.components(), 7)
+            self.assertTrue(uf.is_connected(0, 2))
+            self.assertTrue(uf.is_connected(6, 5))
+            self.assertFalse(uf.is_connected(2, 5))
+
+    def test_matches_weighted_quick_union(self):
+        rng = random.Random(9)
+        n = 300
+        wqu = WeightedQuickUnion(n)
+        with MappedUnionFind.create(self.path, n) as uf:
+            for _ in range(200):
+                p, q = rng.randrange(n), rng.randrange(n)
+                uf.union(p, q)
+                wqu.union(p, q)
+            uf.flush()
+        with MappedUnionFind(self.path) as uf:
+            self.assertEqual(uf.components(), wqu.components())
+            for _ in range(500):
+                p, q = rng.randrange(n), rng.randrange(n)
+                self.assertEqual(uf.is_connected(p, q),
+                                 wqu.is_connected(p, q))
+
+    def test_rejects_foreign_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a union-find file at all")
+        with self.assertRaises(ValueError):
+            MappedUnionFind(self.path)
+
+    def test_rejects_truncated_file(self):
+        MappedUnionFind.create(self.path, 10).close()
+        with open(self.path, "r+b") as f:
+            f.truncate(40)
+        with self.assertRaises(ValueError):
+            MappedUnionFind(self.path)
+
+    def test_out_of_bounds(self):
+        with MappedUnionFind.create(self.path, 3) as uf:
+            with self.assertRaises(ValueError):
+                uf.union(0, 3)
+            with self.assertRaises(ValueError):
+                uf.find(-1)
+
+    def test_close_is_idempotent(self):
+        uf = MappedUnionFind.create(self.path, 3)
+        uf.close()
+        uf.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,217 @@
+# Parallel connected-components labeling over edge lists
+# python3 -m c04_UF.ParallelComponents
+
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional, Sequence, Tuple
+
+from c04_UF.ArrayUnionFind import ArrayUnionFind
+from c04_UF.UnionFind import Batch
+
+
+def _typecode(n: int) -> str:
+    """Return the narrowest ArrayUnionFind typecode that can hold n."""
+    return "i" if n < 2 ** 31 else "q"
+
+
+def _edge_arrays(ps: Batch, qs: Optional[Sequence[int]],
+                 n: int) -> Tuple[array, array]:
+    """
+    Returns the sources and targets of a batch of edges as int64 arrays,
+    checking them against [0, n) once.
+
+    Raises:
+        ValueError: if the buffers differ in length or an endpoint is out
+            of bounds.
+    """
+    if qs is None:
+        pairs = ps if isinstance(ps, list) else list(ps)
+        ps = array("q", (p for p, _ in pairs))
+        qs = array("q", (q for _, q in pairs))
+    elif len(ps) != len(qs):
+        raise ValueError(
+            f"Edge buffers differ in length: {len(ps)} != {len(qs)}.")
+    else:
+        ps = array("q", ps)
+        qs = array("q", qs)
+    if len(ps) and not (0 <= min(ps) and max(ps) < n
+                        and 0 <= min(qs) and max(qs) < n):
+        raise ValueError(f"Edges have endpoints out of bounds [0, {n}).")
+    return ps, qs
+
+
+def _write_links(links, m: int, lo: int, uf: ArrayUnionFind) -> int:
+    """
+    Write the links of uf as (child, root) pairs into links[lo:] (children)
+    and links[m + lo:] (roots), returning how many there are.
+    """
+    children, roots = uf.links()
+    count = len(children)
+    links[lo:lo + count] = array("q", children)
+    links[m + lo:m + lo + count] = array("q", roots)
+    return count
+
+
+def _shard_forest(edges_name: str, links_name: str, n: int, m: int,
+                  lo: int, hi: int) -> int:
+    """
+    Worker, first round: build a union-find forest over edges [lo, hi) and
+    write its links into the same slots of the shared links buffer.
+
+    A forest over k edges has at most k links, so they always fit.
+
+    Args:
+        edges_name (str): Shared memory holding m sources then m targets.
+        links_name (str): Shared memory holding m children then m roots.
+        n (int): The number of elements.
+        m (int): The total number of edges.
+        lo (int): First edge of the shard.
+        hi (int): One past the last edge of the shard.
+
+    Returns:
+        int: The number of links written at lo.
+    """
+    edges_shm = shared_memory.SharedMemory(name=edges_name)
+    links_shm = shared_memory.SharedMemory(name=links_name)
+    try:
+        edges = edges_shm.buf.cast("q")
+        links = links_shm.buf.cast("q")
+        uf = ArrayUnionFind(n, _typecode(n))
+        uf.union_many(edges[lo:hi], edges[m + lo:m + hi])
+        count = _write_links(links, m, lo, uf)
+        del edges, links  # Release the views before closing the mappings
+    finally:
+        edges_shm.close()
+        links_shm.close()
+    return count
+
+
+def _merge_forests(links_name: str, n: int, m: int, lo: int, count: int,
+                   mid: int, mid_count: int) -> int:
+    """
+    Worker, reduction rounds: merge the links of two adjacent groups of
+    shards, at lo and mid, and write the links of the union at lo. They
+    fit, since there are at most count + mid_count of them and mid >= lo
+    + count.
+
+    Returns:
+        int: The number of links written at lo.
+    """
+    links_shm = shared_memory.SharedMemory(name=links_name)
+    try:
+        links = links_shm.buf.cast("q")
+        uf = ArrayUnionFind(n, _typecode(n))
+        uf.union_many(links[lo:lo + count], links[m + lo:m + lo + count])
+        uf.union_many(links[mid:mid + mid_count],
+                      links[m + mid:m + mid + mid_count])
+        count = _write_links(links, m, lo, uf)
+        del links
+    finally:
+        links_shm.close()
+    return count
+
+
+def parallel_components(n: int, ps: Batch,
+                        qs: Optional[Sequence[int]] = None,
+                        workers: Optional[int] = None) -> Tuple[int, array]:
+    """
+    Computes the connected components of a graph given as an edge list,
+    using a pool of processes.
+
+    The edges are copied once into shared memory and split into one
+    contiguous shard per worker. Each worker builds an ArrayUnionFind
+    forest for its shard and writes back only its links, the (i, root)
+    pairs of its non-root elements, which preserve the shard's
+    connectivity: at most min(edges, n - 1) pairs per shard. The shard
+    forests are then merged pairwise inside the pool, in log2(workers)
+    rounds, and the parent process only replays the links of the final
+    forest. Nothing but names and offsets is pickled.
+
+    Args:
+        n (int): The number of vertices, labelled 0..n-1.
+        ps: An iterable of (p, q) edges, or the sources of each edge when
+            qs is given.
+        qs: Optional buffer with the targets of each edge.
+        workers (int, optional): Number of processes; defaults to the
+            number of CPUs. With one worker the edges are processed in
+            the calling process.
+
+    Returns:
+        Tuple[int, array]: The number of components and, for every vertex,
+        the root of its component.
+
+    Raises:
+        ValueError: if an edge endpoint is out of bounds.
+    """
+    ps, qs = _edge_arrays(ps, qs, n)
+    m = len(ps)
+    workers = max(1, min(workers or os.cpu_count() or 1, m or 1))
+    uf = ArrayUnionFind(n, _typecode(n))
+    if workers == 1:
+        uf.union_many(ps, qs)
+        return uf.components(), uf.labels()
+
+    edges_shm = links_shm = None
+    try:
+        edges_shm = shared_memory.SharedMemory(create=True, size=16 * m)
+        links_shm = shared_memory.SharedMemory(create=True, size=16 * m)
+        edges = edges_shm.buf.cast("q")
+        edges[:m] = ps
+        edges[m:2 * m] = qs
+        del edges
+
+        bounds = [m * k // workers for k in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            counts = list(pool.map(
+                _shard_forest, [edges_shm.name] * workers,
+                [links_shm.name] * workers, [n] * workers, [m] * workers,
+                bounds[:-1], bounds[1:]))
+            # Each group of adjacent shards is (start, number of links)
+            groups = list(zip(bounds[:-1], counts))
+            while len(groups) > 1:
+                pairs = [(groups[i], groups[i + 1])
+                         for i in range(0, len(groups) - 1, 2)]
+                futures = [pool.submit(_merge_forests, links_shm.name, n, m,
+                                       lo, count, mid, mid_count)
+                           for (lo, count), (mid, mid_count) in pairs]
+                merged = [(lo, future.result())
+                          for ((lo, _), _), future in zip(pairs, futures)]
+                groups = merged + groups[2 * len(pairs):]
+
+        lo, count = groups[0]
+        links = links_shm.buf.cast("q")
+        uf.union_many(links[lo:lo + count], links[m + lo:m + lo + count])
+        del links
+    finally:
+        for shm in (edges_shm, links_shm):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+    return uf.components(), uf.labels()
+
+
+def benchmark(n: int = 200000, m: int = 1000000, seed: int = 42):
+    """Print the running time of parallel_components for 1..N workers."""
+    rng = random.Random(seed)
+    ps = array("q", (rng.randrange(n) for _ in range(m)))
+    qs = array("q", (rng.randrange(n) for _ in range(m)))
+    print(f"n = {n} vertices, m = {m} random edges")
+    start = time.perf_counter()
+    ArrayUnionFind(n).union_many(ps, qs)
+    serial = time.perf_counter() - start
+    print(f"serial ArrayUnionFind: {serial:.3f} s")
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        start = time.perf_counter()
+        count, _ = parallel_components(n, ps, qs, workers)
+        elapsed = time.perf_counter() - start
+        print(f"{workers:2d} workers: {elapsed:.3f} s, "
+              f"speedup {serial / elapsed:.2f}x, {count} components")
+
+
+if __name__ == "__main__":
+    print(parallel_components(6, [(0, 1), (2, 3), (1, 3), (4, 5)], workers=2))
+    benchmark()
@@ -0,0 +1,60 @@
+# To run:
+# PYTHONPATH=src python3 -m c04_UF.ParallelComponents_tests
+
+import random
+import unittest
+from array import array
+from c04_UF.ArrayUnionFind import ArrayUnionFind
+from c04_UF.ParallelComponents import parallel_components
+
+
+class TestParallelComponents(unittest.TestCase):
+    def assertSameComponents(self, n, ps, qs, workers):
+        expected = ArrayUnionFind(n)
+        expected.union_many(ps, qs)
+        count, labels = parallel_components(n, ps, qs, workers)
+        self.assertEqual(count, expected.components())
+        self.assertEqual(len(labels), n)
+        # Same partition: two vertices share a label iff they are connected
+        roots = {}
+        for p, root in enumerate(expected.labels()):
+            self.assertEqual(roots.setdefault(root, labels[p]), labels[p])
+        self.assertEqual(len(set(labels)), count)
+
+    def test_matches_array_union_find(self):
+        rng = random.Random(6)
+        for n, m in ((50, 20), (500, 400), (2000, 6000)):
+            ps = array("q", (rng.randrange(n) for _ in range(m)))
+            qs = array("q", (rng.randrange(n) for _ in range(m)))
+            for workers in (1, 2, 3, 4):
+                with self.subTest(n=n, m=m, workers=workers):
+                    self.assertSameComponents(n, ps, qs, workers)
+
+    def test_chain_split_across_shards(self):
+        # Every shard only sees a piece of the path
+        n = 1000
+        ps = list(range(n - 1))
+        qs = list(range(1, n))
+        for workers in (2, 5):
+            count, labels = parallel_components(n, ps, qs, workers)
+            self.assertEqual(count, 1)
+            self.assertEqual(len(set(labels)), 1)
+
+    def test_pairs_and_empty_input(self):
+        count, labels = parallel_components(
+            6, [(0, 1), (2, 3), (1, 3), (4, 5)], workers=2)
+        self.assertEqual(count, 2)
+        self.assertEqual(labels[0], labels[2])
+        self.assertNotEqual(labels[0], labels[4])
+        count, labels = parallel_components(4, [], workers=3)
+        self.assertEqual((count, list(labels)), (4, [0, 1, 2, 3]))
+
+    def test_out_of_bounds(self):
+        with self.assertRaises(ValueError):
+            parallel_components(3, [(0, 3)], workers=2)
+        with self.assertRaises(ValueError):
+            parallel_components(3, [0, 1], [1], workers=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
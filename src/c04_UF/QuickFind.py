@@ -1,5 +1,6 @@
 # Implementation of the QuickFind Union-Find ADT
-from c04_UF.UnionFind import UnionFind
+from typing import List, Optional, Sequence
+from c04_UF.UnionFind import Batch, UnionFind
 
 class QuickFind(UnionFind):
     """
@@ -73,12 +74,69 @@ class QuickFind(UnionFind):
         """
         return self._count
 
+    def max_depth(self) -> int:
+        """
+        Returns the height of the tallest tree of the forest. Every id is
+        the element the component is named after, whose own id is itself,
+        so the trees are flat: 1 once any union has merged two elements.
+
+        Returns:
+            int: The largest number of links from an element to its root.
+        """
+        return self._forest_height(self._id)
+
     def is_connected(self, p:int, q:int) -> bool:
         """True is p is connected to q (possibly with some intermediaries in between)"""
         if not (0 <= p < len(self._id) and 0 <= q < len(self._id)):
             raise ValueError(f"Elements {p} or {q} are out of bounds.")
         return self.find(p) == self.find(q)
 
+    def union_many(self, ps: Batch, qs: Optional[Sequence[int]] = None):
+        """
+        Joins the components of every pair in a batch. Bounds are checked
+        once for the whole batch instead of once per pair.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+
+        Raises:
+            ValueError: if any element of the batch is out of bounds.
+        """
+        ids = self._id
+        ps, qs = self._batch(ps, qs, len(ids))
+        count = self._count
+        for p, q in zip(ps, qs):
+            pid = ids[p]
+            qid = ids[q]
+            if pid == qid:
+                continue
+            # Relabel p's component in a single pass over the id list
+            ids[:] = [qid if x == pid else x for x in ids]
+            count -= 1
+        self._count = count
+
+    def connected_many(self, ps: Batch,
+                       qs: Optional[Sequence[int]] = None) -> List[bool]:
+        """
+        Checks connectivity for every pair in a batch.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+
+        Returns:
+            List[bool]: One answer per pair, in batch order.
+
+        Raises:
+            ValueError: if any element of the batch is out of bounds.
+        """
+        ids = self._id
+        ps, qs = self._batch(ps, qs, len(ids))
+        return [ids[p] == ids[q] for p, q in zip(ps, qs)]
+
 
 if __name__=="__main__":
     qf = QuickFind(5)
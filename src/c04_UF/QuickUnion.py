@@ -1,5 +1,6 @@
 # Implementation of the QuickFind Union-Find ADT
-from c04_UF.UnionFind import UnionFind
+from typing import List, Optional, Sequence
+from c04_UF.UnionFind import Batch, UnionFind
 
 class QuickUnion(UnionFind):
     """
@@ -76,6 +77,15 @@ class QuickUnion(UnionFind):
             int: The number of components.
         """
         return self._count
+
+    def max_depth(self) -> int:
+        """
+        Returns the height of the tallest tree of the forest.
+
+        Returns:
+            int: The largest number of links from an element to its root.
+        """
+        return self._forest_height(self._parent)
     
     def is_connected(self, p: int, q: int) -> bool:
         """
@@ -94,6 +104,59 @@ class QuickUnion(UnionFind):
         if not (0 <= p < len(self._parent) and 0 <= q < len(self._parent)):
             raise ValueError(f"Elements {p} or {q} are out of bounds.")
         return self.find(p) == self.find(q)
+
+    def union_many(self, ps: Batch, qs: Optional[Sequence[int]] = None):
+        """
+        Joins the components of every pair in a batch. Bounds are checked
+        once for the whole batch instead of once per pair.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+
+        Raises:
+            ValueError: if any element of the batch is out of bounds.
+        """
+        parent = self._parent
+        ps, qs = self._batch(ps, qs, len(parent))
+        count = self._count
+        for p, q in zip(ps, qs):
+            while p != parent[p]:
+                p = parent[p]
+            while q != parent[q]:
+                q = parent[q]
+            if p != q:
+                parent[p] = q
+                count -= 1
+        self._count = count
+
+    def connected_many(self, ps: Batch,
+                       qs: Optional[Sequence[int]] = None) -> List[bool]:
+        """
+        Checks connectivity for every pair in a batch.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+
+        Returns:
+            List[bool]: One answer per pair, in batch order.
+
+        Raises:
+            ValueError: if any element of the batch is out of bounds.
+        """
+        parent = self._parent
+        ps, qs = self._batch(ps, qs, len(parent))
+        result = []
+        for p, q in zip(ps, qs):
+            while p != parent[p]:
+                p = parent[p]
+            while q != parent[q]:
+                q = parent[q]
+            result.append(p == q)
+        return result
     
 if __name__=="__main__":
     qu = QuickUnion(5)
@@ -0,0 +1,193 @@
+# Implementation of a Union-Find ADT whose unions can be undone
+from typing import List, Tuple
+
+from c04_UF.UnionFind import UnionFind
+
+class RollbackUnionFind(UnionFind):
+    """
+    RollbackUnionFind is an implementation of the Union-Find data structure
+    that can undo unions, as needed by backtracking solvers and by offline
+    dynamic connectivity (divide and conquer over time).
+
+    It uses union by rank *without* path compression, so every union
+    changes at most one parent and one rank. Each effective union is
+    recorded in an undo log; `checkpoint()` returns a token for the
+    current log length and `rollback(token)` pops the log back to it, in
+    O(changes) time. `find` is O(log n) in the worst case.
+    """
+
+    def __init__(self, n: int):
+        """
+        Initializes the RollbackUnionFind data structure with n elements.
+        Each element is initially in its own component with rank 0.
+
+        Args:
+            n (int): The number of elements.
+        """
+        super().__init__()
+        self._parent = list(range(n))  # Stores the parent of each element
+        self._rank = [0] * n  # Upper bound on the height of each root
+        self._count = n  # Number of components
+        # One entry per effective union: the root that was linked below
+        # another root, and whether the new root's rank was incremented
+        self._linked: List[int] = []
+        self._bumped: List[bool] = []
+        # Serial number of each log entry, from a counter that never goes
+        # back, so that an entry popped by a rollback is never mistaken
+        # for a later one at the same position
+        self._serials: List[int] = []
+        self._generation = 0
+
+    def find(self, p: int) -> int:
+        """
+        Finds the root of the component containing element p.
+        The tree is left untouched, so that unions stay reversible.
+
+        Args:
+            p (int): The element to find.
+
+        Returns:
+            int: The root of the component containing element p.
+
+        Raises:
+            ValueError: if p is out of bounds.
+        """
+        parent = self._parent
+        if not (0 <= p < len(parent)):
+            raise ValueError(f"Element {p} is out of bounds.")
+        while p != parent[p]:
+            p = parent[p]
+        return p
+
+    def union(self, p: int, q: int):
+        """
+        Connects elements p and q by merging their components.
+        The root with the smaller rank is linked under the root with the
+        larger rank. Redundant unions are not recorded in the undo log.
+
+        Args:
+            p (int): The first element.
+            q (int): The second element.
+
+        Raises:
+            ValueError: if p or q are out of bounds.
+        """
+        if not (0 <= p < len(self._parent) and 0 <= q < len(self._parent)):
+            raise ValueError(f"Elements {p} or {q} are out of bounds.")
+
+        rootP = self.find(p)
+        rootQ = self.find(q)
+
+        if rootP == rootQ:
+            return  # p and q are already in the same component
+
+        rank = self._rank
+        if rank[rootP] > rank[rootQ]:
+            rootP, rootQ = rootQ, rootP
+        bumped = rank[rootP] == rank[rootQ]
+        self._parent[rootP] = rootQ
+        if bumped:
+            rank[rootQ] += 1
+        self._linked.append(rootP)
+        self._bumped.append(bumped)
+        self._generation += 1
+        self._serials.append(self._generation)
+        self._count -= 1  # Decrement the number of components
+
+    def components(self) -> int:
+        """
+        Returns the number of disjoint sets (components).
+
+        Returns:
+            int: The number of components.
+        """
+        return self._count
+
+    def max_depth(self) -> int:
+        """
+        Returns the height of the tallest tree of the forest.
+
+        Returns:
+            int: The largest number of links from an element to its root.
+        """
+        return self._forest_height(self._parent)
+
+    def is_connected(self, p: int, q: int) -> bool:
+        """
+        Checks if elements p and q are in the same component.
+
+        Args:
+            p (int): The first element.
+            q (int): The second element.
+
+        Returns:
+            bool: True if p and q are in the same component, False otherwise.
+
+        Raises:
+            ValueError: if p or q are out of bounds.
+        """
+        if not (0 <= p < len(self._parent) and 0 <= q < len(self._parent)):
+            raise ValueError(f"Elements {p} or {q} are out of bounds.")
+        return self.find(p) == self.find(q)
+
+    def checkpoint(self) -> Tuple[int, int]:
+        """
+        Returns a token identifying the current state: the length of the
+        undo log and the serial number of its last entry.
+
+        Returns:
+            Tuple[int, int]: A token to pass to `rollback` later.
+        """
+        length = len(self._linked)
+        return length, self._serials[-1] if length else 0
+
+    def rollback(self, token: Tuple[int, int]):
+        """
+        Undoes every union performed since the checkpoint `token` was
+        taken, in time proportional to the number of undone unions.
+
+        Args:
+            token (Tuple[int, int]): A value returned by `checkpoint`.
+
+        Raises:
+            ValueError: if token does not denote a reachable state, e.g.
+                because an earlier rollback already discarded it, even if
+                new unions have since refilled the log to its length.
+        """
+        length, serial = token
+        if not (0 <= length <= len(self._linked)
+                and (self._serials[length - 1] if length else 0) == serial):
+            raise ValueError(f"Invalid checkpoint {token}.")
+        while len(self._linked) > length:
+            self.undo()
+
+    def undo(self) -> bool:
+        """
+        Undoes the most recent effective union.
+
+        Returns:
+            bool: True if a union was undone, False if the log was empty.
+        """
+        if not self._linked:
+            return False
+        child = self._linked.pop()
+        self._serials.pop()
+        root = self._parent[child]
+        self._parent[child] = child
+        if self._bumped.pop():
+            self._rank[root] -= 1
+        self._count += 1
+        return True
+
+
+if __name__=="__main__":
+    ruf = RollbackUnionFind(5)
+    ruf.union(1,2)
+    token = ruf.checkpoint()
+    ruf.union(0,4)
+    ruf.union(2,4)
+    print(ruf.components())
+    print(ruf.is_connected(1,0))
+    ruf.rollback(token)
+    print(ruf.components())
+    print(ruf.is_connected(1,0))
@@ -0,0 +1,111 @@
+# To run:
+# PYTHONPATH=src python3 -m c04_UF.RollbackUnionFind_tests
+
+import random
+import unittest
+from c04_UF.RollbackUnionFind import RollbackUnionFind
+
+
+class TestRollbackUnionFind(unittest.TestCase):
+    def setUp(self):
+        self.uf = RollbackUnionFind(8)
+
+    @staticmethod
+    def _state(uf, n=8):
+        # Roots and depth pin down the forest that rollback must restore
+        return [uf.find(p) for p in range(n)], uf.components(), \
+            uf.max_depth()
+
+    def test_union_and_connected(self):
+        self.uf.union(0, 1)
+        self.uf.union(2, 3)
+        self.uf.union(1, 3)
+        self.assertTrue(self.uf.is_connected(0, 2))
+        self.assertFalse(self.uf.is_connected(0, 4))
+        self.assertEqual(self.uf.components(), 5)
+
+    def test_rollback_restores_exact_state(self):
+        self.uf.union(0, 1)
+        before = self._state(self.uf)
+        token = self.uf.checkpoint()
+        self.uf.union(2, 3)
+        self.uf.union(0, 3)
+        self.uf.union(5, 6)
+        self.uf.rollback(token)
+        self.assertEqual(self._state(self.uf), before)
+        self.assertTrue(self.uf.is_connected(0, 1))
+        self.assertFalse(self.uf.is_connected(0, 3))
+
+    def test_redundant_union_is_not_logged(self):
+        self.uf.union(0, 1)
+        token = self.uf.checkpoint()
+        self.uf.union(1, 0)
+        self.assertEqual(self.uf.checkpoint(), token)
+        with self.assertRaises(ValueError):
+            self.uf.rollback((2, token[1]))
+
+    def test_nested_checkpoints(self):
+        outer = self.uf.checkpoint()
+        self.uf.union(0, 1)
+        inner = self.uf.checkpoint()
+        self.uf.union(1, 2)
+        self.uf.rollback(inner)
+        self.assertEqual(self.uf.components(), 7)
+        self.uf.rollback(outer)
+        self.assertEqual(self.uf.components(), 8)
+        with self.assertRaises(ValueError):
+            self.uf.rollback(inner)
+
+    def test_stale_token_after_new_unions(self):
+        self.uf.union(0, 1)
+        stale = self.uf.checkpoint()
+        self.uf.union(2, 3)
+        self.uf.rollback((0, 0))
+        # The log is as long as when stale was taken, but holds other unions
+        self.uf.union(4, 5)
+        self.uf.union(6, 7)
+        with self.assertRaises(ValueError):
+            self.uf.rollback(stale)
+        self.assertEqual(self.uf.components(), 6)
+        current = self.uf.checkpoint()
+        self.uf.union(0, 7)
+        self.uf.rollback(current)
+        self.assertEqual(self.uf.components(), 6)
+
+    def test_undo_invalidates_later_tokens(self):
+        self.uf.union(0, 1)
+        token = self.uf.checkpoint()
+        self.uf.undo()
+        self.uf.union(2, 3)
+        with self.assertRaises(ValueError):
+            self.uf.rollback(token)
+
+    def test_undo(self):
+        self.assertFalse(self.uf.undo())
+        self.uf.union(3, 4)
+        self.assertTrue(self.uf.undo())
+        self.assertFalse(self.uf.is_connected(3, 4))
+
+    def test_random_backtracking(self):
+        rng = random.Random(5)
+        uf = RollbackUnionFind(30)
+        snapshots = []
+        for _ in range(200):
+            if snapshots and rng.random() < 0.3:
+                token, state = snapshots.pop()
+                uf.rollback(token)
+                self.assertEqual(self._state(uf, 30), state)
+            else:
+                if rng.random() < 0.3:
+                    snapshots.append((uf.checkpoint(), self._state(uf, 30)))
+                uf.union(rng.randrange(30), rng.randrange(30))
+
+    def test_out_of_bounds(self):
+        with self.assertRaises(ValueError):
+            self.uf.union(0, 8)
+        with self.assertRaises(ValueError):
+            self.uf.find(-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,9 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+# A batch is either an iterable of (p, q) pairs or, together with a second
+# argument, one of two parallel integer buffers (list, array, memoryview).
+Batch = Union[Iterable[Tuple[int, int]], Sequence[int]]
 
 class UnionFind(ABC):
 
@@ -19,4 +24,100 @@ class UnionFind(ABC):
     @abstractmethod
     def components(self) -> int:
         """Returns the number of connected components (partitions) in the data structure"""
-        pass
\ No newline at end of file
+        pass
+
+    def max_depth(self) -> Optional[int]:
+        """
+        Returns the height of the tallest tree of the forest: the largest
+        number of links from an element to its root. None for
+        implementations that do not keep a forest of parent links.
+        """
+        return None
+
+    def union_many(self, ps: Batch, qs: Optional[Sequence[int]] = None):
+        """
+        Joins the components of every pair in a batch.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+        """
+        if qs is None:
+            for p, q in ps:
+                self.union(p, q)
+        else:
+            for p, q in zip(ps, qs):
+                self.union(p, q)
+
+    def connected_many(self, ps: Batch,
+                       qs: Optional[Sequence[int]] = None) -> List[bool]:
+        """
+        Checks connectivity for every pair in a batch.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+
+        Returns:
+            List[bool]: One answer per pair, in batch order.
+        """
+        pairs = ps if qs is None else zip(ps, qs)
+        return [self.is_connected(p, q) for p, q in pairs]
+
+    @staticmethod
+    def _forest_height(parent: Sequence[int]) -> int:
+        """
+        Returns the height of the tallest tree of a parent array, where
+        roots are their own parent. Each element's depth is computed once,
+        so the cost is O(n) whatever the shape of the trees.
+        """
+        depth = [-1] * len(parent)
+        deepest = 0
+        for i in range(len(parent)):
+            path = []
+            p = i
+            while depth[p] < 0 and parent[p] != p:
+                path.append(p)
+                p = parent[p]
+            d = depth[p] if depth[p] >= 0 else 0
+            depth[p] = d
+            for node in reversed(path):
+                d += 1
+                depth[node] = d
+            deepest = max(deepest, d)
+        return deepest
+
+    @staticmethod
+    def _batch(ps: Batch, qs: Optional[Sequence[int]],
+               n: int) -> Tuple[Sequence[int], Sequence[int]]:
+        """
+        Normalizes a batch into two parallel sequences and bounds-checks it
+        once, so that per-pair checks can be skipped.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+            n (int): The number of elements of the data structure.
+
+        Returns:
+            Tuple[Sequence[int], Sequence[int]]: The first and second
+            elements of every pair.
+
+        Raises:
+            ValueError: if the buffers differ in length or any element is
+                out of bounds.
+        """
+        if qs is None:
+            pairs = ps if isinstance(ps, list) else list(ps)
+            ps = [p for p, _ in pairs]
+            qs = [q for _, q in pairs]
+        elif len(ps) != len(qs):
+            raise ValueError(
+                f"Batch buffers differ in length: {len(ps)} != {len(qs)}.")
+        if len(ps) and not (0 <= min(ps) and max(ps) < n
+                            and 0 <= min(qs) and max(qs) < n):
+            raise ValueError(f"Batch has elements out of bounds [0, {n}).")
+        return ps, qs
@@ -0,0 +1,235 @@
+# Micro-benchmark suite for the Union-Find implementations
+# python3 -m c04_UF.UnionFindBenchmark --n 10000 --json uf_bench.json
+
+import argparse
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from c04_UF.AggregateUnionFind import AggregateUnionFind
+from c04_UF.ArrayUnionFind import ArrayUnionFind
+from c04_UF.DynamicUnionFind import DynamicUnionFind
+from c04_UF.MappedUnionFind import MappedUnionFind
+from c04_UF.QuickFind import QuickFind
+from c04_UF.QuickUnion import QuickUnion
+from c04_UF.RollbackUnionFind import RollbackUnionFind
+from c04_UF.UnionFind import UnionFind
+from c04_UF.WeightedQuickFind import WeightedQuickFind
+from c04_UF.WeightedQuickUnion import WeightedQuickUnion
+
+# An operation is (is_union, p, q); a union if is_union else a query
+Operation = Tuple[bool, int, int]
+# A workload is the number of elements and the operations to run on them
+Workload = Tuple[int, List[Operation]]
+
+# Implementations whose worst case is quadratic run on a capped n
+QUADRATIC = {"QuickFind", "QuickUnion"}
+
+
+def random_unions(n: int, seed: int) -> Workload:
+    """n unions between uniformly random pairs, then n random queries."""
+    rng = random.Random(seed)
+    ops = [(True, rng.randrange(n), rng.randrange(n)) for _ in range(n)]
+    ops += [(False, rng.randrange(n), rng.randrange(n)) for _ in range(n)]
+    return n, ops
+
+
+def adversarial_chain(n: int, seed: int) -> Workload:
+    """
+    Unions (i, i+1) in order, which make QuickUnion build a single path of
+    height n-1, then n queries from the deepest element.
+    """
+    rng = random.Random(seed)
+    ops = [(True, i, i + 1) for i in range(n - 1)]
+    ops += [(False, 0, rng.randrange(n)) for _ in range(n)]
+    return n, ops
+
+
+def grid_percolation(n: int, seed: int) -> Workload:
+    """
+    Opens the sites of a side x side grid (side = isqrt(n)) in random
+    order, joining each to its open neighbours and to virtual top and
+    bottom sites, and asks whether the system percolates after each one.
+    """
+    rng = random.Random(seed)
+    side = max(1, int(n ** 0.5))
+    top, bottom = side * side, side * side + 1
+    sites = list(range(side * side))
+    rng.shuffle(sites)
+    is_open = [False] * (side * side)
+    ops: List[Operation] = []
+    for site in sites:
+        is_open[site] = True
+        row, col = divmod(site, side)
+        if row == 0:
+            ops.append((True, site, top))
+        if row == side - 1:
+            ops.append((True, site, bottom))
+        for r, c in ((row - 1, col), (row + 1, col),
+                     (row, col - 1), (row, col + 1)):
+            if 0 <= r < side and 0 <= c < side and is_open[r * side + c]:
+                ops.append((True, site, r * side + c))
+        ops.append((False, top, bottom))
+    return side * side + 2, ops
+
+
+def read_heavy(n: int, seed: int) -> Workload:
+    """2n operations with one union for every nine queries, interleaved."""
+    rng = random.Random(seed)
+    ops = [(rng.random() < 0.1, rng.randrange(n), rng.randrange(n))
+           for _ in range(2 * n)]
+    return n, ops
+
+
+WORKLOADS: Dict[str, Callable[[int, int], Workload]] = {
+    "random_unions": random_unions,
+    "adversarial_chain": adversarial_chain,
+    "grid_percolation": grid_percolation,
+    "read_heavy": read_heavy,
+}
+
+
+class _TemporaryMappedUnionFind(MappedUnionFind):
+    """A MappedUnionFind whose file is deleted once it is closed."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._path = path
+
+    def close(self):
+        super().close()
+        # Only an unmapped file can be deleted on every platform
+        if os.path.exists(self._path):
+            os.remove(self._path)
+
+
+def _mapped(n: int) -> MappedUnionFind:
+    """Create a MappedUnionFind on a fresh temporary file."""
+    fd, path = tempfile.mkstemp(suffix=".uf")
+    os.close(fd)
+    return _TemporaryMappedUnionFind.create(path, n)
+
+
+IMPLEMENTATIONS: Dict[str, Callable[[int], UnionFind]] = {
+    "QuickFind": QuickFind,
+    "QuickUnion": QuickUnion,
+    "WeightedQuickUnion": WeightedQuickUnion,
+    "WeightedQuickFind": WeightedQuickFind,
+    "ArrayUnionFind": ArrayUnionFind,
+    "DynamicUnionFind": lambda n: DynamicUnionFind(range(n)),
+    "RollbackUnionFind": RollbackUnionFind,
+    "AggregateUnionFind": AggregateUnionFind,
+    "MappedUnionFind": _mapped,
+}
+
+
+def _run(uf: UnionFind, ops: List[Operation]):
+    """Apply every operation of a workload to uf."""
+    union = uf.union
+    is_connected = uf.is_connected
+    for is_union, p, q in ops:
+        if is_union:
+            union(p, q)
+        else:
+            is_connected(p, q)
+
+
+def measure(name: str, workload: str, n: int, seed: int) -> dict:
+    """
+    Runs one implementation on one workload, once timed and once under
+    tracemalloc (which would otherwise distort the timing).
+
+    Args:
+        name (str): Key of IMPLEMENTATIONS.
+        workload (str): Key of WORKLOADS.
+        n (int): Requested number of elements.
+        seed (int): Seed of the workload generator.
+
+    Returns:
+        dict: A JSON-serializable record with the measurements.
+    """
+    size, ops = WORKLOADS[workload](n, seed)
+    factory = IMPLEMENTATIONS[name]
+
+    uf = factory(size)
+    start = time.perf_counter()
+    _run(uf, ops)
+    elapsed = time.perf_counter() - start
+    depth = uf.max_depth()
+    if isinstance(uf, MappedUnionFind):
+        uf.close()
+    del uf
+
+    tracemalloc.start()
+    uf = factory(size)
+    _run(uf, ops)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if isinstance(uf, MappedUnionFind):
+        uf.close()
+
+    return {
+        "implementation": name,
+        "workload": workload,
+        "n": size,
+        "operations": len(ops),
+        "seconds": round(elapsed, 6),
+        "ops_per_sec": round(len(ops) / elapsed) if elapsed else None,
+        "peak_bytes": peak,
+        "max_depth": depth,
+    }
+
+
+def run_suite(n: int, seed: int, implementations: List[str],
+              workloads: List[str], quadratic_n: int) -> List[dict]:
+    """Measure every implementation on every workload and print a table."""
+    records = []
+    print(f"{'implementation':20s} {'workload':18s} {'n':>7s} "
+          f"{'ops/s':>12s} {'peak KiB':>9s} {'depth':>6s}")
+    for workload in workloads:
+        for name in implementations:
+            size = min(n, quadratic_n) if name in QUADRATIC else n
+            record = measure(name, workload, size, seed)
+            records.append(record)
+            depth = record["max_depth"]
+            print(f"{name:20s} {workload:18s} {record['n']:7d} "
+                  f"{record['ops_per_sec'] or 0:12,d} "
+                  f"{record['peak_bytes'] / 1024:9.1f} "
+                  f"{'-' if depth is None else depth:>6}")
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Union-Find implementations.")
+    parser.add_argument("--n", type=int, default=10000,
+                        help="number of elements per workload")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--quadratic-n", type=int, default=2000,
+                        help="cap on n for " + ", ".join(sorted(QUADRATIC)))
+    parser.add_argument("--impl", nargs="*", default=list(IMPLEMENTATIONS),
+                        choices=list(IMPLEMENTATIONS))
+    parser.add_argument("--workload", nargs="*", default=list(WORKLOADS),
+                        choices=list(WORKLOADS))
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    records = run_suite(args.n, args.seed, args.impl, args.workload,
+                        args.quadratic_n)
+    if args.json:
+        report = {
+            "python": platform.python_version(),
+            "seed": args.seed,
+            "results": records,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# To run:
+# PYTHONPATH=src python3 -m c04_UF.UnionFindBenchmark_tests
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+from c04_UF.MappedUnionFind import MappedUnionFind
+from c04_UF.UnionFindBenchmark import (IMPLEMENTATIONS, WORKLOADS, measure,
+                                       run_suite)
+
+FIELDS = ["implementation", "workload", "n", "operations", "seconds",
+          "ops_per_sec", "peak_bytes", "max_depth"]
+
+
+class TestWorkloads(unittest.TestCase):
+    def test_operations_are_in_bounds(self):
+        for name, make in WORKLOADS.items():
+            with self.subTest(workload=name):
+                size, ops = make(100, 1)
+                self.assertGreater(len(ops), 0)
+                for is_union, p, q in ops:
+                    self.assertIsInstance(is_union, bool)
+                    self.assertTrue(0 <= p < size and 0 <= q < size)
+
+    def test_seed_reproduces_workload(self):
+        for name, make in WORKLOADS.items():
+            with self.subTest(workload=name):
+                self.assertEqual(make(200, 7), make(200, 7))
+        self.assertNotEqual(WORKLOADS["random_unions"](200, 7),
+                            WORKLOADS["random_unions"](200, 8))
+
+    def test_random_unions(self):
+        size, ops = WORKLOADS["random_unions"](50, 3)
+        self.assertEqual(size, 50)
+        self.assertEqual([u for u, _, _ in ops], [True] * 50 + [False] * 50)
+
+    def test_adversarial_chain(self):
+        size, ops = WORKLOADS["adversarial_chain"](10, 3)
+        self.assertEqual(ops[:9], [(True, i, i + 1) for i in range(9)])
+        self.assertTrue(all(not u and p == 0 for u, p, _ in ops[9:]))
+
+    def test_grid_percolation(self):
+        # A 4 x 4 grid plus the virtual top and bottom sites
+        size, ops = WORKLOADS["grid_percolation"](20, 3)
+        self.assertEqual(size, 18)
+        queries = [op for op in ops if not op[0]]
+        self.assertEqual(queries, [(False, 16, 17)] * 16)
+
+    def test_read_heavy(self):
+        size, ops = WORKLOADS["read_heavy"](1000, 3)
+        self.assertEqual(len(ops), 2000)
+        unions = sum(u for u, _, _ in ops)
+        self.assertTrue(100 < unions < 300)
+
+
+class TestMaxDepth(unittest.TestCase):
+    def test_chain(self):
+        n = 64
+        expected = {"QuickUnion": n - 1, "QuickFind": 1,
+                    "WeightedQuickFind": 1}
+        for name, factory in IMPLEMENTATIONS.items():
+            with self.subTest(implementation=name):
+                uf = factory(n)
+                self.assertEqual(uf.max_depth(), 0)
+                for i in range(n - 1):
+                    uf.union(i, i + 1)
+                depth = uf.max_depth()
+                if name in expected:
+                    self.assertEqual(depth, expected[name])
+                else:
+                    # Union by size or rank keeps trees logarithmic
+                    self.assertTrue(1 <= depth <= 6)
+                if isinstance(uf, MappedUnionFind):
+                    uf.close()
+
+
+class TestMappedFiles(unittest.TestCase):
+    def test_file_is_removed_after_close(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with mock.patch("tempfile.tempdir", directory):
+                uf = IMPLEMENTATIONS["MappedUnionFind"](10)
+                uf.union(0, 1)
+                self.assertEqual(len(os.listdir(directory)), 1)
+                uf.close()
+                self.assertEqual(os.listdir(directory), [])
+                uf.close()  # Closing twice is harmless
+                measure("MappedUnionFind", "random_unions", 50, seed=1)
+                self.assertEqual(os.listdir(directory), [])
+
+
+class TestResults(unittest.TestCase):
+    def test_measure_record(self):
+        record = measure("QuickUnion", "adversarial_chain", 100, seed=1)
+        self.assertEqual(list(record), FIELDS)
+        self.assertEqual(record["implementation"], "QuickUnion")
+        self.assertEqual(record["n"], 100)
+        self.assertEqual(record["operations"], 199)
+        self.assertEqual(record["max_depth"], 99)
+        self.assertGreater(record["ops_per_sec"], 0)
+        self.assertGreater(record["peak_bytes"], 0)
+
+    def test_run_suite_rows(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            records = run_suite(200, 5, ["QuickFind", "ArrayUnionFind"],
+                                ["random_unions", "grid_percolation"],
+                                quadratic_n=50)
+        rows = [(r["workload"], r["implementation"], r["n"])
+                for r in records]
+        self.assertEqual(rows, [("random_unions", "QuickFind", 50),
+                                ("random_unions", "ArrayUnionFind", 200),
+                                ("grid_percolation", "QuickFind", 51),
+                                ("grid_percolation", "ArrayUnionFind", 198)])
+        # A header plus one line per record
+        self.assertEqual(len(output.getvalue().splitlines()), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
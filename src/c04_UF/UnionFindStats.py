@@ -0,0 +1,213 @@
+# Opt-in instrumentation for the quick-union family of Union-Find ADTs
+from typing import Dict, List, Optional, Sequence
+
+from c04_UF.ArrayUnionFind import ArrayUnionFind
+from c04_UF.QuickUnion import QuickUnion
+from c04_UF.UnionFind import Batch
+from c04_UF.WeightedQuickUnion import WeightedQuickUnion
+
+
+class UnionFindStats:
+    """
+    Counters describing how a union-find forest behaves: a histogram of
+    `find` path lengths (number of links followed to reach the root), the
+    deepest path seen, the number of parent pointers rewritten by path
+    compression or halving, and the number of union calls and merges.
+    """
+
+    def __init__(self):
+        """Initialize all counters to zero."""
+        self.reset()
+
+    def reset(self):
+        """Set all counters back to zero, e.g. after each scrape."""
+        self._finds = 0
+        self._path_lengths: Dict[int, int] = {}
+        self._max_depth = 0
+        self._compressions = 0
+        self._unions = 0
+        self._merges = 0
+
+    @property
+    def finds(self) -> int:
+        """The number of `find` calls."""
+        return self._finds
+
+    @property
+    def path_lengths(self) -> Dict[int, int]:
+        """A copy of the histogram of path lengths, as {length: calls}."""
+        return dict(sorted(self._path_lengths.items()))
+
+    @property
+    def max_depth(self) -> int:
+        """The longest `find` path seen."""
+        return self._max_depth
+
+    @property
+    def compressions(self) -> int:
+        """The number of parent pointers rewritten by `find`."""
+        return self._compressions
+
+    @property
+    def unions(self) -> int:
+        """The number of `union` calls."""
+        return self._unions
+
+    @property
+    def merges(self) -> int:
+        """The number of `union` calls that joined two components."""
+        return self._merges
+
+    def record_find(self, length: int, compressions: int = 0):
+        """
+        Record one `find` call.
+
+        Args:
+            length (int): Links followed from the element to its root.
+            compressions (int): Parent pointers rewritten by the call.
+        """
+        self._finds += 1
+        self._path_lengths[length] = self._path_lengths.get(length, 0) + 1
+        if length > self._max_depth:
+            self._max_depth = length
+        self._compressions += compressions
+
+    def record_union(self, merged: bool):
+        """
+        Record one `union` call.
+
+        Args:
+            merged (bool): Whether the call joined two components.
+        """
+        self._unions += 1
+        if merged:
+            self._merges += 1
+
+    def mean_path_length(self) -> float:
+        """Return the average `find` path length, or 0.0 if none."""
+        if not self._finds:
+            return 0.0
+        total = sum(k * v for k, v in self._path_lengths.items())
+        return total / self._finds
+
+    def snapshot(self) -> dict:
+        """
+        Returns a copy of the counters that stays unchanged as the data
+        structure keeps running.
+
+        Returns:
+            dict: The counters, with the histogram as {length: calls}.
+        """
+        return {
+            "finds": self._finds,
+            "path_lengths": self.path_lengths,
+            "max_depth": self._max_depth,
+            "mean_path_length": self.mean_path_length(),
+            "compressions": self._compressions,
+            "unions": self._unions,
+            "merges": self._merges,
+        }
+
+    def __str__(self) -> str:
+        return f"UnionFindStats({self.snapshot()})"
+
+
+class _Instrumented:
+    """
+    Mixin that adds a `stats` object to a union-find class. Subclasses
+    override `find` to report their path length and compressions; union
+    and batch operations are routed through `find` so that every root
+    lookup is recorded.
+
+    The plain classes are left untouched, so code that does not opt in
+    pays nothing for the instrumentation.
+    """
+
+    def __init__(self, n: int, *args, **kwargs):
+        super().__init__(n, *args, **kwargs)
+        self._stats = UnionFindStats()
+
+    @property
+    def stats(self) -> UnionFindStats:
+        """The live counters of this data structure."""
+        return self._stats
+
+    def union(self, p: int, q: int):
+        count = self.components()
+        super().union(p, q)
+        self._stats.record_union(self.components() < count)
+
+    def union_many(self, ps: Batch, qs: Optional[Sequence[int]] = None):
+        ps, qs = self._batch(ps, qs, len(self._parent))
+        for p, q in zip(ps, qs):
+            self.union(p, q)
+
+    def connected_many(self, ps: Batch,
+                       qs: Optional[Sequence[int]] = None) -> List[bool]:
+        ps, qs = self._batch(ps, qs, len(self._parent))
+        return [self.find(p) == self.find(q) for p, q in zip(ps, qs)]
+
+
+class InstrumentedQuickUnion(_Instrumented, QuickUnion):
+    """QuickUnion that records its behaviour in `stats`."""
+
+    def find(self, p: int) -> int:
+        parent = self._parent
+        if not (0 <= p < len(parent)):
+            raise ValueError(f"Element {p} is out of bounds.")
+        length = 0
+        while p != parent[p]:
+            p = parent[p]
+            length += 1
+        self._stats.record_find(length)
+        return p
+
+
+class InstrumentedWeightedQuickUnion(_Instrumented, WeightedQuickUnion):
+    """WeightedQuickUnion that records its behaviour in `stats`."""
+
+    def find(self, p: int) -> int:
+        parent = self._parent
+        if not (0 <= p < len(parent)):
+            raise ValueError(f"Element {p} is out of bounds.")
+        root = p
+        length = 0
+        while root != parent[root]:
+            root = parent[root]
+            length += 1
+        # The node right below the root already points at it
+        compressions = max(length - 1, 0)
+        while p != root:
+            parent[p], p = root, parent[p]
+        self._stats.record_find(length, compressions)
+        return root
+
+
+class InstrumentedArrayUnionFind(_Instrumented, ArrayUnionFind):
+    """ArrayUnionFind that records its behaviour in `stats`."""
+
+    def find(self, p: int) -> int:
+        parent = self._parent
+        if not (0 <= p < len(parent)):
+            raise ValueError(f"Element {p} is out of bounds.")
+        length = 0
+        compressions = 0
+        while p != parent[p]:
+            grandparent = parent[parent[p]]
+            if grandparent != parent[p]:
+                parent[p] = grandparent
+                compressions += 1
+                length += 2  # p skipped over its old parent
+            else:
+                length += 1
+            p = grandparent
+        self._stats.record_find(length, compressions)
+        return p
+
+
+if __name__=="__main__":
+    iqu = InstrumentedQuickUnion(5)
+    for i in range(4):
+        iqu.union(i, i + 1)
+    iqu.is_connected(0, 4)
+    print(iqu.stats)
@@ -0,0 +1,264 @@
+# To run:
+# PYTHONPATH=src python3 -m c04_UF.UnionFind_tests
+
+import random
+import unittest
+from array import array
+from c04_UF.AggregateUnionFind import AggregateUnionFind
+from c04_UF.ArrayUnionFind import ArrayUnionFind
+from c04_UF.DynamicUnionFind import DynamicUnionFind
+from c04_UF.QuickFind import QuickFind
+from c04_UF.QuickUnion import QuickUnion
+from c04_UF.UnionFindStats import (InstrumentedArrayUnionFind,
+                                   InstrumentedQuickUnion,
+                                   InstrumentedWeightedQuickUnion)
+from c04_UF.WeightedQuickFind import WeightedQuickFind
+from c04_UF.WeightedQuickUnion import WeightedQuickUnion
+
+IMPLEMENTATIONS = [QuickFind, QuickUnion, WeightedQuickUnion, ArrayUnionFind,
+                   WeightedQuickFind, InstrumentedQuickUnion,
+                   InstrumentedWeightedQuickUnion, InstrumentedArrayUnionFind]
+
+
+class TestBatchOperations(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(11)
+        self.n = 100
+        self.pairs = [(rng.randrange(self.n), rng.randrange(self.n))
+                      for _ in range(60)]
+        self.queries = [(rng.randrange(self.n), rng.randrange(self.n))
+                        for _ in range(200)]
+
+    def _expected(self, cls):
+        uf = cls(self.n)
+        for p, q in self.pairs:
+            uf.union(p, q)
+        return uf.components(), [uf.is_connected(p, q)
+                                 for p, q in self.queries]
+
+    def test_pairs_match_single_operations(self):
+        for cls in IMPLEMENTATIONS:
+            with self.subTest(cls=cls.__name__):
+                count, answers = self._expected(cls)
+                uf = cls(self.n)
+                uf.union_many(self.pairs)
+                self.assertEqual(uf.components(), count)
+                self.assertEqual(uf.connected_many(self.queries), answers)
+
+    def test_parallel_buffers(self):
+        ps = array("i", [p for p, _ in self.pairs])
+        qs = memoryview(array("i", [q for _, q in self.pairs]))
+        xs = array("q", [p for p, _ in self.queries])
+        ys = [q for _, q in self.queries]
+        for cls in IMPLEMENTATIONS:
+            with self.subTest(cls=cls.__name__):
+                count, answers = self._expected(cls)
+                uf = cls(self.n)
+                uf.union_many(ps, qs)
+                self.assertEqual(uf.components(), count)
+                self.assertEqual(uf.connected_many(xs, ys), answers)
+
+    def test_generator_of_pairs(self):
+        for cls in IMPLEMENTATIONS:
+            with self.subTest(cls=cls.__name__):
+                uf = cls(4)
+                uf.union_many((i, i + 1) for i in range(3))
+                self.assertEqual(uf.components(), 1)
+
+    def test_empty_batch(self):
+        for cls in IMPLEMENTATIONS:
+            with self.subTest(cls=cls.__name__):
+                uf = cls(3)
+                uf.union_many([])
+                self.assertEqual(uf.connected_many([], []), [])
+                self.assertEqual(uf.components(), 3)
+
+    def test_out_of_bounds_batch_is_rejected_before_any_union(self):
+        for cls in IMPLEMENTATIONS:
+            with self.subTest(cls=cls.__name__):
+                uf = cls(5)
+                with self.assertRaises(ValueError):
+                    uf.union_many([(0, 1), (2, 5)])
+                self.assertEqual(uf.components(), 5)
+                with self.assertRaises(ValueError):
+                    uf.connected_many([-1], [0])
+
+    def test_mismatched_buffers(self):
+        for cls in IMPLEMENTATIONS:
+            with self.subTest(cls=cls.__name__):
+                with self.assertRaises(ValueError):
+                    cls(5).union_many([0, 1], [2])
+
+
+class TestWeightedQuickFind(unittest.TestCase):
+    def test_members_and_size(self):
+        uf = WeightedQuickFind(6)
+        uf.union(0, 1)
+        uf.union(2, 3)
+        uf.union(3, 1)
+        self.assertEqual(sorted(uf.members(0)), [0, 1, 2, 3])
+        self.assertEqual(uf.size(2), 4)
+        self.assertEqual(uf.members(5), [5])
+        self.assertEqual(uf.components(), 3)
+
+    def test_smaller_component_is_relabelled(self):
+        uf = WeightedQuickFind(4)
+        uf.union(0, 1)
+        uf.union(0, 2)
+        root = uf.find(0)
+        uf.union(3, 0)
+        self.assertEqual(uf.find(3), root)
+
+    def test_members_is_a_copy(self):
+        uf = WeightedQuickFind(3)
+        uf.members(0).append(2)
+        self.assertFalse(uf.is_connected(0, 2))
+
+
+class TestDynamicUnionFind(unittest.TestCase):
+    def test_keys_are_added_on_first_sight(self):
+        uf = DynamicUnionFind()
+        uf.union("alice", "bob")
+        uf.union("david", "eve")
+        self.assertEqual(len(uf), 4)
+        self.assertEqual(uf.components(), 2)
+        self.assertTrue(uf.is_connected("bob", "alice"))
+        self.assertFalse(uf.is_connected("alice", "eve"))
+        uf.union("bob", "eve")
+        self.assertTrue(uf.is_connected("alice", "david"))
+        self.assertEqual(uf.components(), 1)
+
+    def test_add_and_find(self):
+        uf = DynamicUnionFind(["x", ("tuple", 1)])
+        self.assertTrue(uf.add(3))
+        self.assertFalse(uf.add("x"))
+        self.assertIn(("tuple", 1), uf)
+        self.assertEqual(uf.components(), 3)
+        self.assertEqual(uf.find("x"), "x")
+        uf.union("x", 3)
+        self.assertEqual(uf.find("x"), uf.find(3))
+        self.assertIn(uf.find(3), ("x", 3))
+
+    def test_unknown_key(self):
+        uf = DynamicUnionFind()
+        with self.assertRaises(KeyError):
+            uf.find("missing")
+        with self.assertRaises(KeyError):
+            uf.is_connected("missing", "other")
+
+    def test_union_many_matches_weighted_quick_union(self):
+        rng = random.Random(3)
+        pairs = [(rng.randrange(50), rng.randrange(50)) for _ in range(40)]
+        uf = DynamicUnionFind(range(50))
+        uf.union_many([p for p, _ in pairs], [q for _, q in pairs])
+        wqu = WeightedQuickUnion(50)
+        wqu.union_many(pairs)
+        self.assertEqual(uf.components(), wqu.components())
+
+
+class TestAggregateUnionFind(unittest.TestCase):
+    def setUp(self):
+        weights = [5, 1, 7, 2, 9, 4, 3, 8]
+        self.uf = AggregateUnionFind(8, {
+            "sum": (lambda a, b: a + b, weights),
+            "max": (max, weights),
+        })
+
+    def test_aggregates_follow_unions(self):
+        self.uf.union(6, 1)
+        self.uf.union(1, 3)
+        self.assertEqual(self.uf.size(3), 3)
+        self.assertEqual(self.uf.min_member(6), 1)
+        self.assertEqual(self.uf.max_member(1), 6)
+        self.assertEqual(self.uf.aggregate("sum", 6), 6)
+        self.assertEqual(self.uf.aggregate("max", 3), 3)
+        self.assertEqual(self.uf.aggregate("sum", 0), 5)
+        self.assertEqual(self.uf.members_count(), 3)
+
+    def test_largest_components(self):
+        self.uf.union(0, 1)
+        self.uf.union(2, 3)
+        self.uf.union(3, 4)
+        self.assertEqual([s for _, s in self.uf.largest_components(2)],
+                         [3, 2])
+        self.uf.union(1, 5)
+        self.uf.union(5, 2)
+        largest = self.uf.largest_components(3)
+        self.assertEqual([s for _, s in largest], [6, 1, 1])
+        self.assertEqual(largest[0][0], self.uf.find(0))
+        self.assertEqual(len(self.uf.largest_components(10)), 3)
+        self.assertEqual(self.uf.members_count(), 6)
+
+    def test_largest_components_takes_remaining_singletons(self):
+        self.assertEqual(self.uf.members_count(), 0)
+        self.assertEqual(self.uf.largest_components(3),
+                         [(0, 1), (1, 1), (2, 1)])
+        self.uf.union(0, 7)
+        self.uf.union(2, 1)
+        largest = self.uf.largest_components(5)
+        self.assertEqual([s for _, s in largest], [2, 2, 1, 1, 1])
+        self.assertEqual([r for r, _ in largest[2:]], [3, 4, 5])
+        self.assertEqual(self.uf.members_count(), 4)
+        empty = AggregateUnionFind(0)
+        self.assertEqual(empty.largest_components(2), [])
+
+    def test_wrong_number_of_initial_values(self):
+        with self.assertRaises(ValueError):
+            AggregateUnionFind(3, {"sum": (lambda a, b: a + b, [1, 2])})
+
+
+class TestUnionFindStats(unittest.TestCase):
+    def test_quick_union_chain(self):
+        uf = InstrumentedQuickUnion(5)
+        for i in range(4):
+            uf.union(i, i + 1)
+        self.assertTrue(uf.is_connected(0, 4))
+        stats = uf.stats.snapshot()
+        self.assertEqual(stats["unions"], 4)
+        self.assertEqual(stats["merges"], 4)
+        self.assertEqual(stats["max_depth"], 4)
+        self.assertEqual(stats["compressions"], 0)
+        self.assertEqual(stats["finds"], 10)
+        self.assertEqual(stats["path_lengths"], {0: 9, 4: 1})
+
+    def test_compression_is_counted(self):
+        # Linking the roots of equal trees builds a binomial tree, whose
+        # longest path is 7 -> 6 -> 4 -> 0
+        uf = InstrumentedWeightedQuickUnion(8)
+        for p, q in ((0, 1), (2, 3), (4, 5), (6, 7), (0, 2), (4, 6), (0, 4)):
+            uf.union(p, q)
+        self.assertEqual(uf.max_depth(), 3)
+        uf.stats.reset()
+        self.assertEqual(uf.find(7), 0)
+        self.assertEqual(uf.stats.compressions, 2)
+        self.assertEqual(uf.stats.max_depth, 3)
+        self.assertEqual(uf.max_depth(), 2)
+        self.assertEqual(uf.find(7), 0)
+        self.assertEqual(uf.stats.path_lengths, {1: 1, 3: 1})
+
+    def test_snapshot_and_reset(self):
+        uf = InstrumentedArrayUnionFind(3)
+        uf.union(0, 1)
+        snapshot = uf.stats.snapshot()
+        uf.union(1, 2)
+        self.assertEqual(snapshot["unions"], 1)
+        uf.stats.reset()
+        self.assertEqual(uf.stats.snapshot()["finds"], 0)
+        self.assertEqual(uf.components(), 1)
+
+    def test_counters_are_read_only(self):
+        uf = InstrumentedQuickUnion(3)
+        uf.union(0, 1)
+        uf.union(1, 0)
+        self.assertEqual((uf.stats.unions, uf.stats.merges), (2, 1))
+        for name in ("finds", "path_lengths", "max_depth", "compressions",
+                     "unions", "merges"):
+            with self.subTest(counter=name):
+                with self.assertRaises(AttributeError):
+                    setattr(uf.stats, name, 0)
+        uf.stats.path_lengths[7] = 1  # Only changes a copy
+        self.assertNotIn(7, uf.stats.snapshot()["path_lengths"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+# Implementation of the weighted QuickFind Union-Find ADT
+from typing import List, Optional, Sequence
+
+from c04_UF.UnionFind import Batch, UnionFind
+
+class WeightedQuickFind(UnionFind):
+    """
+    WeightedQuickFind is an implementation of the Union-Find data structure.
+    Like QuickFind, `find` is a single lookup (O(1)), but every component
+    also keeps the list of its members, and `union` relabels only the
+    members of the smaller component. An element is relabelled only when
+    its component at least doubles, so n-1 unions cost O(n log n) in total.
+    """
+
+    def __init__(self, n: int):
+        """
+        Initializes the WeightedQuickFind data structure with n elements.
+        Each element is initially in its own component.
+
+        Args:
+            n (int): The number of elements.
+        """
+        super().__init__()
+        self._id = list(range(n))  # Stores the component id for each element
+        # Members of each component, indexed by component id
+        self._members: List[List[int]] = [[i] for i in range(n)]
+        self._count = n  # Number of components
+
+    def find(self, p: int) -> int:
+        """
+        Finds the component identifier for element p.
+
+        Args:
+            p (int): The element to find.
+
+        Returns:
+            int: The component identifier for element p.
+
+        Raises:
+            ValueError: if p is out of bounds.
+        """
+        if not (0 <= p < len(self._id)):
+            raise ValueError(f"Element {p} is out of bounds.")
+        return self._id[p]
+
+    def union(self, p: int, q: int):
+        """
+        Connects elements p and q by merging their components.
+        The members of the smaller component are relabelled with the id of
+        the larger one.
+
+        Args:
+            p (int): The first element.
+            q (int): The second element.
+
+        Raises:
+            ValueError: if p or q are out of bounds.
+        """
+        if not (0 <= p < len(self._id) and 0 <= q < len(self._id)):
+            raise ValueError(f"Elements {p} or {q} are out of bounds.")
+
+        pid = self._id[p]
+        qid = self._id[q]
+
+        if pid == qid:
+            return  # p and q are already in the same component
+
+        small = self._members[pid]
+        large = self._members[qid]
+        if len(small) > len(large):
+            pid, qid = qid, pid
+            small, large = large, small
+
+        ids = self._id
+        for i in small:
+            ids[i] = qid
+        large.extend(small)
+        self._members[pid] = []  # pid no longer names a component
+
+        self._count -= 1  # Decrement the number of components
+
+    def components(self) -> int:
+        """
+        Returns the number of disjoint sets (components).
+
+        Returns:
+            int: The number of components.
+        """
+        return self._count
+
+    def max_depth(self) -> int:
+        """
+        Returns the height of the tallest tree of the forest. Every id is
+        the element the component is named after, whose own id is itself,
+        so the trees are flat: 1 once any union has merged two elements.
+
+        Returns:
+            int: The largest number of links from an element to its root.
+        """
+        return self._forest_height(self._id)
+
+    def is_connected(self, p: int, q: int) -> bool:
+        """
+        Checks if elements p and q are in the same component.
+
+        Args:
+            p (int): The first element.
+            q (int): The second element.
+
+        Returns:
+            bool: True if p and q are in the same component, False otherwise.
+
+        Raises:
+            ValueError: if p or q are out of bounds.
+        """
+        if not (0 <= p < len(self._id) and 0 <= q < len(self._id)):
+            raise ValueError(f"Elements {p} or {q} are out of bounds.")
+        return self._id[p] == self._id[q]
+
+    def union_many(self, ps: Batch, qs: Optional[Sequence[int]] = None):
+        """
+        Joins the components of every pair in a batch. Bounds are checked
+        once for the whole batch instead of once per pair.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+
+        Raises:
+            ValueError: if any element of the batch is out of bounds.
+        """
+        ids = self._id
+        members = self._members
+        ps, qs = self._batch(ps, qs, len(ids))
+        count = self._count
+        for p, q in zip(ps, qs):
+            pid = ids[p]
+            qid = ids[q]
+            if pid == qid:
+                continue
+            if len(members[pid]) > len(members[qid]):
+                pid, qid = qid, pid
+            small = members[pid]
+            for i in small:
+                ids[i] = qid
+            members[qid].extend(small)
+            members[pid] = []
+            count -= 1
+        self._count = count
+
+    def connected_many(self, ps: Batch,
+                       qs: Optional[Sequence[int]] = None) -> List[bool]:
+        """
+        Checks connectivity for every pair in a batch.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+
+        Returns:
+            List[bool]: One answer per pair, in batch order.
+
+        Raises:
+            ValueError: if any element of the batch is out of bounds.
+        """
+        ids = self._id
+        ps, qs = self._batch(ps, qs, len(ids))
+        return [ids[p] == ids[q] for p, q in zip(ps, qs)]
+
+    def size(self, p: int) -> int:
+        """
+        Returns the number of elements in the component of p.
+
+        Args:
+            p (int): The element.
+
+        Returns:
+            int: The size of p's component.
+
+        Raises:
+            ValueError: if p is out of bounds.
+        """
+        return len(self._members[self.find(p)])
+
+    def members(self, p: int) -> List[int]:
+        """
+        Returns the elements in the component of p, in O(size) time.
+
+        Args:
+            p (int): The element.
+
+        Returns:
+            List[int]: A copy of the members of p's component.
+
+        Raises:
+            ValueError: if p is out of bounds.
+        """
+        return list(self._members[self.find(p)])
+
+
+if __name__=="__main__":
+    wqf = WeightedQuickFind(5)
+    wqf.union(1,2)
+    wqf.union(0,4)
+    print(wqf.components())
+    print(wqf.is_connected(1,4))
+    print(wqf.is_connected(2,1))
+    print(sorted(wqf.members(2)))
@@ -1,4 +1,5 @@
-from c04_UF.UnionFind import UnionFind
+from typing import Callable, List, Optional, Sequence
+from c04_UF.UnionFind import Batch, UnionFind
 
 class WeightedQuickUnion(UnionFind):
     """
@@ -104,6 +105,15 @@ class WeightedQuickUnion(UnionFind):
         """
         return self._count
 
+    def max_depth(self) -> int:
+        """
+        Returns the height of the tallest tree of the forest.
+
+        Returns:
+            int: The largest number of links from an element to its root.
+        """
+        return self._forest_height(self._parent)
+
     def is_connected(self, p: int, q: int) -> bool:
         """
         Checks if elements p and q are in the same component.
@@ -121,6 +131,75 @@ class WeightedQuickUnion(UnionFind):
         if not (0 <= p < len(self._parent) and 0 <= q < len(self._parent)):
             raise ValueError(f"Elements {p} or {q} are out of bounds.")
         return self.find(p) == self.find(q)
+
+    def union_many(self, ps: Batch, qs: Optional[Sequence[int]] = None):
+        """
+        Joins the components of every pair in a batch. Bounds are checked
+        once for the whole batch instead of once per pair.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+
+        Raises:
+            ValueError: if any element of the batch is out of bounds.
+        """
+        ps, qs = self._batch(ps, qs, len(self._parent))
+        root = self._root_finder()
+        size = self._size
+        parent = self._parent
+        count = self._count
+        for p, q in zip(ps, qs):
+            rootP = root(p)
+            rootQ = root(q)
+            if rootP == rootQ:
+                continue
+            if size[rootP] < size[rootQ]:
+                parent[rootP] = rootQ
+                size[rootQ] += size[rootP]
+            else:
+                parent[rootQ] = rootP
+                size[rootP] += size[rootQ]
+            count -= 1
+        self._count = count
+
+    def connected_many(self, ps: Batch,
+                       qs: Optional[Sequence[int]] = None) -> List[bool]:
+        """
+        Checks connectivity for every pair in a batch.
+
+        Args:
+            ps: An iterable of (p, q) pairs, or the first elements of each
+                pair when qs is given.
+            qs: Optional buffer with the second elements of each pair.
+
+        Returns:
+            List[bool]: One answer per pair, in batch order.
+
+        Raises:
+            ValueError: if any element of the batch is out of bounds.
+        """
+        ps, qs = self._batch(ps, qs, len(self._parent))
+        root = self._root_finder()
+        return [root(p) == root(q) for p, q in zip(ps, qs)]
+
+    def _root_finder(self) -> Callable[[int], int]:
+        """
+        Returns an unchecked version of `find` bound to the parent list,
+        for use in batch operations that have already validated bounds.
+        """
+        parent = self._parent
+
+        def root(p: int) -> int:
+            r = p
+            while r != parent[r]:
+                r = parent[r]
+            while p != r:
+                parent[p], p = r, parent[p]
+            return r
+
+        return root
     
 if __name__=="__main__":
     wqu = WeightedQuickUnion(5)
@@ -0,0 +1,450 @@
+# python3 -m c05_SORT.AdaptiveMergeSort
+
+import random
+from typing import List, Tuple
+
+from c05_SORT.BinaryInsertionSort import extend_sorted_run
+from c05_SORT.DecoratedSort import Key, decorated_sort
+from c05_SORT.MergeSort import MergeSort
+
+# Consecutive wins by one run after which merging switches to galloping
+MIN_GALLOP = 7
+
+
+def AdaptiveMergeSort(a: list, key: Key = None,
+                      reverse: bool = False) -> list:
+    """Sort the list a in place using a natural, TimSort-style mergesort.
+
+    The list is scanned for natural runs: ascending runs are kept and
+    strictly descending runs are reversed in place. Runs shorter than a
+    minimum length (between 32 and 64, chosen from n) are extended with
+    binary insertion sort. Runs are pushed on a stack whose lengths are
+    kept roughly balanced, and merges gallop (exponential search) when one
+    run keeps winning, so a mostly sorted list costs close to n
+    comparisons instead of n log n. The sort is stable.
+
+    Args:
+        a (list): The list of elements to be sorted.
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Sort in descending order.
+
+    Returns:
+        list: The sorted list (same list object as input).
+    """
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse, AdaptiveMergeSort)
+    n = len(a)
+    if n < 2:
+        return a
+    merger = _RunMerger(a)
+    min_run = _min_run_length(n)
+    lo = 0
+    while lo < n:
+        run = _count_run(a, lo, n)
+        if run < min_run:
+            forced = min(min_run, n - lo)
+            extend_sorted_run(a, lo, lo + forced, lo + run)
+            run = forced
+        merger.push(lo, run)
+        merger.merge_collapse()
+        lo += run
+    merger.merge_force_collapse()
+    return a
+
+
+def _min_run_length(n: int) -> int:
+    """
+    Return a minimum run length such that n / min_run is a power of two,
+    or slightly less, so the final merges stay balanced.
+    """
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def _count_run(a: list, lo: int, hi: int) -> int:
+    """
+    Return the length of the natural run starting at lo, reversing it in
+    place if it is strictly descending (strictness keeps the sort stable).
+    """
+    i = lo + 1
+    if i == hi:
+        return 1
+    if a[i] < a[lo]:
+        while i + 1 < hi and a[i + 1] < a[i]:
+            i += 1
+        a[lo:i + 1] = a[lo:i + 1][::-1]
+    else:
+        while i + 1 < hi and not a[i + 1] < a[i]:
+            i += 1
+    return i + 1 - lo
+
+
+def _gallop_left(key, seq: list, base: int, n: int, hint: int) -> int:
+    """
+    Return the leftmost k in [0, n] such that seq[base+k-1] < key <=
+    seq[base+k], searching exponentially outwards from base+hint.
+    """
+    last, ofs = 0, 1
+    if seq[base + hint] < key:
+        max_ofs = n - hint
+        while ofs < max_ofs and seq[base + hint + ofs] < key:
+            last, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last, ofs = last + hint, ofs + hint
+    else:
+        max_ofs = hint + 1
+        while ofs < max_ofs and not seq[base + hint - ofs] < key:
+            last, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last, ofs = hint - ofs, hint - last
+    # Now seq[base+last] < key <= seq[base+ofs]; finish by binary search
+    last += 1
+    while last < ofs:
+        mid = last + ((ofs - last) >> 1)
+        if seq[base + mid] < key:
+            last = mid + 1
+        else:
+            ofs = mid
+    return ofs
+
+
+def _gallop_right(key, seq: list, base: int, n: int, hint: int) -> int:
+    """
+    Return the rightmost k in [0, n] such that seq[base+k-1] <= key <
+    seq[base+k], searching exponentially outwards from base+hint.
+    """
+    last, ofs = 0, 1
+    if key < seq[base + hint]:
+        max_ofs = hint + 1
+        while ofs < max_ofs and key < seq[base + hint - ofs]:
+            last, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last, ofs = hint - ofs, hint - last
+    else:
+        max_ofs = n - hint
+        while ofs < max_ofs and not key < seq[base + hint + ofs]:
+            last, ofs = ofs, (ofs << 1) + 1
+        ofs = min(ofs, max_ofs)
+        last, ofs = last + hint, ofs + hint
+    # Now seq[base+last] <= key < seq[base+ofs]; finish by binary search
+    last += 1
+    while last < ofs:
+        mid = last + ((ofs - last) >> 1)
+        if key < seq[base + mid]:
+            ofs = mid
+        else:
+            last = mid + 1
+    return ofs
+
+
+class _RunMerger:
+    """The stack of pending runs of one AdaptiveMergeSort call."""
+
+    def __init__(self, a: list):
+        self._a = a
+        self._runs: List[Tuple[int, int]] = []  # (base, length) pairs
+        self._min_gallop = MIN_GALLOP
+
+    def push(self, base: int, length: int):
+        """Push a sorted run a[base:base+length] on the stack."""
+        self._runs.append((base, length))
+
+    def merge_collapse(self):
+        """
+        Merge runs until, for the three topmost lengths A, B, C (C on top),
+        A > B + C and B > C, which keeps the stack O(log n) deep.
+        """
+        runs = self._runs
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if (i > 0 and runs[i - 1][1] <= runs[i][1] + runs[i + 1][1]) \
+                    or (i > 1
+                        and runs[i - 2][1] <= runs[i - 1][1] + runs[i][1]):
+                if runs[i - 1][1] < runs[i + 1][1]:
+                    i -= 1
+            elif runs[i][1] > runs[i + 1][1]:
+                break
+            self._merge_at(i)
+
+    def merge_force_collapse(self):
+        """Merge all remaining runs into one."""
+        runs = self._runs
+        while len(runs) > 1:
+            i = len(runs) - 2
+            if i > 0 and runs[i - 1][1] < runs[i + 1][1]:
+                i -= 1
+            self._merge_at(i)
+
+    def _merge_at(self, i: int):
+        """Merge the adjacent runs at stack positions i and i + 1."""
+        a = self._a
+        base1, len1 = self._runs[i]
+        base2, len2 = self._runs[i + 1]
+        self._runs[i] = (base1, len1 + len2)
+        del self._runs[i + 1]
+
+        # Elements of run 1 not greater than run 2's first are in place
+        k = _gallop_right(a[base2], a, base1, len1, 0)
+        base1 += k
+        len1 -= k
+        if len1 == 0:
+            return
+        # Elements of run 2 not less than run 1's last are in place
+        len2 = _gallop_left(a[base1 + len1 - 1], a, base2, len2, len2 - 1)
+        if len2 == 0:
+            return
+        if len1 <= len2:
+            self._merge_lo(base1, len1, base2, len2)
+        else:
+            self._merge_hi(base1, len1, base2, len2)
+
+    def _merge_lo(self, base1: int, len1: int, base2: int, len2: int):
+        """
+        Merge a[base1:base1+len1] with the following run of len2 >= len1
+        elements, copying the first run aside and filling from the left.
+        Requires a[base2] < a[base1] and a[base1+len1-1] > every element
+        of the second run.
+        """
+        a = self._a
+        tmp = a[base1:base1 + len1]
+        i, j, dest = 0, base2, base1
+        a[dest] = a[j]
+        dest += 1
+        j += 1
+        len2 -= 1
+        min_gallop = self._min_gallop
+        while len2 and len1 > 1:
+            wins1 = wins2 = 0
+            # One element at a time until a run wins min_gallop in a row
+            while len2 and len1 > 1 and wins1 < min_gallop \
+                    and wins2 < min_gallop:
+                if a[j] < tmp[i]:
+                    a[dest] = a[j]
+                    j += 1
+                    len2 -= 1
+                    wins2 += 1
+                    wins1 = 0
+                else:
+                    a[dest] = tmp[i]
+                    i += 1
+                    len1 -= 1
+                    wins1 += 1
+                    wins2 = 0
+                dest += 1
+            if not len2 or len1 == 1:
+                break
+            # Galloping: copy whole blocks while they stay long
+            min_gallop += 1
+            while len2 and len1 > 1:
+                min_gallop -= min_gallop > 1
+                wins1 = _gallop_right(a[j], tmp, i, len1, 0)
+                if wins1:
+                    a[dest:dest + wins1] = tmp[i:i + wins1]
+                    dest += wins1
+                    i += wins1
+                    len1 -= wins1
+                    if len1 == 1:
+                        break
+                a[dest] = a[j]
+                dest += 1
+                j += 1
+                len2 -= 1
+                if not len2:
+                    break
+                wins2 = _gallop_left(tmp[i], a, j, len2, 0)
+                if wins2:
+                    a[dest:dest + wins2] = a[j:j + wins2]
+                    dest += wins2
+                    j += wins2
+                    len2 -= wins2
+                    if not len2:
+                        break
+                a[dest] = tmp[i]
+                dest += 1
+                i += 1
+                len1 -= 1
+                if wins1 < MIN_GALLOP and wins2 < MIN_GALLOP:
+                    min_gallop += 1  # Galloping did not pay off
+                    break
+        self._min_gallop = max(min_gallop, 1)
+        # Either run 2 is used up, or only run 1's largest element is left
+        a[dest:dest + len2] = a[j:j + len2]
+        a[dest + len2:dest + len2 + len1] = tmp[i:i + len1]
+
+    def _merge_hi(self, base1: int, len1: int, base2: int, len2: int):
+        """
+        Merge a[base1:base1+len1] (len1 > len2) with the following run of
+        len2 elements, copying the second run aside and filling from the
+        right. Same requirements as `_merge_lo`.
+        """
+        a = self._a
+        tmp = a[base2:base2 + len2]
+        i, j, dest = base1 + len1 - 1, len2 - 1, base2 + len2 - 1
+        a[dest] = a[i]
+        dest -= 1
+        i -= 1
+        len1 -= 1
+        min_gallop = self._min_gallop
+        while len1 and len2 > 1:
+            wins1 = wins2 = 0
+            while len1 and len2 > 1 and wins1 < min_gallop \
+                    and wins2 < min_gallop:
+                if tmp[j] < a[i]:
+                    a[dest] = a[i]
+                    i -= 1
+                    len1 -= 1
+                    wins1 += 1
+                    wins2 = 0
+                else:
+                    a[dest] = tmp[j]
+                    j -= 1
+                    len2 -= 1
+                    wins2 += 1
+                    wins1 = 0
+                dest -= 1
+            if not len1 or len2 == 1:
+                break
+            min_gallop += 1
+            while len1 and len2 > 1:
+                min_gallop -= min_gallop > 1
+                wins1 = len1 - _gallop_right(tmp[j], a, base1, len1,
+                                             len1 - 1)
+                if wins1:
+                    dest -= wins1
+                    i -= wins1
+                    len1 -= wins1
+                    a[dest + 1:dest + 1 + wins1] = a[i + 1:i + 1 + wins1]
+                    if not len1:
+                        break
+                a[dest] = tmp[j]
+                dest -= 1
+                j -= 1
+                len2 -= 1
+                if len2 == 1:
+                    break
+                wins2 = len2 - _gallop_left(a[i], tmp, 0, len2, len2 - 1)
+                if wins2:
+                    dest -= wins2
+                    j -= wins2
+                    len2 -= wins2
+                    a[dest + 1:dest + 1 + wins2] = tmp[j + 1:j + 1 + wins2]
+                    if len2 <= 1:
+                        break
+                a[dest] = a[i]
+                dest -= 1
+                i -= 1
+                len1 -= 1
+                if wins1 < MIN_GALLOP and wins2 < MIN_GALLOP:
+                    min_gallop += 1
+                    break
+        self._min_gallop = max(min_gallop, 1)
+        # Either run 1 is used up, or only run 2's smallest element is left
+        a[dest - len1 + 1:dest + 1] = a[base1:base1 + len1]
+        dest -= len1
+        a[dest - len2 + 1:dest + 1] = tmp[:len2]
+
+
+class _Counted:
+    """A value that counts how often it is compared."""
+
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other: "_Counted") -> bool:
+        _Counted.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: "_Counted") -> bool:
+        _Counted.comparisons += 1
+        return self.value <= other.value
+
+
+def _test_AdaptiveMergeSort():
+    rng = random.Random(14)
+    test_cases = [
+        [5, 3, 8, 6, 2, 7, 4, 1],
+        [],
+        [1],
+        [2, 1],
+        [3, 3, 3],
+        list(range(1000)),
+        list(range(1000, 0, -1)),
+        [rng.randrange(5) for _ in range(2000)],
+        [rng.random() for _ in range(3001)],
+        list(range(500)) + list(range(250)) + list(range(800, 0, -1)),
+        [i // 3 for i in range(1000)][::-1] + [rng.randrange(9)] * 200,
+    ]
+    for _ in range(200):
+        n = rng.randrange(300)
+        data = sorted(rng.randrange(50) for _ in range(n))
+        for _ in range(rng.randrange(5)):
+            if data:
+                data[rng.randrange(n)] = rng.randrange(50)
+        test_cases.append(data)
+    originals = [list(input_list) for input_list in test_cases]
+    for i, input_list in enumerate(test_cases):
+        expected = sorted(input_list)
+        result = AdaptiveMergeSort(input_list)
+        assert result == expected, f"Test case {i+1} failed"
+        assert result is input_list, f"Test case {i+1} did not sort in place"
+
+    # Stability: equal keys keep their input order, including descending
+    # runs and galloping merges
+    records = sorted((rng.randrange(20), i) for i in range(3000))
+    records = records[1500:] + [(rng.randrange(20), i)
+                                for i in range(3000, 3500)] + records[:1500]
+    keys = [_Counted((k, 0)) for k, _ in records]
+    for key, record in zip(keys, records):
+        key.record = record
+    result = [k.record for k in AdaptiveMergeSort(keys)]
+    assert result == sorted(records, key=lambda r: r[0]), \
+        "AdaptiveMergeSort is not stable"
+    for reverse in (False, True):
+        expected = sorted(records, key=lambda r: r[0], reverse=reverse)
+        result = AdaptiveMergeSort(list(records), key=lambda r: r[0],
+                                   reverse=reverse)
+        assert result == expected, \
+            f"Keyed AdaptiveMergeSort is not stable (reverse={reverse})"
+    for i, input_list in enumerate(originals):
+        records = [(x, j) for j, x in enumerate(input_list)]
+        result = AdaptiveMergeSort(records, key=lambda r: r[0])
+        assert result == sorted(records), f"Keyed test case {i+1} failed"
+
+    print("All AdaptiveMergeSort tests passed.")
+
+
+def _benchmark(n: int = 20000):
+    """Count comparisons against MergeSort on nearly sorted inputs."""
+    rng = random.Random(42)
+    swapped = list(range(n))
+    for _ in range(n // 100):
+        i, j = rng.randrange(n), rng.randrange(n)
+        swapped[i], swapped[j] = swapped[j], swapped[i]
+    inputs = {
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "1% swapped": swapped,
+        "sorted + 1% appended": list(range(n)) + [rng.randrange(n)
+                                                  for _ in range(n // 100)],
+        "random": [rng.randrange(n) for _ in range(n)],
+    }
+    print(f"n = {n}, comparisons")
+    for name, data in inputs.items():
+        counts = []
+        for func in (AdaptiveMergeSort, MergeSort):
+            _Counted.comparisons = 0
+            func([_Counted(x) for x in data])
+            counts.append(_Counted.comparisons)
+        saved = 1 - counts[0] / counts[1]
+        print(f"{name:22s}: AdaptiveMergeSort {counts[0]:8d}, "
+              f"MergeSort {counts[1]:8d}, saved {saved:6.1%}")
+
+
+if __name__ == "__main__":
+    _test_AdaptiveMergeSort()
+    _benchmark()
@@ -0,0 +1,185 @@
+# python3 -m c05_SORT.BinaryInsertionSort
+
+import random
+import time
+from bisect import bisect_right
+from typing import Any, Optional
+
+from c05_SORT.DecoratedSort import Key, decorated_sort
+from c05_SORT.InsertionSort import InsertionSort
+
+
+def BinaryInsertionSort(a: list, lo: int = 0, hi: Optional[int] = None,
+                        key: Key = None, reverse: bool = False) -> list:
+    """Sort the list a in place using binary insertion sort and return the same list.
+
+    As InsertionSort, each element is inserted into the sorted prefix
+    before it, but its position is found by binary search (`bisect`),
+    with O(log i) comparisons instead of up to i, and the elements after
+    it are shifted one slot with a single slice assignment instead of
+    one at a time. An element not smaller than its predecessor stays put
+    after one comparison, so nearly sorted input costs about n
+    comparisons. Moves are still O(n^2) in the worst case, but they are
+    block copies. The sort is stable: elements are inserted after equal
+    ones.
+
+    Args:
+        a (list): The list of elements to be sorted.
+        lo (int): First index of the range to sort (default 0).
+        hi (int, optional): One past the last index of the range to sort
+            (default len(a)). Elements outside [lo, hi) are not touched.
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Sort in descending order.
+
+    Returns:
+        list: The sorted list (same list object as input).
+    """
+    if hi is None:
+        hi = len(a)
+    if key is not None or reverse:
+        a[lo:hi] = decorated_sort(a[lo:hi], key, reverse,
+                                  BinaryInsertionSort)
+        return a
+    extend_sorted_run(a, lo, hi, lo + 1)
+    return a
+
+
+def Insort(a: list, x: Any, key: Key = None) -> int:
+    """Insert x into the sorted list a, keeping it sorted.
+
+    The position is found by binary search and the list makes room with
+    a single block move, so a stream of inserts keeps a sorted without
+    ever sorting it again. x goes after the elements equal to it, so
+    inserting one by one is stable.
+
+    Args:
+        a (list): A list sorted in ascending order (by key, if given).
+        x (Any): The element to insert.
+        key (callable, optional): The key a is sorted by; it is called on
+            x and on the O(log n) elements the search looks at.
+
+    Returns:
+        int: The index where x was inserted.
+    """
+    if key is None:
+        i = bisect_right(a, x)
+    else:
+        i = bisect_right(a, key(x), key=key)
+    a.insert(i, x)
+    return i
+
+
+def extend_sorted_run(a: list, lo: int, hi: int, start: int):
+    """
+    Sort a[lo:hi] given that a[lo:start] is already sorted, finding each
+    insertion point by binary search and shifting with a slice copy.
+
+    This is how AdaptiveMergeSort extends a short natural run to its
+    minimum run length. The sort is stable.
+
+    Args:
+        a (list): The list, sorted in place.
+        lo (int): First index of the range to sort.
+        hi (int): One past the last index of the range to sort.
+        start (int): End of the sorted prefix a[lo:start].
+    """
+    for i in range(max(start, lo + 1), hi):
+        pivot = a[i]
+        if not pivot < a[i - 1]:
+            continue  # Already in place
+        left = bisect_right(a, pivot, lo, i - 1)
+        a[left + 1:i + 1] = a[left:i]
+        a[left] = pivot
+
+
+def _test_BinaryInsertionSort():
+    rng = random.Random(24)
+    test_cases = [
+        [5, 3, 8, 6, 2, 7, 4, 1],
+        [],
+        [1],
+        [2, 1],
+        [3, 3, 3],
+        [10, -1, 2, 5, 0],
+        list(range(100)),
+        list(range(100, 0, -1)),
+        [rng.randrange(10) for _ in range(500)],
+        [rng.random() for _ in range(500)],
+    ]
+    for i, input_list in enumerate(test_cases):
+        result = BinaryInsertionSort(list(input_list))
+        assert result == sorted(input_list), f"Test case {i+1} failed"
+
+    data = [rng.randrange(100) for _ in range(300)]
+    copy = list(data)
+    assert BinaryInsertionSort(copy, 100, 200) is copy, "Not in place"
+    assert copy[:100] == data[:100] and copy[200:] == data[200:], \
+        "Elements outside the range moved"
+    assert copy[100:200] == sorted(data[100:200]), "Range test failed"
+
+    records = [(rng.randrange(10), i) for i in range(500)]
+    for reverse in (False, True):
+        result = BinaryInsertionSort(list(records), key=lambda r: r[0],
+                                     reverse=reverse)
+        assert result == sorted(records, key=lambda r: r[0],
+                                reverse=reverse), \
+            f"Keyed test failed (reverse {reverse})"
+
+    stream = []
+    for x in data:
+        i = Insort(stream, x)
+        assert stream[i] is x, "Insort returned the wrong index"
+    assert stream == sorted(data), "Insort test failed"
+    stream = []
+    for r in records:
+        Insort(stream, r, key=lambda r: r[0])
+    assert stream == sorted(records, key=lambda r: r[0]), \
+        "Keyed Insort is not stable"
+
+    print("All BinaryInsertionSort tests passed.")
+
+
+def _benchmark():
+    """Compare with InsertionSort on short, nearly sorted and long lists."""
+    rng = random.Random(42)
+    inputs = {
+        "1000 lists of 32": [[rng.random() for _ in range(32)]
+                             for _ in range(1000)],
+        "1000 lists of 64": [[rng.random() for _ in range(64)]
+                             for _ in range(1000)],
+    }
+    nearly = list(range(20000))
+    for _ in range(100):
+        i, j = rng.randrange(20000), rng.randrange(20000)
+        nearly[i], nearly[j] = nearly[j], nearly[i]
+    inputs["nearly sorted 20000"] = [nearly]
+    inputs["random 5000"] = [[rng.random() for _ in range(5000)]]
+    for input_name, lists in inputs.items():
+        for name, func in (("InsertionSort", InsertionSort),
+                           ("BinaryInsertionSort", BinaryInsertionSort)):
+            copies = [list(a) for a in lists]
+            start = time.perf_counter()
+            for a in copies:
+                func(a)
+            elapsed = time.perf_counter() - start
+            print(f"{input_name:20s} {name:19s}: {elapsed:.4f} s")
+
+    stream = [rng.random() for _ in range(20000)]
+    start = time.perf_counter()
+    a = []
+    for x in stream:
+        Insort(a, x)
+    print(f"{len(stream)} inserts with Insort: "
+          f"{time.perf_counter() - start:.4f} s")
+    start = time.perf_counter()
+    a = []
+    for x in stream:
+        a.append(x)
+        a.sort()
+    print(f"{len(stream)} inserts with append and sort: "
+          f"{time.perf_counter() - start:.4f} s")
+
+
+if __name__ == "__main__":
+    _test_BinaryInsertionSort()
+    _benchmark()
@@ -0,0 +1,153 @@
+# python3 -m c05_SORT.BottomUpMergeSort
+
+import random
+import time
+import tracemalloc
+
+from c05_SORT.DecoratedSort import Key, decorated_sort
+from c05_SORT.InsertionSort import InsertionSort
+from c05_SORT.MergeSort import MergeSort
+
+# Length of the runs that are sorted with InsertionSort before merging
+RUN = 32
+
+
+def BottomUpMergeSort(a: list, key: Key = None,
+                      reverse: bool = False) -> list:
+    """Sort the list a using bottom-up mergesort and return the same list.
+
+    Runs of RUN elements are first sorted with InsertionSort, then merged
+    pairwise in passes of doubling width. A single auxiliary list is
+    allocated up front, and each pass merges from one buffer into the
+    other, so the two swap roles instead of copying back. Merging two runs
+    that are already in order (a[mid-1] <= a[mid]) is replaced by a block
+    copy. The sort is stable.
+
+    Block copies, including the tail of a merge, are slice assignments,
+    so each one builds a temporary list of the elements it copies, freed
+    right away: peak extra memory is the buffer plus the largest block,
+    up to n elements on sorted input. Copying element by element would
+    avoid this, but it makes sorted input about four times slower.
+
+    Args:
+        a (list): The list of elements to be sorted.
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Sort in descending order.
+
+    Returns:
+        list: The sorted list (same list object as input).
+    """
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse, BottomUpMergeSort)
+    n = len(a)
+    for lo in range(0, n, RUN):
+        InsertionSort(a, lo, min(lo + RUN, n))
+    if n <= RUN:
+        return a
+
+    # a.copy() gives the buffer the type of a, e.g. an instrumented list
+    src, dst = a, a.copy()
+    width = RUN
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid == hi or not src[mid] < src[mid - 1]:
+                dst[lo:hi] = src[lo:hi]
+            else:
+                _merge(src, dst, lo, mid, hi)
+        src, dst = dst, src
+        width *= 2
+    if src is not a:
+        a[:] = src
+    return a
+
+
+def _merge(src: list, dst: list, lo: int, mid: int, hi: int):
+    """Merge the sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi]."""
+    i, j, k = lo, mid, lo
+    left, right = src[i], src[j]
+    while True:
+        if right < left:
+            dst[k] = right
+            k += 1
+            j += 1
+            if j == hi:
+                dst[k:hi] = src[i:mid]
+                return
+            right = src[j]
+        else:
+            dst[k] = left
+            k += 1
+            i += 1
+            if i == mid:
+                dst[k:hi] = src[j:hi]
+                return
+            left = src[i]
+
+
+def _test_BottomUpMergeSort():
+    rng = random.Random(13)
+    test_cases = [
+        [5, 3, 8, 6, 2, 7, 4, 1],
+        [],
+        [1],
+        [3, 3, 3],
+        list(range(100)),
+        list(range(100, 0, -1)),
+        [rng.randrange(10) for _ in range(1000)],
+        [rng.random() for _ in range(1025)],
+        [rng.randrange(1000) for _ in range(4096)],
+    ]
+    for i, input_list in enumerate(test_cases):
+        expected = sorted(input_list)
+        result = BottomUpMergeSort(input_list)
+        assert result == expected, f"Test case {i+1} failed: got {result}"
+        assert result is input_list, f"Test case {i+1} did not sort in place"
+
+    # Stability: equal keys keep their input order
+    records = [(rng.randrange(5), i) for i in range(500)]
+
+    class ByFirstField:
+        def __init__(self, record):
+            self.record = record
+
+        def __lt__(self, other):
+            return self.record[0] < other.record[0]
+
+    result = [k.record for k in BottomUpMergeSort(
+        [ByFirstField(r) for r in records])]
+    assert result == sorted(records), "BottomUpMergeSort is not stable"
+    result = BottomUpMergeSort(list(records), key=lambda r: r[0])
+    assert result == sorted(records, key=lambda r: r[0]), \
+        "Keyed BottomUpMergeSort is not stable"
+    result = BottomUpMergeSort(list(records), key=lambda r: r[0],
+                               reverse=True)
+    assert result == sorted(records, key=lambda r: r[0], reverse=True), \
+        "Reversed BottomUpMergeSort is not stable"
+
+    print("All BottomUpMergeSort tests passed.")
+
+
+def _benchmark(n: int = 100000):
+    """Compare time and peak traced memory with the recursive MergeSort."""
+    rng = random.Random(42)
+    data = [rng.randrange(n) for _ in range(n)]
+    print(f"n = {n}")
+    for name, func in [("BottomUpMergeSort", BottomUpMergeSort),
+                       ("MergeSort", MergeSort)]:
+        copy = list(data)
+        start = time.perf_counter()
+        func(copy)
+        elapsed = time.perf_counter() - start
+        copy = list(data)
+        tracemalloc.start()
+        func(copy)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:18s}: {elapsed:.4f} s, peak {peak / 2 ** 20:.2f} MiB")
+
+
+if __name__ == "__main__":
+    _test_BottomUpMergeSort()
+    _benchmark()
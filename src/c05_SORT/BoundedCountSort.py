@@ -0,0 +1,213 @@
+# python3 -m c05_SORT.BoundedCountSort
+
+import random
+import time
+import tracemalloc
+from array import array
+from collections import Counter
+from functools import partial
+from itertools import accumulate
+
+from c05_SORT.CountSort import CountSort
+from c05_SORT.DecoratedSort import Key, decorated_sort
+from c05_SORT.LSDRadixSort import LSDRadixSort, lsd_radix_sort_parallel
+
+# Dense counting is used while max - min + 1 <= MAX_RANGE_FACTOR * n
+MAX_RANGE_FACTOR = 4.0
+# Ranges up to this size are always counted densely, however small n is
+MIN_DENSE_RANGE = 1024
+
+
+def BoundedCountSort(a: list, key: Key = None, reverse: bool = False,
+                     max_range_factor: float = MAX_RANGE_FACTOR) -> list:
+    """Sort a list of integers with a counting sort of bounded memory.
+
+    The key range max - min + 1 is measured first. While it is at most
+    max_range_factor * n (or MIN_DENSE_RANGE), keys are counted in an
+    `array` of machine integers, indexed by key - min. Otherwise, e.g.
+    when a single outlier such as 10**9 stretches the range, only the
+    distinct keys are counted in a hash table, and those are ordered with
+    LSDRadixSort; if most keys are distinct, the whole list is radix
+    sorted instead. Either way the memory used is O(n) rather than
+    O(max - min). The sort is stable.
+
+    Args:
+        a (list): The list of integers to be sorted (any elements, if key
+            maps them to integers).
+        key (callable, optional): Sort by the integer key(x), computed
+            once per element. The records, e.g. (key, payload) pairs, are
+            moved to the output, not just the keys.
+        reverse (bool): Sort in descending order.
+        max_range_factor (float): Largest ratio of key range to n that is
+            counted densely.
+
+    Returns:
+        list: The sorted list (a new list).
+
+    Raises:
+        ValueError: If max_range_factor is not positive.
+    """
+    if max_range_factor <= 0:
+        raise ValueError(
+            f"Range factor {max_range_factor} is not positive.")
+    if key is not None or reverse:
+        return decorated_sort(
+            a, key, reverse,
+            partial(BoundedCountSort, max_range_factor=max_range_factor),
+            partial(_bounded_count_sort_keyed,
+                    max_range_factor=max_range_factor))
+    return _bounded_count_sort_keyed(a, a, max_range_factor)
+
+
+def _bounded_count_sort_keyed(
+        keys: list, values: list,
+        max_range_factor: float = MAX_RANGE_FACTOR) -> list:
+    """Return values ordered by the parallel list of integer keys."""
+    n = len(keys)
+    if n == 0:
+        return list(values)
+    lo = min(keys)
+    size = max(keys) - lo + 1
+    if size <= max(max_range_factor * n, MIN_DENSE_RANGE):
+        return _dense_count_sort(keys, values, lo, size)
+    return _sparse_count_sort(keys, values)
+
+
+def _count_typecode(n: int) -> str:
+    """Return the smallest unsigned array typecode that can hold n."""
+    for typecode in ('I', 'L', 'Q'):
+        if n < 1 << (8 * array(typecode).itemsize):
+            return typecode
+    raise OverflowError(f"Cannot count {n} elements in an array.")
+
+
+def _dense_count_sort(keys: list, values: list, lo: int, size: int) -> list:
+    """Counting sort with one array counter per key in [lo, lo + size)."""
+    typecode = _count_typecode(len(keys))
+    count = array(typecode, [0]) * size
+    for k in keys:
+        count[k - lo] += 1
+    # start[k - lo] is the next slot for key k
+    start = array(typecode, accumulate(count, initial=0))
+    del count
+    output = [None] * len(values)
+    for k, v in zip(keys, values):
+        i = start[k - lo]
+        start[k - lo] = i + 1
+        output[i] = v
+    return output
+
+
+def _sparse_count_sort(keys: list, values: list) -> list:
+    """
+    Counting sort with one hash table entry per distinct key, or radix
+    sort if most keys are distinct and counting would not pay off.
+    """
+    count = Counter(keys)
+    if len(count) > len(keys) // 2:
+        del count
+        return lsd_radix_sort_parallel(keys, list(values))
+    start = {}
+    total = 0
+    for k in LSDRadixSort(list(count)):
+        start[k] = total
+        total += count[k]
+    del count
+    output = [None] * len(values)
+    for k, v in zip(keys, values):
+        i = start[k]
+        start[k] = i + 1
+        output[i] = v
+    return output
+
+
+def _test_BoundedCountSort():
+    rng = random.Random(18)
+    test_cases = [
+        [5, 3, 8, 6, 2, 7, 4, 1],
+        [],
+        [1],
+        [3, 3, 3],
+        [10, -1, 2, 5, 0],
+        [1, 10 ** 9, 5, 3, 1],
+        [-10 ** 12, 0, 10 ** 12, 7, 7],
+        [rng.randrange(100) for _ in range(5000)],
+        [rng.randrange(-10 ** 9, 10 ** 9) for _ in range(5000)],
+        [rng.randrange(50) for _ in range(3000)] + [2 ** 40],
+    ]
+    for i, input_list in enumerate(test_cases):
+        expected = sorted(input_list)
+        for factor in (0.5, 4.0, 1000.0):
+            result = BoundedCountSort(list(input_list),
+                                      max_range_factor=factor)
+            assert result == expected, \
+                f"Test case {i+1} failed with factor {factor}"
+
+    empty = []
+    for key in (None, abs):
+        assert BoundedCountSort(empty, key=key) is not empty, \
+            "Empty input was returned instead of a new list"
+
+    # An outlier must not allocate a counter per value in the range
+    data = [rng.randrange(1000) for _ in range(1000)] + [10 ** 9]
+    tracemalloc.start()
+    BoundedCountSort(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < 2 ** 20, f"Outlier used {peak} bytes"
+
+    # Records with a payload, stable in both directions and both modes
+    for spread in (10, 10 ** 9):
+        records = [(rng.randrange(spread), i) for i in range(2000)]
+        records += [(rng.choice(records)[0], i) for i in range(2000, 3000)]
+        for reverse in (False, True):
+            result = BoundedCountSort(records, key=lambda r: r[0],
+                                      reverse=reverse)
+            assert result == sorted(records, key=lambda r: r[0],
+                                    reverse=reverse), \
+                f"Records test failed (spread {spread}, reverse {reverse})"
+
+    try:
+        BoundedCountSort([1], max_range_factor=0)
+        assert False, "A zero range factor was accepted"
+    except ValueError:
+        pass
+
+    print("All BoundedCountSort tests passed.")
+
+
+def _benchmark(n: int = 200000):
+    """Compare time and peak traced memory with CountSort and LSDRadixSort."""
+    rng = random.Random(42)
+    dense = [rng.randrange(n) for _ in range(n)]
+    inputs = {
+        "dense": dense,
+        "dense + outlier": dense[:-1] + [10 ** 9],
+        "few distinct": [rng.randrange(100) * 10 ** 7 for _ in range(n)],
+    }
+    algorithms = [
+        ("BoundedCountSort", BoundedCountSort),
+        ("CountSort", CountSort),
+        ("LSDRadixSort", LSDRadixSort),
+    ]
+    print(f"n = {n}")
+    for input_name, data in inputs.items():
+        for name, func in algorithms:
+            if name == "CountSort" and max(data) - min(data) > 100 * n:
+                print(f"{input_name:15s} {name:16s}: skipped, would count "
+                      f"{max(data) - min(data) + 1} values")
+                continue
+            start = time.perf_counter()
+            func(list(data))
+            elapsed = time.perf_counter() - start
+            tracemalloc.start()
+            func(list(data))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{input_name:15s} {name:16s}: {elapsed:.3f} s, "
+                  f"peak {peak / 2 ** 20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    _test_BoundedCountSort()
+    _benchmark()
@@ -1,33 +1,61 @@
+from typing import Optional
 
+from c05_SORT.DecoratedSort import Key, decorated_sort
+from c05_SORT.NumericBackend import numeric_sort
 
-def CountSort(a: list) -> list:
+
+def CountSort(a: list, key: Key = None, reverse: bool = False) -> list:
     """Sort the list a using the count sort algorithm and return the sorted list.
 
+    The sort is stable: elements are placed from the last one backwards
+    into the slots counted for their key.
+
+    A large `array`, `memoryview` or NumPy array of numbers is sorted with
+    NumPy instead, if it is installed (see NumericBackend).
+
     Args:
-        a (list): The list of elements to be sorted.
+        a (list): The list of elements to be sorted (integers, unless key
+            maps them to integers).
+        key (callable, optional): Sort by the integer key(x), computed
+            once per element. The records themselves are moved to the
+            output, not just the keys.
+        reverse (bool): Sort in descending order.
 
     Returns:
         list: The sorted list.
     """
-    if len(a) == 0:
-        return a
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse, CountSort, _count_sort)
+    vectorized = numeric_sort(a, "count")
+    if vectorized is not None:
+        return vectorized
+    return _count_sort(a)
 
-    max_val = max(a)
-    min_val = min(a)
-    range_of_elements = max_val - min_val + 1
 
-    count = [0] * range_of_elements
-    output = [0] * len(a)
+def _count_sort(keys: list, values: Optional[list] = None) -> list:
+    """
+    Return values ordered by the parallel list of integer keys, or the
+    sorted keys themselves if values is None.
+    """
+    if values is None:
+        values = keys
+    if len(keys) == 0:
+        return list(values)
+
+    min_val = min(keys)
+    count = [0] * (max(keys) - min_val + 1)
+    output = [None] * len(values)
 
-    for number in a:
-        count[number - min_val] += 1
+    for k in keys:
+        count[k - min_val] += 1
 
     for i in range(1, len(count)):
         count[i] += count[i - 1]
 
-    for number in reversed(a):
-        output[count[number - min_val] - 1] = number
-        count[number - min_val] -= 1
+    for i in range(len(keys) - 1, -1, -1):
+        index = keys[i] - min_val
+        count[index] -= 1
+        output[count[index]] = values[i]
 
     return output
 
@@ -47,6 +75,14 @@ def _test_CountSort():
         result = CountSort(input_list)
         assert result == expected, f"Test case {i+1} failed: expected {expected}, got {result}"
 
+    records = [("c", 3), ("a", 1), ("b", 3), ("d", -2), ("e", 1)]
+    result = CountSort(records, key=lambda r: r[1])
+    assert result == [("d", -2), ("a", 1), ("e", 1), ("c", 3), ("b", 3)], \
+        f"Keyed test failed: got {result}"
+    result = CountSort(records, key=lambda r: r[1], reverse=True)
+    assert result == [("c", 3), ("b", 3), ("a", 1), ("e", 1), ("d", -2)], \
+        f"Reversed keyed test failed: got {result}"
+
     print("All CountSort tests passed.")
 
 
@@ -0,0 +1,87 @@
+# Shared key= / reverse= support for the sorting algorithms of c05_SORT
+
+from typing import Any, Callable, Optional
+
+Key = Optional[Callable[[Any], Any]]
+
+
+def decorated_sort(a: list, key: Key, reverse: bool,
+                   plain_sort: Callable[[list], list],
+                   keyed_sort: Optional[Callable[[list, list], list]] = None
+                   ) -> list:
+    """Sort a by key(x), optionally descending, with a given algorithm.
+
+    This is decorate-sort-undecorate: every key is computed exactly once.
+    Comparison sorts then sort the (key, index) pairs of the elements
+    with their own core, plain_sort, and the elements are gathered in the
+    order of the sorted indices. Ties between equal keys are broken by
+    index, so the elements themselves are never compared and every keyed
+    comparison sort is stable, even one that is not stable on plain
+    input. The price is that each comparison of the core compares two
+    tuples, which costs more than comparing two keys. Distribution
+    sorts, which compute digits or counts of the keys instead of
+    comparing them, pass their core as keyed_sort: `keyed_sort(keys, a)`
+    sorts the list of keys and permutes a alike.
+
+    Descending order is obtained by reversing the input, sorting
+    ascending and reversing the result. For a stable algorithm this keeps
+    equal elements in their input order, exactly as
+    `sorted(a, key=key, reverse=True)` does.
+
+    Args:
+        a (list): The list of elements to be sorted.
+        key (callable, optional): Function of one element returning the
+            value to compare; None compares the elements themselves.
+        reverse (bool): Sort in descending order.
+        plain_sort (callable): The algorithm without key, used when key
+            is None and, for comparison sorts, on the (key, index) pairs.
+        keyed_sort (callable, optional): The algorithm on parallel lists:
+            sorts its first argument, permutes the second one alike and
+            returns the permuted values (either the second argument or a
+            new list). Needed when the keys cannot be paired, e.g. for
+            sorts on the digits of integer or string keys.
+
+    Returns:
+        list: The sorted list; the same object as a for in-place
+        algorithms, a new list otherwise.
+    """
+    if reverse:
+        a.reverse()
+    if key is None:
+        result = plain_sort(a)
+    elif keyed_sort is not None:
+        result = keyed_sort([key(x) for x in a], a)
+    else:
+        pairs = [(key(x), i) for i, x in enumerate(a)]
+        result = plain_sort(pairs)
+        values = [a[i] for _, i in result]
+        if result is pairs:
+            a[:] = values  # In-place algorithms sort a itself
+            result = a
+        else:
+            result = values
+    if reverse:
+        if result is not a:
+            a.reverse()  # Out-of-place algorithms leave the input as it was
+        result.reverse()
+    return result
+
+
+def sort_parallel(keys: list, values: list, lo: int, hi: int,
+                  plain_sort: Callable[[list], list]):
+    """Sort keys[lo:hi] with a comparison sort and permute values alike.
+
+    The range is sorted as (key, index) pairs, like in decorated_sort, so
+    that sorts on parallel lists can finish small ranges with the plain
+    core of another algorithm.
+
+    Args:
+        keys (list): The keys, sorted in place.
+        values (list): The values, moved like their keys.
+        lo (int): First index of the range to sort.
+        hi (int): One past the last index of the range to sort.
+        plain_sort (callable): The algorithm, returning the sorted pairs.
+    """
+    pairs = plain_sort([(keys[i], i) for i in range(lo, hi)])
+    keys[lo:hi] = [k for k, _ in pairs]
+    values[lo:hi] = [values[i] for _, i in pairs]
@@ -0,0 +1,145 @@
+# To run:
+# PYTHONPATH=src python3 -m c05_SORT.DecoratedSort_tests
+
+import random
+import unittest
+from c01_ADTS.FechaDataclass import Fecha
+from c05_SORT.AdaptiveMergeSort import AdaptiveMergeSort
+from c05_SORT.BinaryInsertionSort import BinaryInsertionSort
+from c05_SORT.BottomUpMergeSort import BottomUpMergeSort
+from c05_SORT.BoundedCountSort import BoundedCountSort
+from c05_SORT.CountSort import CountSort
+from c05_SORT.InsertionSort import InsertionSort
+from c05_SORT.IntroSort import IntroSort
+from c05_SORT.LSDRadixSort import LSDRadixSort
+from c05_SORT.MergeSort import MergeSort
+from c05_SORT.MSDStringSort import MSDStringSort
+from c05_SORT.QuickSort import QuickSort
+from c05_SORT.QuickSort3Way import Quick3String, QuickSort3Way
+from c05_SORT.RadixSort import RadixSort
+from c05_SORT.SelectionSort import SelectionSort
+from c05_SORT.ShellSort import ShellSort
+
+# Algorithms that keep equal keys in their input order
+STABLE = [InsertionSort, BinaryInsertionSort, MergeSort, BottomUpMergeSort,
+          AdaptiveMergeSort, CountSort, BoundedCountSort, RadixSort,
+          LSDRadixSort]
+# Not stable on plain input, but stable with key=, which breaks ties by index
+UNSTABLE = [SelectionSort, ShellSort, QuickSort, IntroSort, QuickSort3Way]
+
+
+class CountingKey:
+    """A key function that counts its calls."""
+
+    def __init__(self, key):
+        self._key = key
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return self._key(x)
+
+
+class TestDecoratedSort(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(15)
+        # Few distinct months, so there are many ties to keep in order
+        self.fechas = [Fecha(rng.randrange(1900, 2030), rng.randrange(1, 13),
+                             rng.randrange(1, 29)) for _ in range(300)]
+
+    def test_key_orders_by_field(self):
+        for func in STABLE + UNSTABLE:
+            with self.subTest(func=func.__name__):
+                result = func(list(self.fechas), key=lambda f: f.mes)
+                self.assertEqual([f.mes for f in result],
+                                 sorted(f.mes for f in self.fechas))
+                self.assertCountEqual(result, self.fechas)
+
+    def test_stable_algorithms(self):
+        for func in STABLE + UNSTABLE:
+            for reverse in (False, True):
+                with self.subTest(func=func.__name__, reverse=reverse):
+                    result = func(list(self.fechas), key=lambda f: f.mes,
+                                  reverse=reverse)
+                    self.assertEqual(result, sorted(self.fechas,
+                                                    key=lambda f: f.mes,
+                                                    reverse=reverse))
+
+    def test_sort_by_successive_fields(self):
+        # With a stable sort, sorting by day then by month orders by both
+        expected = sorted(self.fechas, key=lambda f: (f.mes, f.dia))
+        for func in STABLE:
+            with self.subTest(func=func.__name__):
+                result = func(list(self.fechas), key=lambda f: f.dia)
+                result = func(result, key=lambda f: f.mes)
+                self.assertEqual(result, expected)
+
+    def test_key_computed_once_per_element(self):
+        for func in STABLE + UNSTABLE:
+            with self.subTest(func=func.__name__):
+                key = CountingKey(lambda f: f.año)
+                func(list(self.fechas), key=key)
+                self.assertEqual(key.calls, len(self.fechas))
+
+    def test_reverse_without_key(self):
+        data = [random.Random(1).randrange(50) for _ in range(200)]
+        for func in STABLE + UNSTABLE:
+            with self.subTest(func=func.__name__):
+                self.assertEqual(func(list(data), reverse=True),
+                                 sorted(data, reverse=True))
+
+    def test_out_of_place_leaves_input_unchanged(self):
+        for func in (MergeSort, CountSort, BoundedCountSort, RadixSort,
+                     LSDRadixSort):
+            with self.subTest(func=func.__name__):
+                data = list(self.fechas)
+                func(data, key=lambda f: f.mes, reverse=True)
+                self.assertEqual(data, self.fechas)
+
+    def test_in_place_sorts_same_list(self):
+        for func in [InsertionSort, BinaryInsertionSort, BottomUpMergeSort,
+                     AdaptiveMergeSort, QuickSort, IntroSort, QuickSort3Way]:
+            with self.subTest(func=func.__name__):
+                data = list(self.fechas)
+                self.assertIs(func(data, key=lambda f: f.mes,
+                                   reverse=True), data)
+
+    def test_insertion_sort_range_with_key(self):
+        for func in (InsertionSort, BinaryInsertionSort):
+            with self.subTest(func=func.__name__):
+                data = list(self.fechas)
+                func(data, 100, 200, key=lambda f: f.dia, reverse=True)
+                self.assertEqual(data[:100], self.fechas[:100])
+                self.assertEqual(data[200:], self.fechas[200:])
+                self.assertEqual(data[100:200],
+                                 sorted(self.fechas[100:200],
+                                        key=lambda f: f.dia, reverse=True))
+
+    def test_string_sorts_key(self):
+        names = ["Juan", "Maria", "Laura", "Ana", "Luis", "Marta"]
+        records = [(name, i) for i, name in enumerate(names * 50)]
+        for func in (Quick3String, MSDStringSort):
+            with self.subTest(func=func.__name__):
+                result = func(list(records), key=lambda r: r[0])
+                self.assertEqual([r[0] for r in result], sorted(names * 50))
+                self.assertEqual(result, sorted(records, key=lambda r: r[0]))
+        # Three keys, so that the ranges of ended keys are long
+        records = [("abc"[i % 3], i) for i in range(200)]
+        for func in (Quick3String, MSDStringSort):
+            for reverse in (False, True):
+                with self.subTest(func=func.__name__, reverse=reverse):
+                    result = func(list(records), key=lambda r: r[0],
+                                  reverse=reverse)
+                    self.assertEqual(result, sorted(records,
+                                                    key=lambda r: r[0],
+                                                    reverse=reverse))
+
+    def test_empty_and_single(self):
+        for func in STABLE + UNSTABLE:
+            with self.subTest(func=func.__name__):
+                self.assertEqual(func([], key=abs, reverse=True), [])
+                self.assertEqual(func([-4], key=abs, reverse=True), [-4])
+
+
+if __name__ == "__main__":
+    unittest.main()
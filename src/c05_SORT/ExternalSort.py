@@ -0,0 +1,344 @@
+# python3 -m c05_SORT.ExternalSort
+
+import os
+import random
+import tempfile
+import time
+from array import array
+from typing import Any, BinaryIO, Callable, Iterator, List, Optional
+
+from c05_SORT.IntroSort import IntroSort
+from c05_SORT.MSDStringSort import MSDStringSort
+from c06_PRIORITYQUEUE.binary_heap import BinaryHeap
+from c06_PRIORITYQUEUE.binomial_heap import BinomialHeap
+from c06_PRIORITYQUEUE.fibonacci_heap import FibonacciHeap
+
+# Default memory budget for the records held at once, in bytes
+MEMORY = 64 * 2 ** 20
+# Default number of runs merged at once
+FAN_IN = 16
+# Estimated bytes per record held in a list: the pointer, the object
+# and the sort's own bookkeeping
+INT_RECORD_COST = 56
+LINE_RECORD_COST = 80
+
+
+def ExternalSort(input_path: str, output_path: str, record: str = "int64",
+                 memory: int = MEMORY, fan_in: int = FAN_IN,
+                 sort: Optional[Callable[[list], list]] = None,
+                 heap: Callable[[], Any] = BinaryHeap,
+                 tmp_dir: Optional[str] = None) -> int:
+    """Sort a file that may not fit in memory with an external merge sort.
+
+    The input is read in chunks that fit in the memory budget, each chunk
+    is sorted in memory and spilled to a temporary file as a sorted run.
+    Runs are then merged fan_in at a time, with a heap holding the head of
+    each run, until a single run is left, which is the output. Reading
+    and writing go through buffers that share the memory budget.
+
+    Two record formats are supported, and the output has the same one as
+    the input:
+        "int64": a binary file of native 64-bit signed integers, as
+            written by `array('q').tofile`.
+        "line": a text file of newline-terminated lines, compared as
+            bytes. A last line without a newline gets one.
+
+    Args:
+        input_path (str): The file to sort.
+        output_path (str): Where to write the sorted records.
+        record (str): The record format, "int64" or "line".
+        memory (int): Approximate number of bytes of records to hold.
+        fan_in (int): Maximum number of runs merged at once (at least 2).
+        sort (callable, optional): In-memory sort for the chunks; by
+            default IntroSort for integers and MSDStringSort for lines.
+        heap (callable): Priority queue class from c06_PRIORITYQUEUE used
+            to merge runs; any max-heap with insert, del_max and is_empty.
+        tmp_dir (str, optional): Directory for the runs (default: the
+            system's temporary directory). They are removed at the end.
+
+    Returns:
+        int: The number of records sorted.
+
+    Raises:
+        ValueError: If record is unknown, memory or fan_in is too small,
+            or an "int64" file's size is not a multiple of 8.
+    """
+    if record not in _FORMATS:
+        raise ValueError(f"Unknown record format {record!r}.")
+    if fan_in < 2:
+        raise ValueError(f"Fan-in {fan_in} is less than 2.")
+    if memory < 1024:
+        raise ValueError(f"Memory budget {memory} is less than 1024 bytes.")
+    records = _FORMATS[record]()
+    if sort is None:
+        sort = records.default_sort
+    # While merging, each input run and the output get a buffer
+    buffer_size = max(memory // (fan_in + 1), 512)
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        runs = []
+        count = 0
+        with open(input_path, "rb") as f:
+            for chunk in records.read_chunks(f, memory):
+                count += len(chunk)
+                path = os.path.join(tmp, f"run0_{len(runs)}")
+                with open(path, "wb") as out:
+                    records.write(out, sort(chunk))
+                runs.append(path)
+
+        merge_pass = 1
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                path = os.path.join(tmp, f"run{merge_pass}_{len(merged)}")
+                _merge_runs(records, runs[i:i + fan_in], path, buffer_size,
+                            heap)
+                merged.append(path)
+                for run in runs[i:i + fan_in]:
+                    os.remove(run)
+            runs = merged
+            merge_pass += 1
+        _merge_runs(records, runs, output_path, buffer_size, heap)
+    return count
+
+
+class _Int64Records:
+    """Native 64-bit integers stored back to back."""
+
+    default_sort = staticmethod(IntroSort)
+
+    def read_chunks(self, f: BinaryIO, memory: int) -> Iterator[list]:
+        """Yield lists of the integers of f, of about memory bytes each."""
+        size = os.fstat(f.fileno()).st_size
+        if size % 8:
+            raise ValueError(f"File size {size} is not a multiple of 8.")
+        per_chunk = max(memory // INT_RECORD_COST, 1)
+        while True:
+            block = self._read_block(f, per_chunk)
+            if not block:
+                return
+            yield block.tolist()
+
+    def read_run(self, path: str, buffer_size: int) -> Iterator[int]:
+        """Yield the integers of a run, reading buffer_size bytes at once."""
+        per_block = max(buffer_size // 8, 1)
+        with open(path, "rb") as f:
+            while True:
+                block = self._read_block(f, per_block)
+                if not block:
+                    return
+                yield from block
+
+    def write(self, f: BinaryIO, values: list):
+        array('q', values).tofile(f)
+
+    def writer(self, f: BinaryIO,
+               buffer_size: int) -> "_BufferedWriter":
+        return _BufferedWriter(max(buffer_size // 8, 1),
+                               lambda block: array('q', block).tofile(f))
+
+    @staticmethod
+    def _read_block(f: BinaryIO, count: int) -> array:
+        block = array('q')
+        try:
+            block.fromfile(f, count)
+        except EOFError:
+            pass  # The items that were there have been read
+        return block
+
+
+class _LineRecords:
+    """Newline-terminated lines, held in memory as bytes without it."""
+
+    default_sort = staticmethod(MSDStringSort)
+
+    def read_chunks(self, f: BinaryIO, memory: int) -> Iterator[list]:
+        """Yield lists of the lines of f, of about memory bytes each."""
+        chunk = []
+        used = 0
+        for line in f:
+            line = line[:-1] if line.endswith(b"\n") else line
+            chunk.append(line)
+            used += len(line) + LINE_RECORD_COST
+            if used >= memory:
+                yield chunk
+                chunk = []
+                used = 0
+        if chunk:
+            yield chunk
+
+    def read_run(self, path: str, buffer_size: int) -> Iterator[bytes]:
+        """Yield the lines of a run, reading buffer_size bytes at once."""
+        with open(path, "rb", buffering=buffer_size) as f:
+            for line in f:
+                yield line[:-1]
+
+    def write(self, f: BinaryIO, values: list):
+        if values:
+            f.write(b"\n".join(values))
+            f.write(b"\n")
+
+    def writer(self, f: BinaryIO,
+               buffer_size: int) -> "_BufferedWriter":
+        per_block = max(buffer_size // LINE_RECORD_COST, 1)
+        return _BufferedWriter(per_block, lambda block: self.write(f, block))
+
+
+_FORMATS = {"int64": _Int64Records, "line": _LineRecords}
+
+
+class _BufferedWriter:
+    """Collects records and writes them in blocks of a fixed count."""
+
+    def __init__(self, block_size: int, flush: Callable[[list], None]):
+        self._block: List[Any] = []
+        self._block_size = block_size
+        self._flush = flush
+
+    def append(self, value: Any):
+        self._block.append(value)
+        if len(self._block) >= self._block_size:
+            self.flush()
+
+    def flush(self):
+        if self._block:
+            self._flush(self._block)
+            self._block = []
+
+
+class _RunHead:
+    """
+    The next record of a run, as stored in a c06 max-heap: the smallest
+    record compares greatest, and ties go to the earlier run, so that the
+    merge is stable.
+    """
+
+    __slots__ = ("value", "run")
+
+    def __init__(self, value: Any, run: int):
+        self.value = value
+        self.run = run
+
+    def __gt__(self, other: "_RunHead") -> bool:
+        if self.value < other.value:
+            return True
+        return not other.value < self.value and self.run < other.run
+
+    def __lt__(self, other: "_RunHead") -> bool:
+        return other.__gt__(self)
+
+    def __ge__(self, other: "_RunHead") -> bool:
+        return not other.__gt__(self)
+
+
+def _merge_runs(records, runs: List[str], output_path: str,
+                buffer_size: int, heap: Callable[[], Any]):
+    """Merge the sorted run files into output_path with a k-way merge."""
+    readers = [records.read_run(path, buffer_size) for path in runs]
+    queue = heap()
+    for run, reader in enumerate(readers):
+        for value in reader:
+            queue.insert(_RunHead(value, run))
+            break
+    with open(output_path, "wb") as f:
+        out = records.writer(f, buffer_size)
+        while not queue.is_empty():
+            head = queue.del_max()
+            out.append(head.value)
+            for value in readers[head.run]:
+                head.value = value
+                queue.insert(head)
+                break
+        out.flush()
+
+
+def _test_ExternalSort():
+    rng = random.Random(19)
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "in")
+        dst = os.path.join(tmp, "out")
+
+        int_cases = [
+            [],
+            [42],
+            [rng.randrange(-2 ** 63, 2 ** 63) for _ in range(5000)],
+            [rng.randrange(10) for _ in range(3000)],
+        ]
+        for i, data in enumerate(int_cases):
+            with open(src, "wb") as f:
+                array('q', data).tofile(f)
+            # A 2 KiB budget gives runs of 36 records: many merge passes
+            for memory, fan_in in ((2048, 2), (2048, 7), (MEMORY, FAN_IN)):
+                count = ExternalSort(src, dst, memory=memory, fan_in=fan_in,
+                                     tmp_dir=tmp)
+                result = array('q')
+                with open(dst, "rb") as f:
+                    result.frombytes(f.read())
+                assert count == len(data), f"Int case {i+1}: wrong count"
+                assert result.tolist() == sorted(data), \
+                    f"Int case {i+1} failed (memory {memory}, fan-in {fan_in})"
+        assert sorted(os.listdir(tmp)) == ["in", "out"], \
+            "Runs were left behind"
+
+        words = ["she", "sells", "seashells", "by", "the", "sea", "shore",
+                 "", "ñandú", "中文", "tab\tbefore", "tab"]
+        line_cases = [
+            b"",
+            b"no newline",
+            "\n".join(rng.choice(words) for _ in range(2000)).encode(),
+            "".join(rng.choice(words) + "\n" for _ in range(2000)).encode(),
+        ]
+        for i, data in enumerate(line_cases):
+            with open(src, "wb") as f:
+                f.write(data)
+            expected = sorted(data.splitlines())
+            for heap_class in (BinaryHeap, BinomialHeap, FibonacciHeap):
+                count = ExternalSort(src, dst, record="line", memory=2048,
+                                     fan_in=3, heap=heap_class)
+                with open(dst, "rb") as f:
+                    result = f.read()
+                assert count == len(expected), f"Line case {i+1}: wrong count"
+                assert result == b"".join(line + b"\n" for line in expected), \
+                    f"Line case {i+1} failed"
+
+        with open(src, "wb") as f:
+            f.write(b"1234567")
+        for kwargs in ({"record": "csv"}, {"fan_in": 1}, {"memory": 10}, {}):
+            try:
+                ExternalSort(src, dst, **kwargs)
+                assert False, f"{kwargs} was accepted"
+            except ValueError:
+                pass
+
+    print("All ExternalSort tests passed.")
+
+
+def _benchmark(n: int = 2000000):
+    """Sort n integers from a file with a small budget and several fan-ins."""
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "in")
+        dst = os.path.join(tmp, "out")
+        with open(src, "wb") as f:
+            array('q', (rng.getrandbits(63) for _ in range(n))).tofile(f)
+        print(f"n = {n} ({8 * n / 2 ** 20:.0f} MiB file)")
+        memory = 8 * 2 ** 20
+        for fan_in in (2, 4, 16, 64):
+            start = time.perf_counter()
+            ExternalSort(src, dst, memory=memory, fan_in=fan_in)
+            elapsed = time.perf_counter() - start
+            print(f"memory {memory // 2 ** 20} MiB, fan-in {fan_in:2d}: "
+                  f"{elapsed:.2f} s")
+        start = time.perf_counter()
+        data = array('q')
+        with open(src, "rb") as f:
+            data.frombytes(f.read())
+        with open(dst, "wb") as f:
+            array('q', sorted(data)).tofile(f)
+        print(f"in memory with sorted(): "
+              f"{time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    _test_ExternalSort()
+    _benchmark()
@@ -1,24 +1,39 @@
+from typing import Optional
 
+from c05_SORT.DecoratedSort import Key, decorated_sort
 
-def InsertionSort(a: list) -> list:
+
+def InsertionSort(a: list, lo: int = 0, hi: Optional[int] = None,
+                  key: Key = None, reverse: bool = False) -> list:
     """Sort the list a using the insertion sort algorithm and return the sorted list.
 
+    The sort is stable: an element only moves past strictly greater ones.
+
     Args:
         a (list): The list of elements to be sorted.
+        lo (int): First index of the range to sort (default 0).
+        hi (int, optional): One past the last index of the range to sort
+            (default len(a)). Elements outside [lo, hi) are not touched,
+            which lets other sorts finish small ranges with this one.
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Sort in descending order.
 
     Returns:
         list: The sorted list.
     """
-    n = len(a)
-    for i in range(1, n):
-        key = a[i]
+    if hi is None:
+        hi = len(a)
+    if key is not None or reverse:
+        a[lo:hi] = decorated_sort(a[lo:hi], key, reverse, InsertionSort)
+        return a
+    for i in range(lo + 1, hi):
+        current = a[i]
         j = i - 1
-        while j >= 0 and a[j] > key:
+        while j >= lo and a[j] > current:
             a[j + 1] = a[j]
             j -= 1
-        a[j + 1] = key
+        a[j + 1] = current
     return a
 
 
 # TODO Exercise: write a unit test showing the correct operation of the sorting algorithm
-
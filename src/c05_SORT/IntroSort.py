@@ -0,0 +1,217 @@
+# python3 -m c05_SORT.IntroSort
+
+import random
+import time
+
+from c05_SORT.DecoratedSort import Key, decorated_sort
+from c05_SORT.InsertionSort import InsertionSort
+from c05_SORT.MergeSort import MergeSort
+from c05_SORT.QuickSort import QuickSort
+
+# Ranges of at most this many elements are finished with InsertionSort
+INSERTION_CUTOFF = 16
+# Ranges longer than this use Tukey's ninther instead of median-of-three
+NINTHER_CUTOFF = 128
+
+
+def IntroSort(a: list, key: Key = None, reverse: bool = False) -> list:
+    """Sort the list a in place using introsort and return the same list.
+
+    Introsort is a quicksort with three safeguards: the pivot is the
+    median of three (or of nine, for long ranges) elements, partitioning
+    follows Hoare's scheme so runs of equal keys split evenly, and once
+    the recursion depth exceeds 2*log2(n) the remaining range is heap
+    sorted. This bounds the running time by O(n log n) on every input.
+    Only the smaller side of each partition is sorted recursively, so the
+    call stack stays O(log n) deep. Ranges of up to INSERTION_CUTOFF
+    elements are finished with InsertionSort. The sort is not stable,
+    except when key is given, as ties are then broken by position.
+
+    Args:
+        a (list): The list of elements to be sorted.
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Sort in descending order.
+
+    Returns:
+        list: The sorted list (same list object as input).
+    """
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse, IntroSort)
+    n = len(a)
+    if n > 1:
+        _introsort(a, 0, n, 2 * (n.bit_length() - 1))
+    return a
+
+
+def _introsort(a: list, lo: int, hi: int, depth: int):
+    """Sort a[lo:hi], switching to heap sort when depth runs out."""
+    while hi - lo > INSERTION_CUTOFF:
+        if depth == 0:
+            _heapsort(a, lo, hi)
+            return
+        depth -= 1
+        _move_pivot_to_front(a, lo, hi)
+        j = hoare_partition(a, lo, hi)
+        if j + 1 - lo < hi - j - 1:
+            _introsort(a, lo, j + 1, depth)
+            lo = j + 1
+        else:
+            _introsort(a, j + 1, hi, depth)
+            hi = j + 1
+    InsertionSort(a, lo, hi)
+
+
+def _median_of_three(a: list, i: int, j: int, k: int) -> int:
+    """Return whichever of the indices i, j, k holds the median value."""
+    if a[i] < a[j]:
+        if a[j] < a[k]:
+            return j
+        return k if a[i] < a[k] else i
+    if a[i] < a[k]:
+        return i
+    return k if a[j] < a[k] else j
+
+
+def _move_pivot_to_front(a: list, lo: int, hi: int):
+    """Swap the chosen pivot of a[lo:hi] into position lo."""
+    pivot = choose_pivot(a, lo, hi)
+    a[lo], a[pivot] = a[pivot], a[lo]
+
+
+def choose_pivot(a: list, lo: int, hi: int) -> int:
+    """
+    Return the index of the pivot for a[lo:hi]: the median of its first,
+    middle and last elements, or Tukey's ninther for ranges longer than
+    NINTHER_CUTOFF. PartialSort picks its pivots with it too.
+    """
+    mid = (lo + hi) // 2
+    last = hi - 1
+    if hi - lo > NINTHER_CUTOFF:
+        step = (hi - lo) // 8
+        pivot = _median_of_three(
+            a,
+            _median_of_three(a, lo, lo + step, lo + 2 * step),
+            _median_of_three(a, mid - step, mid, mid + step),
+            _median_of_three(a, last - 2 * step, last - step, last))
+    else:
+        pivot = _median_of_three(a, lo, mid, last)
+    return pivot
+
+
+def hoare_partition(a: list, lo: int, hi: int) -> int:
+    """
+    Hoare partition of a[lo:hi], of at least two elements, around the
+    pivot a[lo]. PartialSort partitions with it too.
+
+    Returns:
+        int: An index j with lo <= j < hi - 1 such that every element of
+        a[lo:j+1] is <= the pivot and every element of a[j+1:hi] is >= it.
+    """
+    pivot = a[lo]
+    i = lo - 1
+    j = hi
+    while True:
+        i += 1
+        while a[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < a[j]:
+            j -= 1
+        if i >= j:
+            return j
+        a[i], a[j] = a[j], a[i]
+
+
+def _heapsort(a: list, lo: int, hi: int):
+    """Sort a[lo:hi] in place with a binary max-heap rooted at lo."""
+    n = hi - lo
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down(a, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        a[lo], a[lo + end] = a[lo + end], a[lo]
+        _sift_down(a, lo, 0, end)
+
+
+def _sift_down(a: list, lo: int, i: int, n: int):
+    """Restore the heap order below offset i of the n-element heap at lo."""
+    value = a[lo + i]
+    child = 2 * i + 1
+    while child < n:
+        if child + 1 < n and a[lo + child] < a[lo + child + 1]:
+            child += 1
+        if not value < a[lo + child]:
+            break
+        a[lo + i] = a[lo + child]
+        i = child
+        child = 2 * i + 1
+    a[lo + i] = value
+
+
+def _test_IntroSort():
+    rng = random.Random(1)
+    test_cases = [
+        [5, 3, 8, 6, 2, 7, 4, 1],
+        [],
+        [1],
+        [2, 1],
+        [3, 3, 3],
+        list(range(1000)),
+        list(range(1000, 0, -1)),
+        [rng.randrange(3) for _ in range(1000)],
+        [rng.random() for _ in range(1000)],
+        ["pear", "apple", "fig", "kiwi"],
+    ]
+
+    for i, input_list in enumerate(test_cases):
+        expected = sorted(input_list)
+        result = IntroSort(input_list)
+        assert result == expected, f"Test case {i+1} failed: got {result}"
+        assert result is input_list, f"Test case {i+1} did not sort in place"
+
+    # With no depth budget left the whole range goes to heap sort
+    data = [rng.randrange(100) for _ in range(500)]
+    expected = sorted(data)
+    _introsort(data, 0, len(data), 0)
+    assert data == expected, "Heap sort fallback failed"
+
+    records = [(rng.randrange(50), i) for i in range(2000)]
+    result = IntroSort(list(records), key=lambda r: r[0])
+    assert [r[0] for r in result] == sorted(r[0] for r in records), \
+        "Keyed IntroSort failed"
+    assert sorted(result) == sorted(records), "Keyed IntroSort lost records"
+    result = IntroSort(list(range(100)), reverse=True)
+    assert result == list(range(99, -1, -1)), "Reversed IntroSort failed"
+
+    print("All IntroSort tests passed.")
+
+
+def _benchmark(n: int = 20000):
+    """Time IntroSort against QuickSort and MergeSort on several inputs."""
+    rng = random.Random(42)
+    inputs = {
+        "sorted": list(range(n)),
+        "reversed": list(range(n, 0, -1)),
+        "random": [rng.randrange(n) for _ in range(n)],
+        "few unique": [rng.randrange(4) for _ in range(n)],
+    }
+    algorithms = [
+        ("IntroSort", IntroSort),
+        ("QuickSort", QuickSort),
+        ("MergeSort", MergeSort),
+    ]
+    print(f"n = {n}")
+    for input_name, data in inputs.items():
+        for name, func in algorithms:
+            copy = list(data)
+            start = time.perf_counter()
+            try:
+                func(copy)
+                result = f"{time.perf_counter() - start:.4f} s"
+            except RecursionError:
+                result = "RecursionError"
+            print(f"{input_name:10s} {name:10s}: {result}")
+
+
+if __name__ == "__main__":
+    _test_IntroSort()
+    _benchmark()
@@ -0,0 +1,290 @@
+# python3 -m c05_SORT.LSDRadixSort
+
+import random
+import time
+from array import array
+from functools import partial
+from itertools import accumulate
+from typing import Optional, Tuple
+
+from c05_SORT.DecoratedSort import Key, decorated_sort
+from c05_SORT.MergeSort import MergeSort
+from c05_SORT.RadixSort import RadixSort
+
+# Inputs of more than this many keys use 16-bit digits instead of 8-bit
+WIDE_DIGIT_CUTOFF = 4096
+
+_SIGN = 1 << 63
+_NEG_ZERO = -(1 << 63)  # Bit pattern of -0.0 read as a signed int64
+_EXACT = 1 << 53  # Every int up to this magnitude is exactly a float
+
+
+def LSDRadixSort(a: list, key: Key = None, reverse: bool = False,
+                 bits: Optional[int] = None) -> list:
+    """Sort a list of ints or floats with a byte-wise LSD radix sort.
+
+    Keys are first mapped to non-negative integers in the same order:
+    integers are offset by the minimum when negative, and floats are
+    reinterpreted as their IEEE 754 bits with the sign bit flipped (all
+    bits flipped for negative numbers). Then each pass is a stable
+    counting sort on one digit of `bits` bits, extracted with a shift and
+    a mask, from the least to the most significant. A pass is skipped
+    when every key has the same digit, so e.g. small integers stored in
+    64-bit floats only pay for the digits that vary. The sort is stable.
+
+    When ints and floats are mixed, the ints are converted to floats,
+    which is only done if every one of them converts exactly. Otherwise,
+    e.g. for ints above 2**53 or beyond the float range, the list is
+    sorted with MergeSort, which compares ints and floats exactly.
+
+    Sorting (key, payload) pairs is done with key=, e.g.
+    `LSDRadixSort(pairs, key=lambda p: p[0])`: the keys are extracted once
+    and the payloads are moved along with them.
+
+    Args:
+        a (list): The list of ints or floats to be sorted (any elements,
+            if key maps them to ints or floats). NaNs are not supported.
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Sort in descending order.
+        bits (int, optional): Digit size between 1 and 16; by default 8,
+            or 16 for more than WIDE_DIGIT_CUTOFF keys.
+
+    Returns:
+        list: The sorted list (a new list).
+
+    Raises:
+        ValueError: If bits is out of range.
+        TypeError: If a key is neither an int nor a float.
+    """
+    if bits is not None and not 1 <= bits <= 16:
+        raise ValueError(f"Digit size {bits} is not between 1 and 16.")
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse,
+                              partial(LSDRadixSort, bits=bits),
+                              partial(lsd_radix_sort_parallel, bits=bits))
+    if len(a) == 0:
+        return list(a)
+    if bits is None:
+        bits = 16 if len(a) > WIDE_DIGIT_CUTOFF else 8
+    if all(isinstance(x, int) for x in a):
+        codes, width, offset = _int_codes(a)
+        codes, _ = _radix_passes(codes, None, width, bits)
+        if offset:
+            return [c + offset for c in codes]
+        return codes if codes is not a else list(a)
+    return lsd_radix_sort_parallel(a, list(a), bits)
+
+
+def lsd_radix_sort_parallel(keys: list, values: list,
+                            bits: Optional[int] = None) -> list:
+    """
+    Return values ordered by the parallel list of int or float keys, with
+    the passes of LSDRadixSort. The sort is stable.
+
+    Args:
+        keys (list): The int or float keys, left unchanged.
+        values (list): The values, one per key.
+        bits (int, optional): Digit size, chosen as in LSDRadixSort by
+            default.
+
+    Returns:
+        list: The values in key order, in a new list unless every pass
+        was skipped.
+
+    Raises:
+        TypeError: If a key is neither an int nor a float.
+    """
+    if len(keys) == 0:
+        return list(values)
+    if bits is None:
+        bits = 16 if len(keys) > WIDE_DIGIT_CUTOFF else 8
+    if all(isinstance(k, int) for k in keys):
+        codes, width, _ = _int_codes(keys)
+    else:
+        codes, width = _float_codes(keys), 64
+        if codes is None:
+            # Stable: ties are broken by index
+            pairs = MergeSort([(k, i) for i, k in enumerate(keys)])
+            return [values[i] for _, i in pairs]
+    return _radix_passes(codes, values, width, bits)[1]
+
+
+def _int_codes(keys: list) -> Tuple[list, int, int]:
+    """
+    Map integer keys to non-negative integers in the same order.
+
+    Returns:
+        tuple: The codes, their width in bits and the offset that was
+        subtracted from every key (0 if none were negative).
+    """
+    lo, hi = min(keys), max(keys)
+    if lo >= 0:
+        return keys, hi.bit_length(), 0
+    return [k - lo for k in keys], (hi - lo).bit_length(), lo
+
+
+def _float_codes(keys: list) -> Optional[list]:
+    """
+    Map float (or int) keys to 64-bit unsigned integers in the same order.
+    -0.0 is mapped like 0.0, as the two compare equal.
+
+    Returns:
+        Optional[list]: The codes, or None if an int key has no exact
+        float, since rounding it could put it out of order.
+
+    Raises:
+        TypeError: If a key is neither an int nor a float.
+    """
+    for k in keys:
+        if isinstance(k, float):
+            continue
+        if not isinstance(k, int):
+            raise TypeError("LSDRadixSort keys must be ints or floats.")
+        if not -_EXACT <= k <= _EXACT:
+            try:
+                if float(k) != k:
+                    return None
+            except OverflowError:
+                return None
+    doubles = array('d', keys)
+    raw = array('q')
+    raw.frombytes(doubles.tobytes())
+    # Negative floats: flip all bits; others: set the sign bit
+    return [(~b if b != _NEG_ZERO else _SIGN) if b < 0 else b | _SIGN
+            for b in raw]
+
+
+def _radix_passes(codes: list, values: Optional[list], width: int,
+                  bits: int) -> Tuple[list, Optional[list]]:
+    """
+    Sort the non-negative integers codes, of at most width bits, with one
+    stable counting pass per digit of bits bits, moving values (if not
+    None) along with them.
+
+    Returns:
+        tuple: The sorted codes and values; these may be the input lists
+        if every pass was skipped.
+    """
+    n = len(codes)
+    mask = (1 << bits) - 1
+    for shift in range(0, width, bits):
+        digits = [(c >> shift) & mask for c in codes]
+        count = [0] * (mask + 1)
+        for d in digits:
+            count[d] += 1
+        if count[digits[0]] == n:
+            continue  # Every key has the same digit
+        start = list(accumulate(count, initial=0))
+        output = [0] * n
+        if values is None:
+            for c, d in zip(codes, digits):
+                i = start[d]
+                start[d] = i + 1
+                output[i] = c
+        else:
+            output_values = [None] * n
+            for c, v, d in zip(codes, values, digits):
+                i = start[d]
+                start[d] = i + 1
+                output[i] = c
+                output_values[i] = v
+            values = output_values
+        codes = output
+    return codes, values
+
+
+def _test_LSDRadixSort():
+    rng = random.Random(16)
+    test_cases = [
+        [170, 45, 75, 90, 802, 24, 2, 66],
+        [],
+        [0],
+        [3, 3, 3],
+        [0, 0, 1],
+        [-5, 3, 0, -1, 2 ** 70, -2 ** 65, 7],
+        [rng.randrange(-10 ** 6, 10 ** 6) for _ in range(5000)],
+        [rng.getrandbits(64) for _ in range(3000)],
+        [rng.randrange(256) << 40 for _ in range(1000)],
+        [1.5, -2.25, 0.0, -0.0, float("inf"), -float("inf"), 1e-310, -3],
+        [rng.uniform(-1e9, 1e9) for _ in range(3000)],
+        [float(rng.randrange(-100, 100)) for _ in range(1000)],
+        # Mixed ints that floats cannot hold exactly
+        [2 ** 53 + 1, 2 ** 53, 0.5, 2.0 ** 53, -(2 ** 53) - 1],
+        [10 ** 400, 0.5, -10 ** 400, 1e308, 3],
+        [2 ** 60, -2.5, 2 ** 70, 1.0, 2 ** 60 + 1] * 100,
+    ]
+    for i, input_list in enumerate(test_cases):
+        expected = sorted(input_list)
+        for bits in (None, 1, 3, 8, 11, 16):
+            result = LSDRadixSort(list(input_list), bits=bits)
+            assert result == expected, \
+                f"Test case {i+1} failed with bits={bits}"
+            assert [type(x) for x in result] == \
+                [type(x) for x in expected], f"Test case {i+1} changed types"
+
+    # (key, payload) pairs, stable in both directions
+    pairs = [(rng.randrange(-50, 50), i) for i in range(2000)]
+    for reverse in (False, True):
+        result = LSDRadixSort(pairs, key=lambda p: p[0], reverse=reverse)
+        assert result == sorted(pairs, key=lambda p: p[0], reverse=reverse), \
+            f"Pairs test failed with reverse={reverse}"
+    pairs = [(rng.choice([-0.5, 0.0, -0.0, 2.5]), i) for i in range(500)]
+    result = LSDRadixSort(pairs, key=lambda p: p[0])
+    assert result == sorted(pairs, key=lambda p: p[0]), "Float pairs failed"
+    pairs = [(rng.choice([2 ** 53 + 1, 2.0 ** 53, 2 ** 53, -0.5]), i)
+             for i in range(500)]
+    for reverse in (False, True):
+        result = LSDRadixSort(pairs, key=lambda p: p[0], reverse=reverse)
+        assert result == sorted(pairs, key=lambda p: p[0], reverse=reverse), \
+            f"Mixed pairs failed with reverse={reverse}"
+    empty = []
+    for key in (None, abs):
+        assert LSDRadixSort(empty, key=key) is not empty, \
+            "Empty input was returned instead of a new list"
+
+    for bad in (0, 17):
+        try:
+            LSDRadixSort([1], bits=bad)
+            assert False, f"bits={bad} was accepted"
+        except ValueError:
+            pass
+    for bad in (["a", "b"], [1.5, "a"], [2 ** 53 + 1, 0.5, "a"]):
+        try:
+            LSDRadixSort(bad)
+            assert False, f"{bad} was accepted"
+        except TypeError:
+            pass
+
+    print("All LSDRadixSort tests passed.")
+
+
+def _benchmark(n: int = 1000000):
+    """Time LSDRadixSort against RadixSort and the builtin sort."""
+    rng = random.Random(42)
+    inputs = {
+        "ints < 2**32": [rng.getrandbits(32) for _ in range(n)],
+        "ints < 2**64": [rng.getrandbits(64) for _ in range(n)],
+        "signed ints": [rng.randrange(-2 ** 31, 2 ** 31) for _ in range(n)],
+        "floats": [rng.uniform(-1e6, 1e6) for _ in range(n)],
+    }
+    algorithms = [
+        ("LSDRadixSort/8", partial(LSDRadixSort, bits=8)),
+        ("LSDRadixSort/16", partial(LSDRadixSort, bits=16)),
+        ("RadixSort", RadixSort),
+        ("sorted", sorted),
+    ]
+    print(f"n = {n}")
+    for input_name, data in inputs.items():
+        for name, func in algorithms:
+            if name == "RadixSort" and input_name in ("signed ints",
+                                                      "floats"):
+                continue  # Only non-negative integers are supported
+            start = time.perf_counter()
+            func(list(data))
+            elapsed = time.perf_counter() - start
+            print(f"{input_name:13s} {name:16s}: {elapsed:.3f} s")
+
+
+if __name__ == "__main__":
+    _test_LSDRadixSort()
+    _benchmark()
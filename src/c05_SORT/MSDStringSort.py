@@ -0,0 +1,180 @@
+# python3 -m c05_SORT.MSDStringSort
+
+import random
+import time
+import uuid
+from itertools import accumulate
+
+from c05_SORT.DecoratedSort import Key, decorated_sort, sort_parallel
+from c05_SORT.InsertionSort import InsertionSort
+from c05_SORT.MergeSort import MergeSort
+from c05_SORT.QuickSort3Way import (Quick3String, byte_at,
+                                    quick3string_parallel)
+
+# Number of distinct digits: keys are sorted byte by byte
+R = 256
+# Ranges of at most this many keys are finished with insertion sort
+INSERTION_CUTOFF = 32
+# Ranges shorter than this use 3-way string quicksort, since a pass of
+# MSD radix sort costs O(R) on top of the keys it distributes
+QUICK3_CUTOFF = R
+
+
+def MSDStringSort(a: list, key: Key = None, reverse: bool = False) -> list:
+    """Sort a list of strings in place with MSD (most significant digit first) radix sort.
+
+    Strings are first encoded as UTF-8, whose byte order is the code point
+    order used by Python to compare strings, so that every pass
+    distributes keys among R = 256 buckets on their byte at position d.
+    Keys that end before d go to a bucket of their own ahead of the
+    others, and each bucket is then sorted on position d + 1. When all
+    keys of a range share their byte at d, as with a common prefix like
+    "https://", the range is not redistributed and d just moves on.
+    Ranges shorter than QUICK3_CUTOFF are sorted with 3-way string
+    quicksort and those of at most INSERTION_CUTOFF keys with insertion
+    sort. The sort is stable: the passes are stable, and both fallbacks
+    sort the (key, index) pairs of their range so that ties keep their
+    order.
+
+    Args:
+        a (list): A list of `str` or of `bytes` (not mixed).
+        key (callable, optional): Sort by the string key(x), computed once
+            per element; the elements may then be of any type.
+        reverse (bool): Sort in descending order.
+
+    Returns:
+        list: The sorted list (same list object as input).
+    """
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse, MSDStringSort,
+                              _msd_string_sort_keyed)
+    return _msd_string_sort_keyed(list(a), a)
+
+
+def _msd_string_sort_keyed(keys: list, values: list) -> list:
+    """Sort values in place by the parallel list of string keys."""
+    if keys and isinstance(keys[0], str):
+        # 'surrogatepass' keeps the order of lone surrogates too
+        keys = [k.encode("utf-8", "surrogatepass") for k in keys]
+    _msd_sort(keys, values, 0, len(keys), 0)
+    return values
+
+
+def _msd_sort(keys: list, values: list, lo: int, hi: int, d: int):
+    """Sort keys[lo:hi], which share their first d bytes, and values alike."""
+    while True:
+        n = hi - lo
+        if n <= INSERTION_CUTOFF:
+            # The keys share a prefix, so whole-key comparisons are fine
+            sort_parallel(keys, values, lo, hi, InsertionSort)
+            return
+        if n < QUICK3_CUTOFF:
+            quick3string_parallel(keys, values, lo, hi, d, byte_at)
+            return
+
+        part = keys[lo:hi]
+        digits = [k[d] if d < len(k) else -1 for k in part]
+        count = [0] * (R + 1)  # count[c + 1] keys have byte c, or ended
+        for c in digits:
+            count[c + 1] += 1
+        if count[digits[0] + 1] == n:
+            if digits[0] < 0:
+                return  # All keys ended: they are equal
+            d += 1
+            continue
+
+        # Keys with byte c go to part[bounds[c + 1]:bounds[c + 2]]
+        bounds = list(accumulate(count, initial=0))
+        # start[c] is the next slot for byte c; start[-1] for ended keys
+        start = bounds[1:-1] + bounds[:1]
+        sorted_keys = [None] * n
+        sorted_values = [None] * n
+        for k, v, c in zip(part, values[lo:hi], digits):
+            i = start[c]
+            start[c] = i + 1
+            sorted_keys[i] = k
+            sorted_values[i] = v
+        keys[lo:hi] = sorted_keys
+        values[lo:hi] = sorted_values
+
+        for c in range(R):
+            if count[c + 1] > 1:
+                _msd_sort(keys, values, lo + bounds[c + 1],
+                          lo + bounds[c + 2], d + 1)
+        return
+
+
+def _test_MSDStringSort():
+    rng = random.Random(17)
+    words = ["she", "sells", "seashells", "by", "the", "sea", "shore",
+             "the", "shells", "she", "sells", "are", "surely", "seashells",
+             "", "s", "sh", "shell"]
+    test_cases = [
+        [],
+        ["only"],
+        list(words),
+        [rng.choice(words) + rng.choice(words) for _ in range(3000)],
+        ["https://example.com/" + "a" * rng.randrange(50)
+         for _ in range(1000)],
+        ["same"] * 500,
+        [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(2000)],
+        ["é", "e", "ñ", "z", "a", "中", "ab", "a", "\U0001F600", "￿",
+         "\ud800"] * 40,
+        [bytes(rng.randrange(4) for _ in range(rng.randrange(6)))
+         for _ in range(2000)],
+    ]
+    for i, input_list in enumerate(test_cases):
+        expected = sorted(input_list)
+        result = MSDStringSort(input_list)
+        assert result == expected, f"Test case {i+1} failed"
+        assert result is input_list, f"Test case {i+1} did not sort in place"
+
+    records = [(rng.choice(words), i) for i in range(1000)]
+    result = MSDStringSort(list(records), key=lambda r: r[0])
+    assert [r[0] for r in result] == sorted(r[0] for r in records), \
+        "Keyed test failed"
+    assert result == sorted(records, key=lambda r: r[0]), \
+        "Keyed test is not stable"
+    result = MSDStringSort(list(words), reverse=True)
+    assert result == sorted(words, reverse=True), "Reversed test failed"
+
+    print("All MSDStringSort tests passed.")
+
+
+def _urls(n: int, rng: random.Random) -> list:
+    """Return n URL-shaped strings with long shared prefixes."""
+    hosts = [f"https://www.{name}.com/" for name in
+             ("example", "wikipedia", "python", "github", "uba")]
+    sections = ["docs", "wiki", "users", "api/v1/items", "static/img"]
+    return [f"{rng.choice(hosts)}{rng.choice(sections)}/"
+            f"{rng.randrange(10 ** rng.randrange(1, 8))}?page="
+            f"{rng.randrange(100)}" for _ in range(n)]
+
+
+def _benchmark(n: int = 100000):
+    """Time MSDStringSort against other sorts on URLs and UUIDs."""
+    rng = random.Random(42)
+    inputs = {
+        "URLs": _urls(n, rng),
+        "UUIDs": [str(uuid.UUID(int=rng.getrandbits(128)))
+                  for _ in range(n)],
+    }
+    algorithms = [
+        ("MSDStringSort", MSDStringSort),
+        ("Quick3String", Quick3String),
+        ("MergeSort", MergeSort),
+        ("sorted", sorted),
+    ]
+    print(f"n = {n}")
+    for input_name, data in inputs.items():
+        for name, func in algorithms:
+            copy = list(data)
+            start = time.perf_counter()
+            func(copy)
+            elapsed = time.perf_counter() - start
+            print(f"{input_name:6s} {name:14s}: {elapsed:.3f} s")
+
+
+if __name__ == "__main__":
+    _test_MSDStringSort()
+    _benchmark()
@@ -1,14 +1,29 @@
+from c05_SORT.DecoratedSort import Key, decorated_sort
+from c05_SORT.NumericBackend import numeric_sort
 
 
-def MergeSort(a: list) -> list:
+def MergeSort(a: list, key: Key = None, reverse: bool = False) -> list:
     """Sort the list a using the mergesort algorithm and return the sorted list.
 
+    The sort is stable: on ties the merge takes the element of the left
+    half first.
+
+    A large `array`, `memoryview` or NumPy array of numbers is sorted with
+    NumPy instead, if it is installed (see NumericBackend).
+
     Args:
         a (list): The list of elements to be sorted.
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Sort in descending order.
 
     Returns:
         list: The sorted list.
     """
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse, MergeSort)
+    vectorized = numeric_sort(a, "merge")
+    if vectorized is not None:
+        return vectorized
 
     def merge(left: list, right: list) -> list:
         result = []
@@ -34,4 +49,3 @@ def MergeSort(a: list) -> list:
 
 
 # TODO Exercise: write a unit test showing the correct operation of the sorting algorithm
-
@@ -0,0 +1,244 @@
+# python3 -m c05_SORT.NumericBackend
+
+import random
+import timeit
+from array import array
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: the sorts then run in Python
+    np = None
+
+# Numeric buffers shorter than the cutoff of a method are left to the
+# pure-Python sort, as converting to and from NumPy would cost more than
+# it saves. Crossovers measured with the benchmark below (best of 7 runs,
+# Python 3.11, NumPy 2.4, one core): between n = 50 and 100 for CountSort
+# and RadixSort, where the cutoffs take the safer end, and under n = 10 for
+# MergeSort, whose Python recursion costs the most per element. Run the
+# benchmark to tune them for another machine.
+NUMPY_CUTOFFS = {"count": 100, "radix": 100, "merge": 10}
+# Vectorized counting is used while max - min + 1 <= COUNT_RANGE_FACTOR * n,
+# radix passes otherwise
+COUNT_RANGE_FACTOR = 4
+# Bits per radix digit: NumPy's stable argsort of 16-bit integers is
+# itself a counting (radix) sort
+RADIX_BITS = 16
+
+METHODS = ("count", "radix", "merge")
+
+_INT_CODES = set("bBhHiIlLqQnN")
+_FLOAT_CODES = set("efd")
+
+
+def numeric_kind(a) -> Optional[str]:
+    """
+    Returns "int" or "float" if a is a one-dimensional buffer of machine
+    numbers: an `array`, a `memoryview` or a NumPy ndarray. None otherwise,
+    e.g. for lists, whose elements would have to be checked one by one.
+    """
+    if isinstance(a, array):
+        code = a.typecode
+    elif isinstance(a, memoryview):
+        if a.ndim != 1:
+            return None
+        code = a.format.lstrip("@=<>!")
+    elif np is not None and isinstance(a, np.ndarray):
+        if a.ndim != 1:
+            return None
+        code = {"i": "q", "u": "Q", "f": "d"}.get(a.dtype.kind, "")
+    else:
+        return None
+    if code in _INT_CODES:
+        return "int"
+    if code in _FLOAT_CODES:
+        return "float"
+    return None
+
+
+def numeric_sort(a, method: str) -> Optional[list]:
+    """
+    Sorts a numeric buffer with NumPy, giving the result the pure-Python
+    sort named by method would, or returns None to let that sort run.
+
+    The sorts call it before their own loops, so that nothing changes
+    for them when NumPy is not installed:
+        "count" (CountSort): np.bincount of key - min, expanded with
+            np.repeat; radix passes if the key range is too sparse.
+        "radix" (RadixSort): LSD passes on RADIX_BITS-bit digits of
+            order-preserving unsigned codes, each a stable argsort of the
+            digits applied as a scatter; uniform digits are skipped.
+        "merge" (MergeSort): np.sort(kind="stable").
+    Only "merge" takes floats, as CountSort and RadixSort need integers.
+
+    Args:
+        a: The sequence passed to the sort.
+        method (str): One of METHODS.
+
+    Returns:
+        Optional[list]: The sorted numbers as a new list, or None if NumPy
+        is not installed, a is not a numeric buffer of at least
+        NUMPY_CUTOFFS[method] elements or method does not take its kind.
+
+    Raises:
+        ValueError: If method is not one of METHODS.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r}.")
+    if np is None:
+        return None
+    kind = numeric_kind(a)
+    if kind is None or (kind == "float" and method != "merge"):
+        return None
+    if len(a) < NUMPY_CUTOFFS[method]:
+        return None
+    # np.asarray shares the memory of a buffer instead of copying it
+    return _VECTORIZED[method](np.asarray(a)).tolist()
+
+
+def _vectorized_count_sort(x):
+    """Counting sort of an integer ndarray with bincount and repeat."""
+    lo = int(x.min())
+    size = int(x.max()) - lo + 1
+    if size > COUNT_RANGE_FACTOR * len(x):
+        return _vectorized_radix_sort(x)
+    if x.dtype == np.uint64:
+        offsets = (x - np.uint64(lo)).astype(np.intp)
+    else:
+        # Widen first: x - lo could overflow a narrow type like int8
+        offsets = (x.astype(np.int64) - lo).astype(np.intp)
+    counts = np.bincount(offsets, minlength=size)
+    present = np.flatnonzero(counts)
+    offsets = np.repeat(present, counts[present])
+    if x.dtype == np.uint64:
+        return offsets.astype(np.uint64) + np.uint64(lo)
+    return offsets.astype(np.int64) + lo
+
+
+def _vectorized_radix_sort(x):
+    """LSD radix sort of an integer ndarray, RADIX_BITS bits per pass."""
+    if x.dtype.kind == "u":
+        codes = x.astype(np.uint64)
+        sign = np.uint64(0)
+    else:
+        # Flipping the sign bit maps int64 order onto uint64 order
+        sign = np.uint64(1 << 63)
+        codes = x.astype(np.int64).view(np.uint64) ^ sign
+    base = codes.min()
+    codes = codes - base  # Fewer passes when the keys are close together
+    width = int(codes.max()).bit_length()
+    mask = np.uint64((1 << RADIX_BITS) - 1)
+    for shift in range(0, width, RADIX_BITS):
+        digits = ((codes >> np.uint64(shift)) & mask).astype(np.uint16)
+        if digits.min() == digits.max():
+            continue  # Every key has this digit: the pass would not move
+        codes = codes[np.argsort(digits, kind="stable")]
+    codes = (codes + base) ^ sign
+    return codes if x.dtype.kind == "u" else codes.view(np.int64)
+
+
+def _vectorized_merge_sort(x):
+    """Stable sort of a numeric ndarray (NumPy's radix sort or timsort)."""
+    return np.sort(x, kind="stable")
+
+
+_VECTORIZED = {
+    "count": _vectorized_count_sort,
+    "radix": _vectorized_radix_sort,
+    "merge": _vectorized_merge_sort,
+}
+
+
+def _test_NumericBackend():
+    assert numeric_kind(array('q', [1])) == "int"
+    assert numeric_kind(array('B', b"ab")) == "int"
+    assert numeric_kind(array('d', [1.0])) == "float"
+    assert numeric_kind(memoryview(array('l', [1]))) == "int"
+    assert numeric_kind(memoryview(b"bytes")) == "int"
+    assert numeric_kind(memoryview(array('f', [1.0]))) == "float"
+    assert numeric_kind(memoryview(b"abcd").cast('B', (2, 2))) is None
+    assert numeric_kind(memoryview(b"text").cast('c')) is None
+    assert numeric_kind([1, 2, 3]) is None
+    assert numeric_sort(array('q', [3, 1, 2]), "count") is None, \
+        "A short buffer was vectorized"
+    assert numeric_sort([3, 1, 2] * NUMPY_CUTOFFS["merge"],
+                        "merge") is None, "A list was vectorized"
+    try:
+        numeric_sort(array('q'), "heap")
+        assert False, "An unknown method was accepted"
+    except ValueError:
+        pass
+    if np is None:
+        assert numeric_sort(array('q', range(NUMPY_CUTOFFS["count"])),
+                            "count") is None, "Vectorized without NumPy"
+        print("NumPy is not installed: only the fallback was tested.")
+        print("All NumericBackend tests passed.")
+        return
+
+    rng = random.Random(25)
+    n = 5 * max(NUMPY_CUTOFFS.values())
+    int_cases = [
+        array('q', (rng.randrange(-1000, 1000) for _ in range(n))),
+        array('q', (rng.randrange(-2 ** 63, 2 ** 63) for _ in range(n))),
+        array('b', (rng.randrange(-128, 128) for _ in range(n))),
+        array('Q', (rng.randrange(2 ** 64) for _ in range(n))),
+        array('Q', (2 ** 64 - rng.randrange(100) - 1 for _ in range(n))),
+        array('H', [7] * n),
+        array('i', list(range(10)) * (n // 10) + [10 ** 9]),
+        np.array([rng.randrange(50) for _ in range(n)], dtype=np.int32),
+    ]
+    for i, data in enumerate(int_cases):
+        expected = sorted(data.tolist())
+        for method in METHODS:
+            assert numeric_sort(data, method) == expected, \
+                f"Int case {i+1} failed with {method}"
+            assert numeric_sort(memoryview(data), method) == expected, \
+                f"Int case {i+1} failed with {method} on a memoryview"
+    floats = array('d', (rng.uniform(-1, 1) for _ in range(n)))
+    floats[0] = -0.0
+    assert numeric_sort(floats, "merge") == sorted(floats), \
+        "Float case failed"
+    assert numeric_sort(floats, "count") is None, "Floats were counted"
+
+    print("All NumericBackend tests passed.")
+
+
+def _benchmark(sizes=(5, 10, 20, 50, 100, 200, 500, 1000, 10000, 100000),
+               repeat: int = 7):
+    """
+    Time each method against its pure-Python sort to place its cutoff,
+    keeping the best of repeat runs so that noise does not move it.
+    """
+    # Imported here: these sorts import this module
+    from c05_SORT.CountSort import CountSort
+    from c05_SORT.MergeSort import MergeSort
+    from c05_SORT.RadixSort import RadixSort
+
+    if np is None:
+        print("NumPy is not installed: the pure-Python sorts always run.")
+        return
+    rng = random.Random(42)
+    pure = {"count": CountSort, "radix": RadixSort, "merge": MergeSort}
+    for method, sort in pure.items():
+        crossover = None
+        for n in sizes:
+            data = array('q', (rng.randrange(n) for _ in range(n)))
+            as_list = data.tolist()
+            # A list is never dispatched
+            python_time = min(timeit.repeat(lambda: sort(list(as_list)),
+                                            number=1, repeat=repeat))
+            numpy_time = min(timeit.repeat(
+                lambda: _VECTORIZED[method](np.asarray(data)).tolist(),
+                number=1, repeat=repeat))
+            if crossover is None and numpy_time < python_time:
+                crossover = n
+            print(f"{method:5s} n = {n:6d}: Python {python_time:.5f} s, "
+                  f"NumPy {numpy_time:.5f} s, "
+                  f"{python_time / numpy_time:7.1f}x")
+        print(f"{method:5s} NumPy is faster from n = {crossover} "
+              f"(NUMPY_CUTOFFS[{method!r}] = {NUMPY_CUTOFFS[method]})")
+
+
+if __name__ == "__main__":
+    _test_NumericBackend()
+    _benchmark()
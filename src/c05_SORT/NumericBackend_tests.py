@@ -0,0 +1,70 @@
+# To run:
+# PYTHONPATH=src python3 -m c05_SORT.NumericBackend_tests
+
+import random
+import unittest
+from array import array
+from c05_SORT.CountSort import CountSort
+from c05_SORT.MergeSort import MergeSort
+from c05_SORT.NumericBackend import METHODS, NUMPY_CUTOFFS, np, numeric_sort
+from c05_SORT.RadixSort import RadixSort
+
+# The pure-Python sort behind each method
+SORTS = {"count": CountSort, "radix": RadixSort, "merge": MergeSort}
+
+
+class TestNumericBackend(unittest.TestCase):
+    def test_lists_and_short_buffers_are_not_vectorized(self):
+        for method in METHODS:
+            with self.subTest(method=method):
+                n = NUMPY_CUTOFFS[method]
+                self.assertIsNone(numeric_sort(list(range(n, 0, -1)),
+                                               method))
+                self.assertIsNone(numeric_sort(array('q', range(n - 1)),
+                                               method))
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            numeric_sort(array('q', [2, 1]), "heap")
+
+    @unittest.skipUnless(np is not None, "NumPy is not installed")
+    def test_backends_agree_with_sorted(self):
+        rng = random.Random(25)
+        for method in METHODS:
+            n = NUMPY_CUTOFFS[method]
+            # Narrow key ranges, which the pure-Python sorts can count too
+            narrow = [
+                array('q', (rng.randrange(1000) for _ in range(n))),
+                array('B', (rng.randrange(256) for _ in range(2 * n))),
+                array('H', [7] * n),
+                np.array([rng.randrange(50) for _ in range(3 * n)],
+                         dtype=np.int32),
+            ]
+            wide = [
+                array('q', (rng.randrange(-2 ** 63, 2 ** 63)
+                            for _ in range(n))),
+                array('Q', (rng.randrange(2 ** 64) for _ in range(n))),
+            ]
+            for i, data in enumerate(narrow + wide):
+                with self.subTest(method=method, case=i):
+                    expected = sorted(data.tolist())
+                    self.assertEqual(numeric_sort(data, method), expected)
+                    self.assertEqual(SORTS[method](data), expected)
+                    if i < len(narrow):
+                        self.assertEqual(SORTS[method](data.tolist()),
+                                         expected)
+
+    @unittest.skipUnless(np is not None, "NumPy is not installed")
+    def test_floats_are_only_merged(self):
+        rng = random.Random(7)
+        n = NUMPY_CUTOFFS["merge"]
+        data = array('d', (rng.uniform(-1, 1) for _ in range(n)))
+        data[0] = -0.0
+        self.assertEqual(numeric_sort(data, "merge"), sorted(data))
+        self.assertEqual(MergeSort(data), MergeSort(data.tolist()))
+        self.assertIsNone(numeric_sort(data, "count"))
+        self.assertIsNone(numeric_sort(data, "radix"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+# python3 -m c05_SORT.ParallelSort
+
+import os
+import random
+import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Callable, List, Optional, Sequence
+
+from c05_SORT.LSDRadixSort import LSDRadixSort
+
+# Inputs shorter than this are sorted in the calling process
+PARALLEL_CUTOFF = 50000
+# Number of samples per worker drawn to choose the splitters
+OVERSAMPLING = 64
+
+
+def ParallelSort(a: Sequence, workers: Optional[int] = None,
+                 sort: Callable[[list], list] = LSDRadixSort,
+                 rng: Optional[random.Random] = None) -> list:
+    """Sort a list of numbers with a sample sort over a pool of processes.
+
+    The numbers are copied once into a shared-memory buffer of int64 (or
+    float64, if any of them is a float). A random sample chooses
+    workers - 1 splitters that cut the key range into one bucket per
+    worker. In a first round, each worker distributes a contiguous shard
+    of the input among the buckets and writes the shard back grouped by
+    bucket, with the size of each group. In a second round, each worker
+    gathers one bucket from all shards, sorts it with `sort` and writes it
+    at its final offset. Only buffer names, offsets and splitters are
+    pickled, never the data.
+
+    Args:
+        a (sequence): The ints (within int64) or floats to be sorted; a
+            list or an `array`. Mixed ints and floats come back as floats.
+        workers (int, optional): Number of processes; defaults to the
+            number of CPUs.
+        sort (callable): In-memory sort for the buckets, e.g. LSDRadixSort
+            or IntroSort; it must be picklable (a module-level function).
+        rng (random.Random, optional): Source of the sample. A seeded
+            generator makes the split into buckets, and so the running
+            time, reproducible; by default a fresh unseeded one is used.
+
+    Returns:
+        list: The sorted numbers (a new list).
+    """
+    n = len(a)
+    workers = max(1, workers or os.cpu_count() or 1)
+    if n < PARALLEL_CUTOFF:
+        return sort(list(a))
+    typecode = "q" if all(isinstance(x, int) for x in a) else "d"
+    splitters = _choose_splitters(a, workers, rng or random.Random())
+    workers = len(splitters) + 1  # Duplicate splitters were dropped
+    bounds = [n * k // workers for k in range(workers + 1)]
+
+    data_shm = scratch_shm = None
+    try:
+        data_shm = shared_memory.SharedMemory(create=True, size=8 * n)
+        scratch_shm = shared_memory.SharedMemory(create=True, size=8 * n)
+        data = data_shm.buf.cast(typecode)
+        data[:] = a if isinstance(a, array) and a.typecode == typecode \
+            else array(typecode, a)
+        del data
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Round 1: shard k is grouped by bucket; sizes[k][b] elements
+            # of shard k go to bucket b
+            sizes = list(pool.map(
+                _partition_shard,
+                [(data_shm.name, scratch_shm.name, typecode, bounds[k],
+                  bounds[k + 1], splitters) for k in range(workers)]))
+
+            # Round 2: bucket b is made of one group per shard
+            tasks = []
+            start = 0
+            for b in range(workers):
+                groups = []
+                for k in range(workers):
+                    lo = bounds[k] + sum(sizes[k][:b])
+                    groups.append((lo, lo + sizes[k][b]))
+                tasks.append((scratch_shm.name, data_shm.name, typecode,
+                              groups, start, sort))
+                start += sum(size[b] for size in sizes)
+            for future in [pool.submit(_sort_bucket, task) for task in tasks]:
+                future.result()
+
+        data = data_shm.buf.cast(typecode)
+        result = data.tolist()
+        del data
+    finally:
+        for shm in (data_shm, scratch_shm):
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+    return result
+
+
+def _choose_splitters(a: Sequence, workers: int,
+                      rng: random.Random) -> List:
+    """Return up to workers - 1 distinct splitters from a sample by rng."""
+    sample = sorted(rng.choices(a, k=OVERSAMPLING * workers))
+    splitters = []
+    for k in range(1, workers):
+        s = sample[k * len(sample) // workers]
+        if not splitters or splitters[-1] < s:
+            splitters.append(s)
+    return splitters
+
+
+def _partition_shard(task: tuple) -> List[int]:
+    """
+    Worker, round 1: group data[lo:hi] by bucket into scratch[lo:hi].
+
+    Args:
+        task (tuple): Names of the data and scratch shared memory, the
+            array typecode, lo, hi and the sorted splitters. Bucket b holds
+            the values x with splitters[b - 1] <= x < splitters[b].
+
+    Returns:
+        List[int]: The number of elements of the shard in each bucket.
+    """
+    data_name, scratch_name, typecode, lo, hi, splitters = task
+    data_shm = shared_memory.SharedMemory(name=data_name)
+    scratch_shm = shared_memory.SharedMemory(name=scratch_name)
+    try:
+        data = data_shm.buf.cast(typecode)
+        buckets = [array(typecode) for _ in range(len(splitters) + 1)]
+        appends = [bucket.append for bucket in buckets]
+        for x in data[lo:hi]:
+            appends[bisect_right(splitters, x)](x)
+        scratch = scratch_shm.buf.cast(typecode)
+        for bucket in buckets:
+            scratch[lo:lo + len(bucket)] = bucket
+            lo += len(bucket)
+        del data, scratch  # Release the views before closing the mappings
+    finally:
+        data_shm.close()
+        scratch_shm.close()
+    return [len(bucket) for bucket in buckets]
+
+
+def _sort_bucket(task: tuple):
+    """
+    Worker, round 2: sort one bucket, gathered from the groups of every
+    shard in scratch, into out[start:start + size].
+
+    Args:
+        task (tuple): Names of the scratch and output shared memory, the
+            array typecode, the (lo, hi) groups of the bucket, its start in
+            the output and the sort to use.
+    """
+    scratch_name, out_name, typecode, groups, start, sort = task
+    scratch_shm = shared_memory.SharedMemory(name=scratch_name)
+    out_shm = shared_memory.SharedMemory(name=out_name)
+    try:
+        scratch = scratch_shm.buf.cast(typecode)
+        bucket = []
+        for lo, hi in groups:
+            bucket.extend(scratch[lo:hi].tolist())
+        bucket = sort(bucket)
+        out = out_shm.buf.cast(typecode)
+        out[start:start + len(bucket)] = array(typecode, bucket)
+        del scratch, out
+    finally:
+        scratch_shm.close()
+        out_shm.close()
+
+
+def _test_ParallelSort():
+    rng = random.Random(20)
+    test_cases = [
+        [],
+        [1],
+        [rng.randrange(-10 ** 6, 10 ** 6) for _ in range(1000)],
+        [rng.randrange(-2 ** 63, 2 ** 63) for _ in range(PARALLEL_CUTOFF)],
+        [rng.randrange(3) for _ in range(PARALLEL_CUTOFF)],
+        [7] * PARALLEL_CUTOFF,
+        [rng.uniform(-1, 1) for _ in range(PARALLEL_CUTOFF)],
+        array("q", (rng.randrange(1000) for _ in range(PARALLEL_CUTOFF))),
+    ]
+    for i, input_list in enumerate(test_cases):
+        expected = sorted(input_list)
+        for workers in (1, 3):
+            result = ParallelSort(input_list, workers)
+            assert result == expected, \
+                f"Test case {i+1} failed with {workers} workers"
+
+    data = test_cases[3]
+    assert _choose_splitters(data, 4, random.Random(1)) == \
+        _choose_splitters(data, 4, random.Random(1)), \
+        "A seeded generator did not reproduce the splitters"
+    assert ParallelSort(data, 2, rng=random.Random(1)) == sorted(data), \
+        "Seeded test failed"
+
+    print("All ParallelSort tests passed.")
+
+
+def _benchmark(n: int = 1000000):
+    """Print the running time of ParallelSort for 1..N workers."""
+    rng = random.Random(42)
+    data = array("q", (rng.getrandbits(63) for _ in range(n)))
+    print(f"n = {n} random 63-bit integers")
+    start = time.perf_counter()
+    LSDRadixSort(data.tolist())
+    print(f"LSDRadixSort in process: {time.perf_counter() - start:.3f} s")
+    baseline = None
+    for workers in range(1, (os.cpu_count() or 1) + 1):
+        start = time.perf_counter()
+        # The same seed every time, so that runs split alike
+        ParallelSort(data, workers, rng=random.Random(42))
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:2d} workers: {elapsed:.3f} s, "
+              f"speedup {baseline / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    _test_ParallelSort()
+    _benchmark()
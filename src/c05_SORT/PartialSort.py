@@ -0,0 +1,353 @@
+# python3 -m c05_SORT.PartialSort
+
+import random
+import time
+from typing import Any, List
+
+from c05_SORT.DecoratedSort import Key
+from c05_SORT.InsertionSort import InsertionSort
+from c05_SORT.IntroSort import IntroSort, choose_pivot, hoare_partition
+from c05_SORT.MergeSort import MergeSort
+from c05_SORT.QuickSort import QuickSort
+from c06_PRIORITYQUEUE.binary_heap import BinaryHeap
+
+# Ranges of at most this many elements are finished with InsertionSort
+INSERTION_CUTOFF = 16
+
+
+def Select(a: list, k: int, key: Key = None) -> Any:
+    """Return the k-th smallest element of a (counting from 0) with introselect.
+
+    The list is rearranged in place so that a[k] is the element that
+    would be there if a were sorted, every element of a[:k] is <= a[k]
+    and every element of a[k+1:] is >= a[k]. Like quickselect, each step
+    partitions around a pivot (the median of three, or of nine for long
+    ranges, as in IntroSort) and continues on the side that holds k only.
+    Once 2*log2(n) steps have not been enough, the pivot is chosen with
+    the median of medians of groups of 5, which guarantees O(n) time on
+    every input; the expected time is O(n) anyway.
+
+    Args:
+        a (list): The list to select from, rearranged in place.
+        k (int): The rank of the element to find, 0 <= k < len(a).
+        key (callable, optional): Rank elements by key(x), computed once
+            per element.
+
+    Returns:
+        Any: The element of rank k, which is also left at a[k].
+
+    Raises:
+        ValueError: If k is out of range.
+    """
+    n = len(a)
+    if not 0 <= k < n:
+        raise ValueError(f"Rank {k} is out of range for {n} elements.")
+    if key is not None:
+        # The index breaks ties, so that elements are never compared
+        pairs = [(key(x), i) for i, x in enumerate(a)]
+        _select(pairs, 0, n, k, _depth(n))
+        a[:] = [a[i] for _, i in pairs]
+    else:
+        _select(a, 0, n, k, _depth(n))
+    return a[k]
+
+
+def PartialSort(a: list, k: int, key: Key = None,
+                reverse: bool = False) -> list:
+    """Sort in place the k smallest elements of a into a[:k].
+
+    The element of rank k - 1 is selected with introselect, which leaves
+    the k smallest elements in a[:k] in O(n) time, and only those are
+    sorted with IntroSort: O(n + k log k) instead of O(n log n). The
+    order of a[k:] is unspecified. The sort is not stable.
+
+    Args:
+        a (list): The list of elements, rearranged in place.
+        k (int): Number of elements to sort, 0 <= k <= len(a).
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Move the k largest elements, in descending order,
+            to a[:k] instead.
+
+    Returns:
+        list: The partially sorted list (same list object as input).
+
+    Raises:
+        ValueError: If k is out of range.
+    """
+    n = len(a)
+    if not 0 <= k <= n:
+        raise ValueError(f"Count {k} is out of range for {n} elements.")
+    items = a if key is None else [(key(x), i) for i, x in enumerate(a)]
+    if 0 < k < n:
+        _select(items, 0, n, n - k if reverse else k - 1, _depth(n))
+    if reverse:
+        items[:] = IntroSort(items[n - k:], reverse=True) + items[:n - k]
+    else:
+        items[:k] = IntroSort(items[:k])
+    if key is not None:
+        a[:] = [a[i] for _, i in items]
+    return a
+
+
+def NSmallest(a: list, k: int, key: Key = None) -> list:
+    """Return the k smallest elements of a, in ascending order.
+
+    A bounded max-heap (c06 BinaryHeap) holds the best k candidates seen
+    so far; a new element only enters the heap, replacing the worst
+    candidate, if it is smaller. This takes O(n log k) time and O(k)
+    extra memory, and works on any iterable, read once. The result is
+    the same as sorted(a, key=key)[:k]: equal elements keep their order.
+
+    Args:
+        a (iterable): The elements to choose from; it is not modified.
+        k (int): Number of elements to return (at least 0).
+        key (callable, optional): Compare by key(x), computed once per
+            element.
+
+    Returns:
+        list: The k smallest elements (all of them, if there are fewer).
+
+    Raises:
+        ValueError: If k is negative.
+    """
+    return _bounded_heap_select(a, k, key, _SmallCandidate)
+
+
+def NLargest(a: list, k: int, key: Key = None) -> list:
+    """Return the k largest elements of a, in descending order.
+
+    As NSmallest, with a bounded heap whose top is the smallest of the
+    candidates. The result is the same as
+    sorted(a, key=key, reverse=True)[:k].
+
+    Args:
+        a (iterable): The elements to choose from; it is not modified.
+        k (int): Number of elements to return (at least 0).
+        key (callable, optional): Compare by key(x), computed once per
+            element.
+
+    Returns:
+        list: The k largest elements (all of them, if there are fewer).
+
+    Raises:
+        ValueError: If k is negative.
+    """
+    return _bounded_heap_select(a, k, key, _LargeCandidate)
+
+
+def _depth(n: int) -> int:
+    """Return the number of quickselect steps allowed for n elements."""
+    return 2 * (max(n, 1).bit_length() - 1)
+
+
+def _select(a: list, lo: int, hi: int, k: int, depth: int):
+    """
+    Rearrange a[lo:hi], which holds rank k, so that a[k] is in its sorted
+    position; a depth of 0 uses the median of medians from the start.
+    """
+    while hi - lo > INSERTION_CUTOFF:
+        if depth > 0:
+            depth -= 1
+            pivot = choose_pivot(a, lo, hi)
+        else:
+            pivot = _median_of_medians(a, lo, hi)
+        a[lo], a[pivot] = a[pivot], a[lo]
+        j = hoare_partition(a, lo, hi)
+        if k <= j:
+            hi = j + 1
+        else:
+            lo = j + 1
+    InsertionSort(a, lo, hi)
+
+
+def _median_of_medians(a: list, lo: int, hi: int) -> int:
+    """
+    Return the index of a pivot of a[lo:hi] with at least 3/10 of the
+    elements on either side: the median of the medians of groups of 5.
+    The medians are gathered at the front of the range.
+    """
+    front = lo
+    for start in range(lo, hi, 5):
+        end = min(start + 5, hi)
+        InsertionSort(a, start, end)
+        median = (start + end - 1) // 2
+        a[front], a[median] = a[median], a[front]
+        front += 1
+    mid = lo + (front - lo) // 2
+    _select(a, lo, front, mid, 0)
+    return mid
+
+
+class _SmallCandidate:
+    """
+    An element competing to be among the k smallest, as stored in a c06
+    max-heap: the greatest is the worst candidate, the one with the
+    greatest key and, among equal keys, the latest in the input.
+    """
+
+    __slots__ = ("key", "index", "value")
+
+    def __init__(self, key: Any, index: int, value: Any):
+        self.key = key
+        self.index = index
+        self.value = value
+
+    def __gt__(self, other: "_SmallCandidate") -> bool:
+        if other.key < self.key:
+            return True
+        return not self.key < other.key and self.index > other.index
+
+    def __lt__(self, other: "_SmallCandidate") -> bool:
+        return other.__gt__(self)
+
+    @staticmethod
+    def beats(key: Any, worst: "_SmallCandidate") -> bool:
+        """Whether a later element with this key replaces worst."""
+        return key < worst.key
+
+
+class _LargeCandidate(_SmallCandidate):
+    """
+    An element competing to be among the k largest: the worst candidate
+    has the smallest key and, among equal keys, is the latest.
+    """
+
+    __slots__ = ()
+
+    def __gt__(self, other: "_LargeCandidate") -> bool:
+        if self.key < other.key:
+            return True
+        return not other.key < self.key and self.index > other.index
+
+    @staticmethod
+    def beats(key: Any, worst: "_LargeCandidate") -> bool:
+        return worst.key < key
+
+
+def _bounded_heap_select(a, k: int, key: Key, candidate: type) -> List:
+    """Return the best k elements of a, best first, as ranked by candidate."""
+    if k < 0:
+        raise ValueError(f"Count {k} is negative.")
+    if k == 0:
+        return []
+    heap = BinaryHeap()
+    beats = candidate.beats
+    worst = None
+    for index, x in enumerate(a):
+        x_key = x if key is None else key(x)
+        if worst is None:
+            heap.insert(candidate(x_key, index, x))
+            if heap.size() == k:
+                worst = heap.max()
+        elif beats(x_key, worst):
+            # Later elements never win ties, so equal keys stay out
+            heap.del_max()
+            heap.insert(candidate(x_key, index, x))
+            worst = heap.max()
+    best = []
+    while not heap.is_empty():
+        best.append(heap.del_max().value)
+    best.reverse()
+    return best
+
+
+def _test_PartialSort():
+    rng = random.Random(22)
+    test_cases = [
+        [1],
+        [5, 3, 8, 6, 2, 7, 4, 1],
+        [3, 3, 3, 3],
+        [rng.randrange(1000) for _ in range(1000)],
+        [rng.randrange(5) for _ in range(1000)],
+        list(range(2000)),
+        list(range(2000, 0, -1)),
+    ]
+    for i, input_list in enumerate(test_cases):
+        expected = sorted(input_list)
+        n = len(input_list)
+        for k in sorted({0, 1, n // 3, n // 2, n - 1, n}):
+            if k < n:
+                data = list(input_list)
+                assert Select(data, k) == expected[k], \
+                    f"Test case {i+1} failed to select rank {k}"
+                assert sorted(data) == expected, \
+                    f"Test case {i+1} lost elements selecting rank {k}"
+                assert max(data[:k + 1]) <= min(data[k:]), \
+                    f"Test case {i+1} did not partition at rank {k}"
+            data = list(input_list)
+            assert PartialSort(data, k)[:k] == expected[:k], \
+                f"Test case {i+1} failed partial sort of {k}"
+            data = list(input_list)
+            assert PartialSort(data, k, reverse=True)[:k] == \
+                expected[::-1][:k], \
+                f"Test case {i+1} failed reversed partial sort of {k}"
+            assert NSmallest(input_list, k) == expected[:k], \
+                f"Test case {i+1} failed nsmallest {k}"
+            assert NLargest(input_list, k) == expected[::-1][:k], \
+                f"Test case {i+1} failed nlargest {k}"
+
+    # Ties keep their input order, as with sorted()
+    records = [(rng.randrange(10), i) for i in range(500)]
+    for k in (0, 7, 50, 499, 500, 600):
+        by_key = lambda r: r[0]
+        assert NSmallest(records, k, key=by_key) == \
+            sorted(records, key=by_key)[:k], f"Keyed nsmallest {k} failed"
+        assert NLargest(iter(records), k, key=by_key) == \
+            sorted(records, key=by_key, reverse=True)[:k], \
+            f"Keyed nlargest {k} failed"
+        if k <= len(records):
+            data = list(records)
+            assert [r[0] for r in PartialSort(data, k, key=by_key)[:k]] == \
+                sorted(r[0] for r in records)[:k], \
+                f"Keyed partial sort {k} failed"
+            assert sorted(data) == sorted(records), "Records were lost"
+    data = list(records)
+    assert Select(data, 250, key=lambda r: r[0])[0] == \
+        sorted(r[0] for r in records)[250], "Keyed select failed"
+
+    # The median-of-medians fallback alone still selects correctly
+    data = [rng.randrange(100) for _ in range(3000)]
+    expected = sorted(data)
+    for k in (0, 1234, 2999):
+        copy = list(data)
+        _select(copy, 0, len(copy), k, 0)
+        assert copy[k] == expected[k], f"Median of medians failed at {k}"
+
+    for func, args in ((Select, ([], 0)), (Select, ([1], 1)),
+                       (PartialSort, ([1], 2)), (NSmallest, ([1], -1))):
+        try:
+            func(*args)
+            assert False, f"{func.__name__}{args} was accepted"
+        except ValueError:
+            pass
+
+    print("All PartialSort tests passed.")
+
+
+def _benchmark(n: int = 200000):
+    """Time top-k and median selection against a full sort."""
+    rng = random.Random(42)
+    data = [rng.random() for _ in range(n)]
+    print(f"n = {n} random floats")
+
+    def run(name, func):
+        copy = list(data)
+        start = time.perf_counter()
+        func(copy)
+        print(f"  {name:24s}: {time.perf_counter() - start:.3f} s")
+
+    for k in (10, 1000, n // 10):
+        print(f"k = {k}")
+        run("NSmallest", lambda a: NSmallest(a, k))
+        run("PartialSort", lambda a: PartialSort(a, k))
+        run("IntroSort, then slice", lambda a: IntroSort(a)[:k])
+        run("MergeSort, then slice", lambda a: MergeSort(a)[:k])
+    print("median")
+    run("Select", lambda a: Select(a, n // 2))
+    run("QuickSort, then index", lambda a: QuickSort(a)[n // 2])
+    run("sorted(), then index", lambda a: sorted(a)[n // 2])
+
+
+if __name__ == "__main__":
+    _test_PartialSort()
+    _benchmark()
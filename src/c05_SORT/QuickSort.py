@@ -1,14 +1,23 @@
+from c05_SORT.DecoratedSort import Key, decorated_sort
 
 
-def QuickSort(a: list) -> list:
+def QuickSort(a: list, key: Key = None, reverse: bool = False) -> list:
     """Sort the list a using the quicksort algorithm in place and return the same list.
 
+    The sort is not stable: partitioning swaps elements across equal ones.
+    It is stable when key is given, as ties are then broken by position.
+
     Args:
         a (list): The list of elements to be sorted.
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Sort in descending order.
 
     Returns:
         list: The sorted list (same list object as input).
     """
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse, QuickSort)
+
     def _quicksort(arr, low, high):
         if low < high:
             p = _partition(arr, low, high)
@@ -30,4 +39,3 @@ def QuickSort(a: list) -> list:
 
 
 # TODO Exercise: write a unit test showing the correct operation of the sorting algorithm
-
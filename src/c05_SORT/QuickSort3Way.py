@@ -0,0 +1,280 @@
+# python3 -m c05_SORT.QuickSort3Way
+
+import random
+import time
+from typing import Callable, Optional, Union
+
+from c05_SORT.DecoratedSort import Key, decorated_sort, sort_parallel
+from c05_SORT.InsertionSort import InsertionSort
+from c05_SORT.MergeSort import MergeSort
+from c05_SORT.QuickSort import QuickSort
+
+# Ranges of at most this many elements are finished with InsertionSort
+INSERTION_CUTOFF = 12
+
+
+def QuickSort3Way(a: list, key: Key = None, reverse: bool = False) -> list:
+    """Sort the list a in place using 3-way quicksort and return the same list.
+
+    Each partition (Dijkstra's "Dutch national flag") splits the range into
+    keys smaller than, equal to and greater than a random pivot, and only
+    the smaller and greater parts are sorted further. Keys equal to the
+    pivot are never looked at again, so with k distinct keys the running
+    time is O(n log k): linear when there are few distinct keys. The sort
+    is not stable, except when key is given, as ties are then broken by
+    position.
+
+    Args:
+        a (list): The list of elements to be sorted.
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Sort in descending order.
+
+    Returns:
+        list: The sorted list (same list object as input).
+    """
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse, QuickSort3Way)
+    _quicksort3(a, 0, len(a))
+    return a
+
+
+def _quicksort3(a: list, lo: int, hi: int):
+    """Sort a[lo:hi], recursing only into the smaller outer part."""
+    while hi - lo > INSERTION_CUTOFF:
+        p = random.randrange(lo, hi)
+        a[lo], a[p] = a[p], a[lo]
+        v = a[lo]
+        lt, i, gt = lo, lo + 1, hi - 1
+        while i <= gt:
+            x = a[i]
+            if x < v:
+                a[lt], a[i] = x, a[lt]
+                lt += 1
+                i += 1
+            elif v < x:
+                a[i], a[gt] = a[gt], x
+                gt -= 1
+            else:
+                i += 1
+        # Now a[lo:lt] < v == a[lt:gt+1] < a[gt+1:hi]
+        if lt - lo < hi - gt - 1:
+            _quicksort3(a, lo, lt)
+            lo = gt + 1
+        else:
+            _quicksort3(a, gt + 1, hi)
+            hi = lt
+    InsertionSort(a, lo, hi)
+
+
+def Quick3String(a: list, key: Key = None, reverse: bool = False) -> list:
+    """Sort a list of strings in place using 3-way radix quicksort.
+
+    The strings are partitioned on their character at position d into
+    those with a smaller, equal or greater character; only the "equal"
+    part moves on to position d + 1. Common prefixes are thus examined
+    once per partitioning step instead of once per comparison.
+
+    Equal strings are indistinguishable, so stability only matters with
+    key. The keyed sort is stable: it sorts (key, index) pairs, and the
+    pairs whose keys are equal are put in index order.
+
+    Args:
+        a (list): A list of `str` or of `bytes` (not mixed).
+        key (callable, optional): Sort by the string key(x), computed once
+            per element; the elements may then be of any type.
+        reverse (bool): Sort in descending order.
+
+    Returns:
+        list: The sorted list (same list object as input).
+    """
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse, Quick3String,
+                              _quick3string_keyed)
+    if a:
+        char_at = byte_at if isinstance(a[0], (bytes, bytearray)) \
+            else code_point_at
+        _quick3string(a, 0, len(a), 0, char_at)
+    return a
+
+
+def _quick3string_keyed(keys: list, values: list) -> list:
+    """Quick3String of the string keys, moving values along with them."""
+    if keys:
+        char_at = byte_at if isinstance(keys[0], (bytes, bytearray)) \
+            else code_point_at
+        quick3string_parallel(keys, values, 0, len(keys), 0, char_at)
+    return values
+
+
+def code_point_at(s: str, d: int) -> int:
+    """
+    Return the code point at position d of s, or -1 past its end, so that
+    a string sorts before its extensions.
+    """
+    return ord(s[d]) if d < len(s) else -1
+
+
+def byte_at(s: bytes, d: int) -> int:
+    """
+    Return the byte at position d of s, or -1 past its end, so that a
+    byte string sorts before its extensions.
+    """
+    return s[d] if d < len(s) else -1
+
+
+def _quick3string(a: list, lo: int, hi: int, d: int,
+                  char_at: Callable[[Union[str, bytes], int], int],
+                  ended: Optional[Callable[[list, int, int], None]] = None):
+    """
+    Sort a[lo:hi], whose elements share their first d characters.
+    ended(a, lo, hi), if given, is called on every range of elements
+    whose strings are equal and have all ended, which is otherwise left
+    as partitioning arranged it.
+    """
+    while hi - lo > INSERTION_CUTOFF:
+        p = random.randrange(lo, hi)
+        a[lo], a[p] = a[p], a[lo]
+        v = char_at(a[lo], d)
+        lt, i, gt = lo, lo + 1, hi - 1
+        while i <= gt:
+            t = char_at(a[i], d)
+            if t < v:
+                a[lt], a[i] = a[i], a[lt]
+                lt += 1
+                i += 1
+            elif t > v:
+                a[i], a[gt] = a[gt], a[i]
+                gt -= 1
+            else:
+                i += 1
+        _quick3string(a, lo, lt, d, char_at, ended)
+        _quick3string(a, gt + 1, hi, d, char_at, ended)
+        if v < 0:
+            # The middle part holds equal strings that all ended
+            if ended is not None:
+                ended(a, lt, gt + 1)
+            return
+        lo, hi, d = lt, gt + 1, d + 1
+    # Elements share a prefix, so whole-string comparisons are equivalent
+    InsertionSort(a, lo, hi)
+
+
+def quick3string_parallel(keys: list, values: list, lo: int, hi: int,
+                          d: int,
+                          char_at: Callable[[Union[str, bytes], int], int]):
+    """
+    Sort keys[lo:hi], which share their first d characters, with 3-way
+    string quicksort and permute values alike.
+
+    The (key, index) pairs of the range are sorted by the characters of
+    their key, and each range of equal keys that partitioning leaves
+    unsorted by index is merge sorted, so that ties end up in index
+    order: the sort is stable. MSDStringSort finishes its short buckets
+    with it.
+
+    Args:
+        keys (list): The string keys, sorted in place.
+        values (list): The values, moved like their keys.
+        lo (int): First index of the range to sort.
+        hi (int): One past the last index of the range to sort.
+        d (int): Length of the prefix shared by the keys of the range.
+        char_at (callable): code_point_at for str keys, byte_at for bytes.
+    """
+    def pair_char_at(pair: tuple, d: int) -> int:
+        return char_at(pair[0], d)
+
+    def order_by_index(pairs: list, lo: int, hi: int):
+        # The keys are equal, so the pairs compare by index
+        pairs[lo:hi] = MergeSort(pairs[lo:hi])
+
+    def sort(pairs: list) -> list:
+        _quick3string(pairs, 0, len(pairs), d, pair_char_at,
+                      order_by_index)
+        return pairs
+
+    sort_parallel(keys, values, lo, hi, sort)
+
+
+def _test_QuickSort3Way():
+    rng = random.Random(3)
+    test_cases = [
+        [5, 3, 8, 6, 2, 7, 4, 1],
+        [],
+        [1],
+        [3, 3, 3],
+        [rng.randrange(2) for _ in range(500)],
+        [rng.randrange(1000) for _ in range(500)],
+        list(range(500)),
+        list(range(500, 0, -1)),
+    ]
+    for i, input_list in enumerate(test_cases):
+        expected = sorted(input_list)
+        result = QuickSort3Way(input_list)
+        assert result == expected, f"Test case {i+1} failed: got {result}"
+
+    words = ["she", "sells", "seashells", "by", "the", "sea", "shore",
+             "the", "shells", "she", "sells", "are", "surely", "seashells",
+             "", "s", "sh", "shell"]
+    string_cases = [
+        [],
+        ["only"],
+        list(words),
+        [rng.choice(words) + rng.choice(words) for _ in range(300)],
+        [w.encode() for w in words * 3],
+        ["é", "e", "ñ", "z", "a", "中", "ab", "a"] * 3,
+    ]
+    for i, input_list in enumerate(string_cases):
+        expected = sorted(input_list)
+        result = Quick3String(input_list)
+        assert result == expected, f"String case {i+1} failed: got {result}"
+
+    records = [(rng.choice(words), i) for i in range(400)]
+    for func in (QuickSort3Way, Quick3String):
+        result = func(list(records), key=lambda r: r[0])
+        assert [r[0] for r in result] == sorted(r[0] for r in records), \
+            f"Keyed {func.__name__} failed"
+        assert result == sorted(records, key=lambda r: r[0]), \
+            f"Keyed {func.__name__} is not stable"
+        result = func(list(words), reverse=True)
+        assert result == sorted(words, reverse=True), \
+            f"Reversed {func.__name__} failed: got {result}"
+
+    print("All QuickSort3Way tests passed.")
+
+
+def _benchmark(n: int = 20000):
+    """Time 3-way quicksort as the number of distinct keys varies."""
+    rng = random.Random(42)
+    algorithms = [
+        ("QuickSort3Way", QuickSort3Way),
+        ("QuickSort", QuickSort),
+        ("MergeSort", MergeSort),
+    ]
+    print(f"n = {n}")
+    for distinct in (2, 10, 100, 1000, n):
+        data = [rng.randrange(distinct) for _ in range(n)]
+        for name, func in algorithms:
+            copy = list(data)
+            start = time.perf_counter()
+            try:
+                func(copy)
+                result = f"{time.perf_counter() - start:.4f} s"
+            except RecursionError:
+                result = "RecursionError"
+            print(f"{distinct:6d} distinct  {name:14s}: {result}")
+
+    statuses = ["ACTIVE", "PENDING", "SUSPENDED", "CLOSED", "ARCHIVED"]
+    data = [rng.choice(statuses) for _ in range(n)]
+    for name, func in [("Quick3String", Quick3String),
+                       ("QuickSort3Way", QuickSort3Way),
+                       ("MergeSort", MergeSort)]:
+        copy = list(data)
+        start = time.perf_counter()
+        func(copy)
+        print(f"status codes      {name:14s}: "
+              f"{time.perf_counter() - start:.4f} s")
+
+
+if __name__ == "__main__":
+    _test_QuickSort3Way()
+    _benchmark()
@@ -1,47 +1,80 @@
+from typing import Optional, Tuple
 
+from c05_SORT.DecoratedSort import Key, decorated_sort
+from c05_SORT.NumericBackend import numeric_sort
 
-def RadixSort(a: list) -> list:
+
+def RadixSort(a: list, key: Key = None, reverse: bool = False) -> list:
     """Sort the list a using the radix sort algorithm and return the sorted list.
 
+    The sort is stable, as every digit pass is a stable counting sort.
+
+    A large `array`, `memoryview` or NumPy array of numbers is sorted with
+    NumPy instead, if it is installed (see NumericBackend).
+
     Args:
         a (list): The list of non-negative integers to be sorted.
+        key (callable, optional): Sort by the non-negative integer key(x),
+            computed once per element.
+        reverse (bool): Sort in descending order.
 
     Returns:
         list: The sorted list.
     """
-    if len(a) == 0:
-        return a
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse, RadixSort, _radix_sort)
+    vectorized = numeric_sort(a, "radix")
+    if vectorized is not None:
+        return vectorized
+    return _radix_sort(a)
 
-    max_val = max(a)
+
+def _radix_sort(keys: list, values: Optional[list] = None) -> list:
+    """
+    Return values ordered by the parallel list of non-negative integer
+    keys, or the sorted keys themselves if values is None, in which case
+    each pass moves only the keys.
+    """
+    if len(keys) == 0:
+        return list(keys if values is None else values)
+
+    max_val = max(keys)
     exp = 1  # exponent - 1, 10, 100, ...
 
     while max_val // exp > 0:
-        a = _counting_sort_for_radix(a, exp)
+        keys, values = _counting_sort_for_radix(keys, values, exp)
         exp *= 10
 
-    return a
+    return keys if values is None else values
 
 
-def _counting_sort_for_radix(a: list, exp: int) -> list:
-    n = len(a)
-    output = [0] * n
+def _counting_sort_for_radix(keys: list, values: Optional[list],
+                             exp: int) -> Tuple[list, Optional[list]]:
+    n = len(keys)
+    output_keys = [0] * n
     count = [0] * 10
 
-    for i in range(n):
-        index = (a[i] // exp) % 10
-        count[index] += 1
+    for k in keys:
+        count[(k // exp) % 10] += 1
 
     for i in range(1, 10):
         count[i] += count[i - 1]
 
-    i = n - 1
-    while i >= 0:
-        index = (a[i] // exp) % 10
-        output[count[index] - 1] = a[i]
+    if values is None:
+        for i in range(n - 1, -1, -1):
+            index = (keys[i] // exp) % 10
+            count[index] -= 1
+            output_keys[count[index]] = keys[i]
+        return output_keys, None
+
+    output_values = [None] * n
+    for i in range(n - 1, -1, -1):
+        index = (keys[i] // exp) % 10
         count[index] -= 1
-        i -= 1
+        output_keys[count[index]] = keys[i]
+        output_values[count[index]] = values[i]
 
-    return output
+    return output_keys, output_values
 
 
 # TODO write a unit test showing the correct operation of the sorting algorithm
@@ -62,6 +95,14 @@ def _test_RadixSort():
         result = RadixSort(input_list)
         assert result == expected, f"Test case {i+1} failed: expected {expected}, got {result}"
 
+    words = ["ccc", "a", "bb", "dd", "e", "ffff"]
+    result = RadixSort(words, key=len)
+    assert result == ["a", "e", "bb", "dd", "ccc", "ffff"], \
+        f"Keyed test failed: got {result}"
+    result = RadixSort(words, key=len, reverse=True)
+    assert result == ["ffff", "ccc", "bb", "dd", "a", "e"], \
+        f"Reversed keyed test failed: got {result}"
+
     print("All RadixSort tests passed.")
 
 
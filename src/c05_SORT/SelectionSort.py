@@ -1,14 +1,23 @@
+from c05_SORT.DecoratedSort import Key, decorated_sort
 
 
-def SelectionSort(a: list) -> list:
+def SelectionSort(a: list, key: Key = None, reverse: bool = False) -> list:
     """Sort the list a using the selection sort algorithm and return the sorted list.
 
+    The sort is not stable: swapping the minimum into place can move an
+    element past others equal to it. It is stable when key is given, as
+    ties are then broken by position.
+
     Args:
         a (list): The list of elements to be sorted.
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Sort in descending order.
 
     Returns:
         list: The sorted list.
     """
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse, SelectionSort)
     n = len(a)
     for i in range(n):
         min_index = i
@@ -1,17 +1,131 @@
+# python3 -m c05_SORT.ShellSort
 
+import random
+from functools import lru_cache, partial
+from typing import Callable, Dict, Iterator, Tuple
 
-def ShellSort(a: list) -> list:
+from c05_SORT.DecoratedSort import Key, decorated_sort
+
+
+def _shell_gaps(n: int) -> Iterator[int]:
+    """Shell (1959): n/2, n/4, ..., 1. Quadratic in the worst case."""
+    gap = n // 2
+    while gap > 0:
+        yield gap
+        gap //= 2
+
+
+def _knuth_gaps(n: int) -> Iterator[int]:
+    """Knuth (1973): 1, 4, 13, 40, ..., (3^k - 1)/2, up to n/3."""
+    gap = 1
+    while gap < max(n // 3, 2):
+        yield gap
+        gap = 3 * gap + 1
+
+
+def _sedgewick_gaps(n: int) -> Iterator[int]:
+    """Sedgewick (1986): 1, 8, 23, 77, 281, ..., 4^k + 3*2^(k-1) + 1."""
+    yield 1
+    k = 1
+    while True:
+        yield 4 ** k + 3 * 2 ** (k - 1) + 1
+        k += 1
+
+
+def _tokuda_gaps(n: int) -> Iterator[int]:
+    """Tokuda (1992): 1, 4, 9, 20, 46, ..., ceil((9^k - 4^k)/(5*4^(k-1)))."""
+    k = 1
+    while True:
+        yield -(-(9 ** k - 4 ** k) // (5 * 4 ** (k - 1)))
+        k += 1
+
+
+# Ciura (2001) found these gaps experimentally; past 701 each gap is
+# the previous one times 2.25, the usual extension
+CIURA_GAPS = (1, 4, 10, 23, 57, 132, 301, 701)
+
+
+def _ciura_gaps(n: int) -> Iterator[int]:
+    """Ciura (2001), extended: 1, 4, 10, 23, 57, 132, 301, 701, 1577, ..."""
+    yield from CIURA_GAPS
+    gap = CIURA_GAPS[-1]
+    while True:
+        gap = gap * 9 // 4
+        yield gap
+
+
+GAP_SEQUENCES: Dict[str, Callable[[int], Iterator[int]]] = {
+    "shell": _shell_gaps,
+    "knuth": _knuth_gaps,
+    "sedgewick": _sedgewick_gaps,
+    "tokuda": _tokuda_gaps,
+    "ciura": _ciura_gaps,
+}
+
+
+@lru_cache(maxsize=256)
+def gap_sequence(gaps: str, n: int) -> Tuple[int, ...]:
+    """
+    Returns the gaps below n of a named sequence, largest first and
+    ending in 1, computed once per (gaps, n) and cached.
+
+    Args:
+        gaps (str): A key of GAP_SEQUENCES.
+        n (int): The length of the list to sort.
+
+    Returns:
+        Tuple[int, ...]: The gaps in the order they are used.
+
+    Raises:
+        ValueError: If gaps is not a known sequence.
+    """
+    if gaps not in GAP_SEQUENCES:
+        raise ValueError(f"Unknown gap sequence {gaps!r}.")
+    sequence = []
+    for gap in GAP_SEQUENCES[gaps](n):
+        if gap > 1 and gap >= n:
+            break
+        sequence.append(gap)
+    # Shell's sequence is generated decreasing, the others increasing, and
+    # it has no gaps at all for n < 2
+    return tuple(sorted(set(sequence) | {1}, reverse=True))
+
+
+def ShellSort(a: list, key: Key = None, reverse: bool = False,
+              gaps: str = "shell") -> list:
     """Sort the list a using the shell sort algorithm and return the sorted list.
 
+    Insertion sorts elements gap apart for each gap of a decreasing
+    sequence that ends in 1. The sequence decides the running time:
+        "shell": n/2, n/4, ..., 1 (the original; O(n^2) worst case).
+        "knuth": 1, 4, 13, 40, ... (O(n^1.5)).
+        "sedgewick": 1, 8, 23, 77, 281, ... (O(n^(4/3))).
+        "tokuda": 1, 4, 9, 20, 46, 103, ...
+        "ciura": 1, 4, 10, 23, 57, 132, 301, 701, then x2.25; usually the
+            fewest comparisons, with tokuda close behind.
+    See gap_sequence for the gaps used for a given n.
+
+    The sort is not stable: gapped insertions move elements past equal
+    ones that lie between them. It is stable when key is given, as ties
+    are then broken by position.
+
     Args:
         a (list): The list of elements to be sorted.
+        key (callable, optional): Sort by key(x), computed once per element.
+        reverse (bool): Sort in descending order.
+        gaps (str): The name of the gap sequence, a key of GAP_SEQUENCES.
 
     Returns:
         list: The sorted list.
+
+    Raises:
+        ValueError: If gaps is not a known sequence.
     """
+    if key is not None or reverse:
+        return decorated_sort(a, key, reverse,
+                              partial(ShellSort, gaps=gaps))
     n = len(a)
-    gap = n // 2
-    while gap > 0:
+    for gap in gap_sequence(gaps, n):
         for i in range(gap, n):
             temp = a[i]
             j = i
@@ -19,9 +133,30 @@ def ShellSort(a: list) -> list:
                 a[j] = a[j - gap]
                 j -= gap
             a[j] = temp
-        gap //= 2
     return a
 
 
+def _benchmark(sizes: Tuple[int, ...] = (1000, 10000, 50000)):
+    """Print comparisons and running time of every gap sequence."""
+    # Imported here: SortBenchmark imports this module
+    from c05_SORT.SortBenchmark import Counted, summarize, time_trials
+
+    rng = random.Random(42)
+    for n in sizes:
+        data = [rng.randrange(n) for _ in range(n)]
+        print(f"n = {n} random integers")
+        for gaps in GAP_SEQUENCES:
+            Counted.comparisons = 0
+            ShellSort([Counted(x) for x in data], gaps=gaps)
+            stats = summarize(time_trials(partial(ShellSort, gaps=gaps),
+                                          data, repeat=5))
+            print(f"  {gaps:10s}: {Counted.comparisons:12,d} comparisons, "
+                  f"median {stats['median_s']:.4f} s, "
+                  f"{len(gap_sequence(gaps, n)):2d} gaps")
+
+
 # TODO Exercise: write a unit test showing the correct operation of the sorting algorithm
 
+
+if __name__ == "__main__":
+    _benchmark()
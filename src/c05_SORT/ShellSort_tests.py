@@ -0,0 +1,72 @@
+# To run:
+# PYTHONPATH=src python3 -m c05_SORT.ShellSort_tests
+
+import random
+import unittest
+from c05_SORT.ShellSort import GAP_SEQUENCES, ShellSort, gap_sequence
+
+
+class TestGapSequence(unittest.TestCase):
+    def test_known_prefixes(self):
+        n = 10 ** 6
+        prefixes = {
+            "knuth": (1, 4, 13),
+            "sedgewick": (1, 8, 23, 77),
+            "tokuda": (1, 4, 9, 20, 46),
+            "ciura": (1, 4, 10, 23, 57),
+        }
+        for gaps, prefix in prefixes.items():
+            with self.subTest(gaps=gaps):
+                increasing = gap_sequence(gaps, n)[::-1]
+                self.assertEqual(increasing[:len(prefix)], prefix)
+        self.assertEqual(gap_sequence("shell", 100),
+                         (50, 25, 12, 6, 3, 1))
+
+    def test_ciura_extension(self):
+        increasing = gap_sequence("ciura", 10 ** 6)[::-1]
+        self.assertEqual(increasing[:8], (1, 4, 10, 23, 57, 132, 301, 701))
+        for gap, following in zip(increasing[7:], increasing[8:]):
+            self.assertEqual(following, gap * 9 // 4)
+        self.assertEqual(increasing[8], 1577)
+
+    def test_gaps_below_n_ending_in_one(self):
+        for gaps in GAP_SEQUENCES:
+            for n in (0, 1, 2, 3, 10, 100, 1000, 12345):
+                with self.subTest(gaps=gaps, n=n):
+                    sequence = gap_sequence(gaps, n)
+                    self.assertEqual(sequence[-1], 1)
+                    self.assertEqual(list(sequence),
+                                     sorted(set(sequence), reverse=True))
+                    if n > 1:
+                        self.assertLess(sequence[0], n)
+
+    def test_unknown_sequence(self):
+        with self.assertRaises(ValueError):
+            gap_sequence("fibonacci", 100)
+        with self.assertRaises(ValueError):
+            ShellSort([3, 1, 2], gaps="fibonacci")
+
+
+class TestShellSortGaps(unittest.TestCase):
+    def test_every_sequence_sorts(self):
+        rng = random.Random(23)
+        cases = [
+            [],
+            [1],
+            [2, 1],
+            [rng.randrange(1000) for _ in range(1000)],
+            [rng.randrange(5) for _ in range(500)],
+            list(range(300, 0, -1)),
+        ]
+        for gaps in GAP_SEQUENCES:
+            for i, data in enumerate(cases):
+                with self.subTest(gaps=gaps, case=i):
+                    self.assertEqual(ShellSort(list(data), gaps=gaps),
+                                     sorted(data))
+                    self.assertEqual(ShellSort(list(data), reverse=True,
+                                               gaps=gaps),
+                                     sorted(data, reverse=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
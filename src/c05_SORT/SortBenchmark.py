@@ -0,0 +1,469 @@
+# Benchmark suite for the sorting algorithms
+# python3 -m c05_SORT.SortBenchmark --min-n 1000 --max-n 100000 --csv sort.csv
+
+import argparse
+import csv
+import gc
+import json
+import math
+import platform
+import random
+import statistics
+import time
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional, Sequence
+
+from c05_SORT.AdaptiveMergeSort import AdaptiveMergeSort
+from c05_SORT.BinaryInsertionSort import BinaryInsertionSort
+from c05_SORT.BottomUpMergeSort import BottomUpMergeSort
+from c05_SORT.BoundedCountSort import BoundedCountSort
+from c05_SORT.CountSort import CountSort
+from c05_SORT.InsertionSort import InsertionSort
+from c05_SORT.IntroSort import IntroSort
+from c05_SORT.LSDRadixSort import LSDRadixSort
+from c05_SORT.MergeSort import MergeSort
+from c05_SORT.QuickSort import QuickSort
+from c05_SORT.QuickSort3Way import QuickSort3Way
+from c05_SORT.RadixSort import RadixSort
+from c05_SORT.SelectionSort import SelectionSort
+from c05_SORT.ShellSort import ShellSort
+
+# A distribution makes a list of n non-negative integers from a generator
+Distribution = Callable[[int, random.Random], list]
+
+# Algorithms that are quadratic on some inputs run on a capped n
+QUADRATIC = {"InsertionSort", "BinaryInsertionSort", "SelectionSort",
+             "QuickSort"}
+# Algorithms that only compare elements, so that comparisons can be counted
+COMPARISON_SORTS = {"InsertionSort", "BinaryInsertionSort",
+                    "SelectionSort", "ShellSort",
+                    "MergeSort", "BottomUpMergeSort", "AdaptiveMergeSort",
+                    "QuickSort", "IntroSort", "QuickSort3Way"}
+
+FIELDS = ["algorithm", "distribution", "n", "repeat", "median_s", "p95_s",
+          "ci_low_s", "ci_high_s", "comparisons", "writes", "error"]
+
+
+def random_ints(n: int, rng: random.Random) -> list:
+    """n uniformly random integers in [0, n)."""
+    return [rng.randrange(n) for _ in range(n)]
+
+
+def sorted_ints(n: int, rng: random.Random) -> list:
+    """0, 1, ..., n-1."""
+    return list(range(n))
+
+
+def reversed_ints(n: int, rng: random.Random) -> list:
+    """n-1, n-2, ..., 0."""
+    return list(range(n - 1, -1, -1))
+
+
+def sawtooth(n: int, rng: random.Random) -> list:
+    """About sqrt(n) ascending runs of sqrt(n) integers each."""
+    run = max(1, math.isqrt(n))
+    return [i % run for i in range(n)]
+
+
+def few_unique(n: int, rng: random.Random) -> list:
+    """n random integers among 8 distinct values."""
+    return [rng.randrange(8) for _ in range(n)]
+
+
+def zipf(n: int, rng: random.Random) -> list:
+    """n integers in [1, n] where k has probability proportional to 1/k."""
+    cum_weights = list(accumulate(1 / k for k in range(1, n + 1)))
+    return rng.choices(range(1, n + 1), cum_weights=cum_weights, k=n)
+
+
+def organ_pipe(n: int, rng: random.Random) -> list:
+    """An ascending half followed by a descending half: 0, 1, ..., 1, 0."""
+    return [min(i, n - 1 - i) for i in range(n)]
+
+
+DISTRIBUTIONS: Dict[str, Distribution] = {
+    "random": random_ints,
+    "sorted": sorted_ints,
+    "reversed": reversed_ints,
+    "sawtooth": sawtooth,
+    "few_unique": few_unique,
+    "zipf": zipf,
+    "organ_pipe": organ_pipe,
+}
+
+ALGORITHMS: Dict[str, Callable[[list], list]] = {
+    "CountSort": CountSort,
+    "BoundedCountSort": BoundedCountSort,
+    "RadixSort": RadixSort,
+    "LSDRadixSort": LSDRadixSort,
+    "MergeSort": MergeSort,
+    "BottomUpMergeSort": BottomUpMergeSort,
+    "AdaptiveMergeSort": AdaptiveMergeSort,
+    "QuickSort": QuickSort,
+    "IntroSort": IntroSort,
+    "QuickSort3Way": QuickSort3Way,
+    "ShellSort": ShellSort,
+    "InsertionSort": InsertionSort,
+    "BinaryInsertionSort": BinaryInsertionSort,
+    "SelectionSort": SelectionSort,
+}
+
+
+class Counted:
+    """
+    An element that counts the comparisons made between elements of its
+    kind. Reset Counted.comparisons before the sort to be measured.
+    """
+
+    __slots__ = ("_value",)
+    comparisons = 0
+
+    def __init__(self, value):
+        self._value = value
+
+    def __lt__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self._value < other._value
+
+    def __le__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self._value <= other._value
+
+    def __gt__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self._value > other._value
+
+    def __ge__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self._value >= other._value
+
+    def __eq__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self._value == other._value
+
+    def __ne__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self._value != other._value
+
+    __hash__ = None
+
+
+class CountingList(list):
+    """
+    A list that counts the element writes of a sort: a swap
+    a[i], a[j] = a[j], a[i] counts 2 and a slice assignment counts the
+    length of the slice. Slices and copies of a CountingList are
+    CountingLists too, whose writes, including the elements copied into
+    them, are added to the list they were taken from. The auxiliary
+    buffers that a sort slices or copies out of its input are thus
+    counted, and a[i:j] = b[k:l] counts 2 * (j - i), as Python copies the
+    elements into a new list before assigning them.
+    """
+
+    def __init__(self, iterable=(), owner: Optional["CountingList"] = None):
+        super().__init__(iterable)
+        self.writes = 0
+        self._owner = self if owner is None else owner
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            result = CountingList(super().__getitem__(index), self._owner)
+            self._owner.writes += len(result)
+            return result
+        return super().__getitem__(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            self._owner.writes += len(value)
+        else:
+            self._owner.writes += 1
+        super().__setitem__(index, value)
+
+    def copy(self) -> "CountingList":
+        return self[:]
+
+
+def time_trials(func: Callable[[list], list], data: list, repeat: int = 7,
+                warmup: int = 1) -> List[float]:
+    """
+    Returns the running times of func on `repeat` fresh copies of data,
+    after `warmup` untimed runs. The garbage collector is disabled while
+    a trial is timed, as `timeit` does.
+
+    Args:
+        func (callable): The sort, which may sort its argument in place.
+        data (list): The input, which is never modified.
+        repeat (int): Number of timed trials.
+        warmup (int): Number of runs discarded before timing.
+
+    Returns:
+        List[float]: The running time of each trial, in seconds.
+    """
+    for _ in range(warmup):
+        func(list(data))
+    times = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            copy = list(data)
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            func(copy)
+            times.append(time.perf_counter() - start)
+            if gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return times
+
+
+def summarize(times: Sequence[float], confidence: float = 0.95) -> dict:
+    """
+    Returns the median, the 95th percentile and a distribution-free
+    confidence interval for the median of a sample of running times.
+
+    The interval is made of the order statistics whose ranks are
+    n/2 -+ z * sqrt(n)/2, the normal approximation of the binomial
+    distribution of the number of times below the true median. Unlike
+    mean -+ stdev, it is not thrown off by the long right tail of
+    running times.
+
+    Args:
+        times (sequence): At least one running time.
+        confidence (float): Confidence level of the interval, in (0, 1).
+
+    Returns:
+        dict: median_s, p95_s, ci_low_s and ci_high_s.
+
+    Raises:
+        ValueError: If times is empty or confidence is not in (0, 1).
+    """
+    if not times:
+        raise ValueError("There are no times to summarize.")
+    if not 0 < confidence < 1:
+        raise ValueError(f"Confidence {confidence} is not in (0, 1).")
+    ordered = sorted(times)
+    n = len(ordered)
+    p95 = (statistics.quantiles(ordered, n=20, method="inclusive")[18]
+           if n > 1 else ordered[0])
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+    half_width = z * math.sqrt(n) / 2
+    low = max(0, math.floor(n / 2 - half_width))
+    high = min(n - 1, math.ceil(n / 2 + half_width) - 1)
+    return {
+        "median_s": statistics.median(ordered),
+        "p95_s": p95,
+        "ci_low_s": ordered[low],
+        "ci_high_s": ordered[high],
+    }
+
+
+def count_operations(func: Callable[[list], list], data: list) -> dict:
+    """
+    Runs func once on instrumented data and counts its operations.
+
+    Args:
+        func (callable): The sort to instrument.
+        data (list): The input, which is never modified.
+
+    Returns:
+        dict: comparisons between elements (None unless the sort only
+        compares them) and element writes into the input list and the
+        buffers taken from it (None if the sort returns a new list, whose
+        writes cannot be seen).
+    """
+    name = getattr(func, "__name__", "")
+    if name in COMPARISON_SORTS:
+        instrumented = CountingList(Counted(x) for x in data)
+    else:
+        instrumented = CountingList(data)
+    Counted.comparisons = 0
+    result = func(instrumented)
+    return {
+        "comparisons": (Counted.comparisons if name in COMPARISON_SORTS
+                        else None),
+        "writes": instrumented.writes if result is instrumented else None,
+    }
+
+
+def measure(name: str, distribution: str, n: int, seed: int,
+            repeat: int = 7, warmup: int = 1) -> dict:
+    """
+    Runs one algorithm on one distribution: timed trials, then one
+    instrumented run, which would otherwise distort the timing.
+
+    Args:
+        name (str): Key of ALGORITHMS.
+        distribution (str): Key of DISTRIBUTIONS.
+        n (int): Number of elements.
+        seed (int): Seed of the distribution generator.
+        repeat (int): Number of timed trials.
+        warmup (int): Number of untimed runs before the trials.
+
+    Returns:
+        dict: A JSON-serializable record with the FIELDS. If the sort
+        raises RecursionError, as QuickSort does on sorted input, only
+        the error is recorded.
+    """
+    data = DISTRIBUTIONS[distribution](n, random.Random(seed))
+    func = ALGORITHMS[name]
+    record = dict.fromkeys(FIELDS)
+    record.update(algorithm=name, distribution=distribution, n=n,
+                  repeat=repeat)
+    try:
+        record.update(summarize(time_trials(func, data, repeat, warmup)))
+        record.update(count_operations(func, data))
+    except RecursionError:
+        record["error"] = "RecursionError"
+    return record
+
+
+def log_sizes(min_n: int, max_n: int, per_decade: int = 3) -> List[int]:
+    """
+    Returns sizes from min_n to max_n evenly spaced on a log scale.
+
+    Args:
+        min_n (int): The smallest size (at least 1).
+        max_n (int): The largest size (at least min_n).
+        per_decade (int): Number of sizes per factor of 10.
+
+    Returns:
+        List[int]: The distinct sizes, in increasing order.
+
+    Raises:
+        ValueError: If the bounds or per_decade are out of range.
+    """
+    if not 1 <= min_n <= max_n:
+        raise ValueError(f"Sizes {min_n}..{max_n} are not 1 <= min <= max.")
+    if per_decade < 1:
+        raise ValueError(f"Sizes per decade {per_decade} is less than 1.")
+    steps = math.ceil(math.log10(max_n / min_n) * per_decade)
+    sizes = {min_n, max_n}
+    for i in range(1, steps):
+        sizes.add(round(min_n * (max_n / min_n) ** (i / steps)))
+    return sorted(sizes)
+
+
+def growth_exponent(sizes: Sequence[int],
+                    times: Sequence[float]) -> Optional[float]:
+    """
+    Returns the slope b of the least-squares fit of log t = a + b log n,
+    that is, t grows about as n**b: near 1 for n log n algorithms in this
+    range, near 2 for quadratic ones. None with fewer than two sizes.
+    """
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, times)
+              if t > 0]
+    if len({x for x, _ in points}) < 2:
+        return None
+    slope, _ = statistics.linear_regression(*zip(*points))
+    return slope
+
+
+def growth_exponents(records: List[dict]) -> List[dict]:
+    """Fit the growth exponent of every algorithm on every distribution."""
+    series: Dict[tuple, List[dict]] = {}
+    for record in records:
+        if record["error"] is None:
+            key = (record["algorithm"], record["distribution"])
+            series.setdefault(key, []).append(record)
+    return [{"algorithm": name, "distribution": distribution,
+             "exponent": growth_exponent([r["n"] for r in points],
+                                         [r["median_s"] for r in points])}
+            for (name, distribution), points in series.items()]
+
+
+def run_suite(sizes: List[int], seed: int, algorithms: List[str],
+              distributions: List[str], repeat: int, warmup: int,
+              quadratic_n: int) -> List[dict]:
+    """Measure every algorithm on every distribution and size."""
+    records = []
+    print(f"{'algorithm':19s} {'distribution':12s} {'n':>8s} "
+          f"{'median ms':>10s} {'95% CI ms':>19s} {'p95 ms':>9s} "
+          f"{'comparisons':>12s} {'writes':>10s}")
+    for distribution in distributions:
+        for name in algorithms:
+            for n in sizes:
+                if name in QUADRATIC and n > quadratic_n:
+                    break
+                record = measure(name, distribution, n, seed, repeat, warmup)
+                records.append(record)
+                if record["error"]:
+                    print(f"{name:19s} {distribution:12s} {n:8d} "
+                          f"{record['error']}")
+                    break  # Larger sizes would fail too
+                ci = (f"{1000 * record['ci_low_s']:.3f}.."
+                      f"{1000 * record['ci_high_s']:.3f}")
+                print(f"{name:19s} {distribution:12s} {n:8d} "
+                      f"{1000 * record['median_s']:10.3f} {ci:>19s} "
+                      f"{1000 * record['p95_s']:9.3f} "
+                      f"{_count(record['comparisons']):>12s} "
+                      f"{_count(record['writes']):>10s}")
+    return records
+
+
+def _count(value: Optional[int]) -> str:
+    return "-" if value is None else f"{value:,d}"
+
+
+def write_csv(path: str, records: List[dict]):
+    """Write one row per record, with the FIELDS as header."""
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the sorting algorithms.")
+    parser.add_argument("--min-n", type=int, default=1000)
+    parser.add_argument("--max-n", type=int, default=20000)
+    parser.add_argument("--per-decade", type=int, default=3,
+                        help="sizes per factor of 10 between min and max")
+    parser.add_argument("--repeat", type=int, default=7,
+                        help="timed trials per measurement")
+    parser.add_argument("--warmup", type=int, default=1,
+                        help="untimed runs before the trials")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--quadratic-n", type=int, default=5000,
+                        help="cap on n for " + ", ".join(sorted(QUADRATIC)))
+    parser.add_argument("--algo", nargs="*", default=list(ALGORITHMS),
+                        choices=list(ALGORITHMS))
+    parser.add_argument("--dist", nargs="*", default=list(DISTRIBUTIONS),
+                        choices=list(DISTRIBUTIONS))
+    parser.add_argument("--csv", help="write the results to this file")
+    parser.add_argument("--json", help="write the results and the fitted "
+                        "exponents to this file")
+    args = parser.parse_args()
+
+    sizes = log_sizes(args.min_n, args.max_n, args.per_decade)
+    records = run_suite(sizes, args.seed, args.algo, args.dist,
+                        args.repeat, args.warmup, args.quadratic_n)
+    exponents = growth_exponents(records)
+    print()
+    print(f"{'algorithm':19s} {'distribution':12s} {'exponent':>8s}")
+    for row in exponents:
+        exponent = row["exponent"]
+        print(f"{row['algorithm']:19s} {row['distribution']:12s} "
+              f"{'-' if exponent is None else f'{exponent:.2f}':>8s}")
+
+    if args.csv:
+        write_csv(args.csv, records)
+    if args.json:
+        report = {
+            "python": platform.python_version(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "warmup": args.warmup,
+            "results": records,
+            "exponents": exponents,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
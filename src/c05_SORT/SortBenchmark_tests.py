@@ -0,0 +1,85 @@
+# To run:
+# PYTHONPATH=src python3 -m c05_SORT.SortBenchmark_tests
+
+import random
+import unittest
+from c05_SORT.SortBenchmark import (ALGORITHMS, DISTRIBUTIONS, FIELDS,
+                                    count_operations, growth_exponent,
+                                    log_sizes, measure, summarize)
+
+
+class TestSortBenchmark(unittest.TestCase):
+    def test_distributions(self):
+        for name, make in DISTRIBUTIONS.items():
+            with self.subTest(distribution=name):
+                data = make(1000, random.Random(1))
+                self.assertEqual(len(data), 1000)
+                self.assertTrue(all(isinstance(x, int) and x >= 0
+                                    for x in data))
+        self.assertEqual(DISTRIBUTIONS["organ_pipe"](6, random.Random()),
+                         [0, 1, 2, 2, 1, 0])
+        self.assertEqual(DISTRIBUTIONS["sawtooth"](9, random.Random()),
+                         [0, 1, 2] * 3)
+
+    def test_summarize(self):
+        stats = summarize([5.0, 1.0, 3.0, 2.0, 4.0])
+        self.assertEqual(stats["median_s"], 3.0)
+        self.assertLessEqual(stats["ci_low_s"], 3.0)
+        self.assertGreaterEqual(stats["ci_high_s"], 3.0)
+        self.assertAlmostEqual(stats["p95_s"], 4.8)
+        self.assertEqual(summarize([2.0])["ci_low_s"], 2.0)
+        with self.assertRaises(ValueError):
+            summarize([])
+        with self.assertRaises(ValueError):
+            summarize([1.0], confidence=1)
+
+    def test_log_sizes(self):
+        self.assertEqual(log_sizes(10, 1000, 1), [10, 100, 1000])
+        self.assertEqual(log_sizes(50, 50), [50])
+        with self.assertRaises(ValueError):
+            log_sizes(100, 10)
+
+    def test_growth_exponent(self):
+        sizes = [100, 1000, 10000]
+        self.assertAlmostEqual(growth_exponent(sizes, [n * n for n in sizes]),
+                               2.0)
+        self.assertAlmostEqual(growth_exponent(sizes, [3 * n for n in sizes]),
+                               1.0)
+        self.assertIsNone(growth_exponent([100], [1.0]))
+
+    def test_count_operations(self):
+        data = list(range(20, 0, -1))
+        # Insertion sort of a reversed list: one comparison and one shift
+        # per inversion, plus the comparison that stops each pass
+        counts = count_operations(ALGORITHMS["InsertionSort"], data)
+        self.assertEqual(counts["comparisons"], 20 * 19 // 2)
+        self.assertGreater(counts["writes"], 0)
+        self.assertEqual(data, list(range(20, 0, -1)))
+        counts = count_operations(ALGORITHMS["CountSort"], data)
+        self.assertEqual(counts, {"comparisons": None, "writes": None})
+
+    def test_count_writes_into_buffers(self):
+        data = list(range(63, -1, -1))
+        # Bottom-up mergesort of 64 reversed elements: two insertion sorts
+        # of 32 (496 shifts and 31 placements each), the copy into the
+        # buffer (64), a merge taking the right run one by one (32) and
+        # the left one as a slice (32 + 32), and the copy back (64)
+        counts = count_operations(ALGORITHMS["BottomUpMergeSort"], data)
+        self.assertEqual(counts["writes"], 2 * (496 + 31) + 64 + 96 + 64)
+        # A single descending run is reversed with slices: 64 elements are
+        # sliced out, reversed into a new list and assigned back
+        counts = count_operations(ALGORITHMS["AdaptiveMergeSort"], data)
+        self.assertEqual(counts, {"comparisons": 63, "writes": 3 * 64})
+
+    def test_measure(self):
+        record = measure("MergeSort", "zipf", 500, seed=3, repeat=3)
+        self.assertEqual(list(record), FIELDS)
+        self.assertIsNone(record["error"])
+        self.assertLessEqual(record["ci_low_s"], record["median_s"])
+        self.assertGreater(record["comparisons"], 0)
+        record = measure("QuickSort", "sorted", 5000, seed=3, repeat=1)
+        self.assertEqual(record["error"], "RecursionError")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,15 +1,21 @@
 # python3 -m c05_SORT.SortingComparison
 
 import random
-import time
-from copy import deepcopy
+from c05_SORT.AdaptiveMergeSort import AdaptiveMergeSort
+from c05_SORT.BinaryInsertionSort import BinaryInsertionSort
+from c05_SORT.BottomUpMergeSort import BottomUpMergeSort
+from c05_SORT.BoundedCountSort import BoundedCountSort
 from c05_SORT.CountSort import CountSort
 from c05_SORT.InsertionSort import InsertionSort
+from c05_SORT.IntroSort import IntroSort
+from c05_SORT.LSDRadixSort import LSDRadixSort
 from c05_SORT.MergeSort import MergeSort
 from c05_SORT.QuickSort import QuickSort
+from c05_SORT.QuickSort3Way import QuickSort3Way
 from c05_SORT.RadixSort import RadixSort
 from c05_SORT.SelectionSort import SelectionSort
 from c05_SORT.ShellSort import ShellSort
+from c05_SORT.SortBenchmark import summarize, time_trials
 
 
 def create_random_list(n: int, max_value: int = 10000) -> list:
@@ -17,27 +23,37 @@ def create_random_list(n: int, max_value: int = 10000) -> list:
     return [random.randint(0, max_value) for _ in range(n)]
 
 
-def compare_sorting_algorithms(n: int):
-    """Compare sorting algorithms by running them on the same random list of size n and reporting their running times."""
+def compare_sorting_algorithms(n: int, repeat: int = 5):
+    """Compare sorting algorithms by running them on the same random list of size n and reporting their running times.
+
+    Each algorithm is warmed up once and timed on `repeat` fresh copies of
+    the list; the median and its 95% confidence interval are reported.
+    See c05_SORT.SortBenchmark for other input distributions, size sweeps
+    and operation counts.
+    """
     original_list = create_random_list(n)
 
     algorithms = [
         ("CountSort", CountSort),
+        ("BoundedCountSort", BoundedCountSort),
         ("RadixSort", RadixSort),
+        ("LSDRadixSort", LSDRadixSort),
         ("MergeSort", MergeSort),
+        ("BottomUpMergeSort", BottomUpMergeSort),
+        ("AdaptiveMergeSort", AdaptiveMergeSort),
         ("QuickSort", QuickSort),
+        ("IntroSort", IntroSort),
+        ("QuickSort3Way", QuickSort3Way),
         ("ShellSort", ShellSort),
         ("InsertionSort", InsertionSort),
+        ("BinaryInsertionSort", BinaryInsertionSort),
         ("SelectionSort", SelectionSort),
     ]
 
     for name, func in algorithms:
-        data = deepcopy(original_list)
-        start_time = time.perf_counter()
-        sorted_list = func(data)
-        end_time = time.perf_counter()
-        elapsed = end_time - start_time
-        print(f"{name:13s}: {elapsed:.6f} seconds")
+        stats = summarize(time_trials(func, original_list, repeat))
+        print(f"{name:19s}: {stats['median_s']:.6f} seconds "
+              f"(95% CI {stats['ci_low_s']:.6f}..{stats['ci_high_s']:.6f})")
 
 
 def main():